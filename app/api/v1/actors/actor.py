@@ -0,0 +1,75 @@
+import asyncio
+from asyncio import Future, Task
+from collections import deque
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Deque, Tuple
+
+from app.api.v1.metrics import metrics
+
+
+class Actor:
+    def __init__(
+            self,
+            name: str,
+            *,
+            on_idle: Callable[['Actor'], None] | None = None
+    ) -> None:
+        self.name: str = name
+
+        self.__mailbox: Deque[Tuple[Callable[[], Awaitable[Any]], Future, float]] = deque()
+        self.__task: Task | None = None
+        self.__on_idle: Callable[[Actor], None] | None = on_idle
+
+    @property
+    def depth(self) -> int:
+        return len(self.__mailbox)
+
+    def submit(
+            self,
+            job: Callable[[], Awaitable[Any]]
+    ) -> Future:
+        future: Future = asyncio.get_running_loop().create_future()
+
+        self.__mailbox.append((job, future, perf_counter()))
+        metrics.set(f"{self.name}.mailbox_depth", len(self.__mailbox))
+
+        if self.__task is None:
+            self.__task = asyncio.create_task(self.__run(), name=self.name)
+
+        return future
+
+    async def __run(self) -> None:
+        try:
+            while self.__mailbox:
+                job, future, queued = self.__mailbox.popleft()
+                waited: float = perf_counter() - queued
+
+                metrics.set(f"{self.name}.mailbox_depth", len(self.__mailbox))
+                metrics.observe(f"{self.name}.mailbox_wait_seconds", waited)
+                metrics.observe("actors.mailbox_wait_seconds", waited)
+
+                if future.cancelled():
+                    continue
+
+                try:
+                    result: Any = await job()
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                except BaseException as e:
+                    future.cancel()
+                    raise e
+                else:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self.__task = None
+
+            while self.__mailbox:
+                self.__mailbox.popleft()[1].cancel()
+
+            metrics.remove(f"{self.name}.mailbox_depth")
+            metrics.remove(f"{self.name}.mailbox_wait_seconds")
+
+            if self.__on_idle is not None:
+                self.__on_idle(self)
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class Codec(ABC):
+    NAME: str
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, data: str | bytes) -> Any:
+        pass
+
+    def encode_text(self, value: Any) -> str:
+        return self.encode(value).decode()
@@ -0,0 +1,54 @@
+from app.api.v1.codecs.codec import Codec
+from app.api.v1.enums.frame_encoding import FrameEncoding
+from config import Config
+
+config: Config = Config(_env_file=".env")
+
+
+def get_codec(name: str) -> Codec:
+    if name == "auto":
+        for candidate in ("orjson", "msgspec"):
+            try:
+                return get_codec(candidate)
+            except ImportError:
+                continue
+
+        return get_codec("json")
+
+    if name == "orjson":
+        from app.api.v1.codecs.orjson_codec import OrjsonCodec
+        return OrjsonCodec()
+
+    if name == "msgspec":
+        from app.api.v1.codecs.msgspec_codec import MsgspecCodec
+        return MsgspecCodec()
+
+    if name == "json":
+        from app.api.v1.codecs.json_codec import JsonCodec
+        return JsonCodec()
+
+    raise ValueError(f"Unknown codec: {name}")
+
+
+def get_frame_codec(encoding: FrameEncoding) -> Codec:
+    if encoding == FrameEncoding.MSGPACK:
+        from app.api.v1.codecs.msgpack_codec import MsgpackCodec
+        return MsgpackCodec()
+
+    return codec
+
+
+def get_snapshot_codec(
+        name: str,
+        *,
+        compression_threshold: int
+) -> Codec:
+    if name == "binary":
+        from app.assets.snapshots.game_snapshot_codec import GameSnapshotCodec
+        return GameSnapshotCodec(fallback=codec, compression_threshold=compression_threshold)
+
+    return get_codec(name)
+
+
+codec: Codec = get_codec(config.codec)
+binary_codec: Codec = get_frame_codec(FrameEncoding.MSGPACK)
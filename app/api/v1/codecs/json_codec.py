@@ -0,0 +1,17 @@
+import json
+from typing import Any
+
+from app.api.v1.codecs.codec import Codec
+
+
+class JsonCodec(Codec):
+    NAME = "json"
+
+    def encode(self, value: Any) -> bytes:
+        return self.encode_text(value).encode()
+
+    def decode(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def encode_text(self, value: Any) -> str:
+        return json.dumps(value, separators=(",", ":"))
@@ -0,0 +1,61 @@
+from typing import Any, FrozenSet
+from uuid import UUID
+
+import msgpack
+
+from app.api.v1.codecs.codec import Codec
+
+
+class MsgpackCodec(Codec):
+    NAME = "msgpack"
+
+    UUID_KEYS: FrozenSet[str] = frozenset(("id", "game_id", "player_id", "owner_id", "user_id"))
+    UUID_LIST_KEYS: FrozenSet[str] = frozenset(("player_ids",))
+
+    def encode(self, value: Any) -> bytes:
+        return msgpack.packb(self.__pack_uuids(value), use_bin_type=True)
+
+    def decode(self, data: str | bytes) -> Any:
+        try:
+            return self.__unpack_uuids(msgpack.unpackb(data, raw=False))
+        except (msgpack.UnpackException, TypeError, ValueError) as e:
+            raise ValueError(str(e)) from e
+
+    def encode_text(self, value: Any) -> str:
+        raise TypeError("Msgpack frames are binary")
+
+    def __pack_uuids(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {key: self.__pack_uuid(key, item) for key, item in value.items()}
+
+        if isinstance(value, list):
+            return [self.__pack_uuids(item) for item in value]
+
+        return value
+
+    def __pack_uuid(self, key: Any, value: Any) -> Any:
+        if isinstance(value, str) and key in self.UUID_KEYS:
+            return UUID(value).bytes
+
+        if isinstance(value, list) and key in self.UUID_LIST_KEYS:
+            return [UUID(item).bytes if isinstance(item, str) else item for item in value]
+
+        return self.__pack_uuids(value)
+
+    def __unpack_uuids(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {key: self.__unpack_uuid(key, item) for key, item in value.items()}
+
+        if isinstance(value, list):
+            return [self.__unpack_uuids(item) for item in value]
+
+        return value
+
+    def __unpack_uuid(self, key: Any, value: Any) -> Any:
+        if isinstance(value, bytes) and key in self.UUID_KEYS:
+            return str(UUID(bytes=value))
+
+        if isinstance(value, list) and key in self.UUID_LIST_KEYS:
+            return [str(UUID(bytes=item)) if isinstance(item, bytes) else item for item in value]
+
+        return self.__unpack_uuids(value)
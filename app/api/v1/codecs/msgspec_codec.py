@@ -0,0 +1,22 @@
+from typing import Any
+
+import msgspec
+
+from app.api.v1.codecs.codec import Codec
+
+
+class MsgspecCodec(Codec):
+    NAME = "msgspec"
+
+    def __init__(self) -> None:
+        self.__encoder: msgspec.json.Encoder = msgspec.json.Encoder()
+        self.__decoder: msgspec.json.Decoder = msgspec.json.Decoder()
+
+    def encode(self, value: Any) -> bytes:
+        return self.__encoder.encode(value)
+
+    def decode(self, data: str | bytes) -> Any:
+        try:
+            return self.__decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
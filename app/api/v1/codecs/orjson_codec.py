@@ -0,0 +1,15 @@
+from typing import Any
+
+import orjson
+
+from app.api.v1.codecs.codec import Codec
+
+
+class OrjsonCodec(Codec):
+    NAME = "orjson"
+
+    def encode(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def decode(self, data: str | bytes) -> Any:
+        return orjson.loads(data)
@@ -0,0 +1,159 @@
+import asyncio
+from asyncio import CancelledError, Queue, QueueEmpty, QueueFull, Task
+from time import monotonic
+from typing import Any, Callable
+from uuid import UUID
+
+from starlette.datastructures import Address
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from app.api.v1.enums.frame_encoding import FrameEncoding
+from app.api.v1.logging import logger
+from app.api.v1.metrics import metrics
+from app.api.v1.packets.frame import Frame
+from app.assets.objects.user import User
+
+
+class Connection:
+    OVERFLOW_CODE: int = 1008
+
+    def __init__(
+            self,
+            websocket: WebSocket,
+            user: User,
+            *,
+            encoding: FrameEncoding = FrameEncoding.JSON,
+            queue_size: int = 256,
+            resume_token: str | None = None,
+            on_close: Callable[['Connection'], None] | None = None
+    ) -> None:
+        self.websocket: WebSocket = websocket
+        self.user: User = user
+        self.game: Any = None
+        self.encoding: FrameEncoding = encoding
+        self.resume_token: str | None = resume_token
+        self.last_seen: float = monotonic()
+
+        self.__queue: Queue = Queue(maxsize=queue_size)
+        self.__writer_task: Task | None = None
+        self.__closed: bool = False
+        self.__on_close: Callable[[Connection], None] | None = on_close
+
+    @property
+    def user_id(self) -> UUID:
+        return self.user.user_id
+
+    @property
+    def client(self) -> Address | None:
+        return self.websocket.client
+
+    @property
+    def is_closed(self) -> bool:
+        return self.__closed
+
+    def start(self) -> None:
+        self.__writer_task = asyncio.create_task(self.__write())
+
+    def touch(self) -> None:
+        self.last_seen = monotonic()
+
+    def send(
+            self,
+            frame: Frame
+    ) -> None:
+        if self.__closed:
+            return
+
+        try:
+            self.__queue.put_nowait(frame)
+        except QueueFull:
+            metrics.increment("connections.overflows")
+            logger.warning(f"Dropping slow connection of {self.user_id}: send queue is full")
+
+            self.abort(self.OVERFLOW_CODE, "Send queue overflow")
+
+    async def send_now(
+            self,
+            frame: Frame
+    ) -> None:
+        payload: str | bytes = frame.encode(self.encoding)
+
+        if isinstance(payload, bytes):
+            await self.websocket.send_bytes(payload)
+        else:
+            await self.websocket.send_text(payload)
+
+    async def send_final(
+            self,
+            frame: Frame
+    ) -> None:
+        self.stop()
+
+        if self.__writer_task is not None:
+            await asyncio.wait({self.__writer_task})
+
+        await self.send_now(frame)
+
+    async def close(
+            self,
+            code: int = 1000,
+            reason: str | None = None
+    ) -> None:
+        if self.__closed:
+            return
+
+        self.stop()
+        await self.__close_websocket(code, reason)
+
+    def abort(
+            self,
+            code: int,
+            reason: str | None = None
+    ) -> None:
+        if self.__closed:
+            return
+
+        self.stop()
+        asyncio.create_task(self.__close_websocket(code, reason))
+
+    def stop(self) -> None:
+        if self.__writer_task is not None:
+            self.__writer_task.cancel()
+
+        self.__mark_closed()
+
+    def __mark_closed(self) -> None:
+        if self.__closed:
+            return
+
+        self.__closed = True
+
+        while True:
+            try:
+                self.__queue.get_nowait()
+            except QueueEmpty:
+                break
+
+        if self.__on_close is not None:
+            self.__on_close(self)
+
+    async def __close_websocket(
+            self,
+            code: int,
+            reason: str | None
+    ) -> None:
+        try:
+            await self.websocket.close(code, reason)
+        except RuntimeError:
+            pass
+
+    async def __write(self) -> None:
+        try:
+            while True:
+                frame: Frame = await self.__queue.get()
+                await self.send_now(frame)
+                metrics.increment("connections.frames_sent")
+        except CancelledError:
+            pass
+        except (RuntimeError, OSError, WebSocketDisconnect):
+            self.__mark_closed()
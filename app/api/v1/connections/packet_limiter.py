@@ -0,0 +1,70 @@
+from asyncio import Future
+from typing import Dict, Set, Tuple
+
+from app.api.v1.connections.token_bucket import TokenBucket
+from app.api.v1.exceptions.websocket.frame_too_large import FrameTooLargeError
+from app.api.v1.exceptions.websocket.inbound_overflow import InboundOverflowError
+from app.api.v1.exceptions.websocket.rate_limited import RateLimitedError
+from app.api.v1.metrics import metrics
+
+
+class PacketLimiter:
+    def __init__(
+            self,
+            *,
+            rate: float,
+            burst: int,
+            packet_limits: Dict[str, Tuple[float, int]],
+            max_frame_size: int,
+            inbound_queue_size: int
+    ) -> None:
+        self.max_frame_size: int = max_frame_size
+        self.inbound_queue_size: int = inbound_queue_size
+
+        self.__bucket: TokenBucket = TokenBucket(rate, burst)
+        self.__packet_buckets: Dict[str, TokenBucket] = {
+            tag: TokenBucket(packet_rate, packet_burst)
+            for tag, (packet_rate, packet_burst) in packet_limits.items()
+        }
+        self.__pending: Set[Future] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self.__pending)
+
+    def check_frame(
+            self,
+            frame: str | bytes
+    ) -> None:
+        size: int = len(frame.encode()) if isinstance(frame, str) else len(frame)
+
+        if size > self.max_frame_size:
+            metrics.increment("packets.rejected.oversized")
+            raise FrameTooLargeError(f"Frame exceeds {self.max_frame_size} bytes")
+
+        if not self.__bucket.consume():
+            metrics.increment("packets.rejected.rate_limited")
+            raise RateLimitedError("Rate limit exceeded")
+
+    def check_packet(
+            self,
+            tag: str
+    ) -> None:
+        bucket: TokenBucket | None = self.__packet_buckets.get(tag)
+
+        if bucket is not None and not bucket.consume():
+            metrics.increment("packets.rejected.rate_limited")
+            metrics.increment(f"packets.rejected.rate_limited.{tag}")
+            raise RateLimitedError(f"Rate limit exceeded for {tag}")
+
+    def check_pending(self) -> None:
+        if len(self.__pending) >= self.inbound_queue_size:
+            metrics.increment("packets.rejected.overflow")
+            raise InboundOverflowError("Inbound queue overflow")
+
+    def track(
+            self,
+            job: Future
+    ) -> None:
+        self.__pending.add(job)
+        job.add_done_callback(self.__pending.discard)
@@ -0,0 +1,29 @@
+from time import monotonic
+
+
+class TokenBucket:
+    def __init__(
+            self,
+            rate: float,
+            burst: float
+    ) -> None:
+        self.rate: float = rate
+        self.burst: float = burst
+
+        self.__tokens: float = burst
+        self.__updated: float = monotonic()
+
+    def consume(
+            self,
+            tokens: float = 1
+    ) -> bool:
+        now: float = monotonic()
+
+        self.__tokens = min(self.burst, self.__tokens + (now - self.__updated) * self.rate)
+        self.__updated = now
+
+        if self.__tokens < tokens:
+            return False
+
+        self.__tokens -= tokens
+        return True
@@ -1,101 +1,347 @@
-from typing import Dict
-from uuid import UUID
+import asyncio
+from asyncio import Task, CancelledError
+from secrets import token_urlsafe
+from time import monotonic
+from typing import Coroutine, Dict, List, Any, Set, Tuple
+from uuid import UUID, uuid4
 
-from redis.asyncio import Redis
-from starlette.datastructures import Address
 from starlette.requests import Request
 from starlette.websockets import WebSocket
 
+from app.api.v1.connections.connection import Connection
+from app.api.v1.enums.frame_encoding import FrameEncoding
 from app.api.v1.controllers.redis import RedisController
+from app.api.v1.logging import logger
+from app.api.v1.metrics import metrics
+from app.api.v1.packets.frame import Frame
+from app.api.v1.packets.server.ping import ServerPingPacket
+from app.api.v1.storages.storage import Storage
+from app.assets.objects.user import User
 
 
 class ConnectionsController(RedisController):
-    REDIS_KEY = "connections"
+    REDIS_KEY = "index:connections"
+    CHANNEL_KEY = "channels:{channel}"
+    RESUME_KEY = "resumes:{resume_token}"
+    SESSIONS_CHANNEL = "sessions"
+
+    HEARTBEAT_TIMEOUT_CODE: int = 1001
+    RESUMED_CODE: int = 1000
+    RESUME_TOKEN_BYTES: int = 24
 
     def __init__(
             self,
-            redis: Redis
+            storage: Storage,
+            *,
+            send_queue_size: int = 256,
+            heartbeat_interval: float = 15.0,
+            heartbeat_timeout: float = 45.0,
+            resume_timeout: float = 60.0
     ) -> None:
-        super().__init__(redis)
-        self.connections: Dict[UUID, WebSocket] = {}
+        super().__init__(storage)
+        self.connections: Dict[UUID, Connection] = {}
+
+        self.__send_queue_size: int = send_queue_size
+        self.__heartbeat_interval: float = heartbeat_interval
+        self.__heartbeat_timeout: float = heartbeat_timeout
+        self.__resume_timeout: float = resume_timeout
+        self.__lease_timeout: float = heartbeat_timeout + resume_timeout
+
+        self.node_id: str = uuid4().hex
+        self.__listen_task: Task | None = None
+        self.__heartbeat_task: Task | None = None
+        self.__tasks: Set[Task] = set()
+
+    async def start(self) -> None:
+        self.__listen_task = asyncio.create_task(self.__listen())
+        self.__heartbeat_task = asyncio.create_task(self.__heartbeat())
+
+    async def close(self) -> None:
+        if self.__listen_task is not None:
+            self.__listen_task.cancel()
+
+        if self.__heartbeat_task is not None:
+            self.__heartbeat_task.cancel()
 
-    async def prepare(self) -> None:
-        await self.set(self.REDIS_KEY, {})
+        connections: List[Connection] = list(self.connections.values())
+        self.connections.clear()
+
+        for connection in connections:
+            await connection.close()
+
+        await self.__unregister(*connections)
+        await asyncio.gather(*self.__tasks, return_exceptions=True)
 
     async def add_connection(
             self,
             websocket: WebSocket,
+            user: User,
+            *,
+            encoding: FrameEncoding = FrameEncoding.JSON
+    ) -> Connection:
+        connection: Connection = Connection(
+            websocket,
+            user,
+            encoding=encoding,
+            queue_size=self.__send_queue_size,
+            resume_token=token_urlsafe(self.RESUME_TOKEN_BYTES),
+            on_close=self.__on_close
+        )
+        connection.start()
+
+        websocket.state.connection = connection
+        self.connections[user.user_id] = connection
+
+        await self.set_hash_field(self.REDIS_KEY, str(user.user_id), self.node_id)
+        await self.__lease(connection, self.__lease_timeout)
+        return connection
+
+    def get_connection(
+            self,
+            user_id: UUID
+    ) -> Connection | None:
+        return self.connections.get(user_id)
+
+    async def remove_connection(
+            self,
             user_id: UUID
     ) -> None:
-        address: Address | None = websocket.client
+        connection: Connection | None = self.connections.pop(user_id, None)
 
-        if address is None:
+        if connection is None:
             return
 
-        connections: Dict[str, str] | None = await self.get(self.REDIS_KEY)
+        await self.__unregister(connection)
+        await connection.close()
 
-        if connections is None:
-            connections: Dict[str, str] = {}
+    async def release_connection(
+            self,
+            connection: Connection
+    ) -> None:
+        if self.connections.get(connection.user_id) is not connection:
+            return
 
-        connections[self.__address_to_str(address)] = str(user_id)
-        await self.set(self.REDIS_KEY, connections)
+        self.connections.pop(connection.user_id)
 
-        self.connections[user_id] = websocket
+        await self.__unregister(connection)
+        connection.stop()
 
-    def get_connection(
+    async def resume(
             self,
-            user_id: UUID
-    ) -> WebSocket:
-        return self.connections.get(user_id)
+            resume_token: str
+    ) -> Tuple[UUID, bool] | None:
+        session: Dict[str, str] | None = await self.pop(self.RESUME_KEY.format(resume_token=resume_token))
+
+        if session is None:
+            return None
+
+        user_id: UUID = UUID(session["user_id"])
+
+        if session["node_id"] == self.node_id:
+            self.__take_over(user_id, resume_token)
+            return user_id, True
+
+        await self._storage.publish(
+            self._key(self.CHANNEL_KEY.format(channel=self.SESSIONS_CHANNEL)),
+            self._codec.encode({"origin": self.node_id, "user_id": str(user_id), "resume_token": resume_token})
+        )
+
+        return user_id, False
+
+    def reap(self) -> int:
+        deadline: float = monotonic() - self.__heartbeat_timeout
+        heartbeat: Frame = Frame.from_packet(ServerPingPacket(is_heartbeat=True))
+        reaped: int = 0
+
+        for connection in list(self.connections.values()):
+            if connection.last_seen >= deadline:
+                connection.send(heartbeat)
+                continue
 
-    async def get_user_id(
+            logger.info(f"Reaping connection of {connection.user_id}: heartbeat timed out")
+
+            connection.abort(self.HEARTBEAT_TIMEOUT_CODE, "Heartbeat timeout")
+            reaped += 1
+
+        if reaped:
+            metrics.increment("connections.timeouts", reaped)
+
+        metrics.set("connections.active", len(self.connections))
+        return reaped
+
+    async def publish(
             self,
-            websocket: WebSocket
-    ) -> UUID | None:
-        address: Address | None = websocket.client
+            channel: str,
+            recipients: List[UUID],
+            frame: Frame
+    ) -> None:
+        absent: List[str] = []
 
-        if address is None:
-            return
+        for user_id in recipients:
+            connection: Connection | None = self.connections.get(user_id)
+
+            if connection is None:
+                absent.append(str(user_id))
+                continue
 
-        connections: Dict[str, str] | None = await self.get(self.REDIS_KEY)
+            connection.send(frame)
 
-        if connections is None:
+        if not absent:
             return
 
-        if self.__address_to_str(address) in connections:
-            return UUID(connections[self.__address_to_str(address)])
+        nodes: List[bytes | None] = await self._storage.get_hash_fields(self._key(self.REDIS_KEY), absent)
+        remote: List[str] = [
+            user_id for user_id, node_id in zip(absent, nodes)
+            if node_id is not None and node_id.decode() != self.node_id
+        ]
 
-    async def remove_connection(
+        if remote:
+            await self._storage.publish(
+                self._key(self.CHANNEL_KEY.format(channel=channel)),
+                self._codec.encode({
+                    "origin": self.node_id,
+                    "recipients": remote,
+                    "tag": frame.tag,
+                    "data": frame.data,
+                    "sequence": frame.sequence
+                })
+            )
+            metrics.increment("connections.published")
+
+    async def __heartbeat(self) -> None:
+        try:
+            while True:
+                await asyncio.sleep(self.__heartbeat_interval)
+                self.reap()
+
+                try:
+                    await asyncio.gather(*[
+                        self.__renew(connection, self.__lease_timeout)
+                        for connection in list(self.connections.values())
+                    ])
+                except Exception as e:
+                    logger.error(f"Failed to renew resume tokens: {e}")
+        except CancelledError:
+            pass
+
+    async def __lease(
             self,
-            user_id: UUID
+            connection: Connection,
+            ttl: float
     ) -> None:
-        connection: WebSocket | None = self.connections.get(user_id)
+        if connection.resume_token is None:
+            return
 
-        if connection is None:
+        await self.set(
+            self.RESUME_KEY.format(resume_token=connection.resume_token),
+            {"user_id": str(connection.user_id), "node_id": self.node_id},
+            ttl=ttl
+        )
+
+    async def __renew(
+            self,
+            connection: Connection,
+            ttl: float
+    ) -> None:
+        if connection.resume_token is None:
             return
 
-        address: Address | None = connection.client
+        # Only extends a live lease, so a token redeemed on another node is never written back
+        await self.expire(self.RESUME_KEY.format(resume_token=connection.resume_token), ttl)
+
+    def __take_over(
+            self,
+            user_id: UUID,
+            resume_token: str
+    ) -> None:
+        previous: Connection | None = self.connections.get(user_id)
+
+        if previous is not None and previous.resume_token == resume_token:
+            previous.resume_token = None
+            previous.abort(self.RESUMED_CODE, "Session resumed")
+
+    def __on_close(
+            self,
+            connection: Connection
+    ) -> None:
+        if self.connections.get(connection.user_id) is connection:
+            self.connections.pop(connection.user_id)
+            self.__spawn(self.__unregister(connection))
+
+            metrics.increment("connections.reaped")
+
+        if connection.resume_token is not None:
+            self.__spawn(self.__renew(connection, self.__resume_timeout))
+
+        if connection.game is not None:
+            player: Any = connection.game.players.get(connection.user_id)
+
+            if player is not None:
+                player.detach_connection(connection)
+
+            connection.game = None
 
-        if address is not None:
-            connections: Dict[str, str] | None = await self.get(self.REDIS_KEY)
+    def __spawn(
+            self,
+            coroutine: Coroutine
+    ) -> None:
+        task: Task = asyncio.create_task(coroutine)
+
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
 
-            if connections is not None and self.__address_to_str(connection.client) in connections:
-                connections.pop(self.__address_to_str(address))
-            else:
-                connections: Dict[str, str] = {}
+    async def __unregister(
+            self,
+            *connections: Connection
+    ) -> None:
+        user_ids: List[str] = [str(connection.user_id) for connection in connections]
 
-            await self.set(self.REDIS_KEY, connections)
+        if not user_ids:
+            return
+
+        nodes: List[bytes | None] = await self._storage.get_hash_fields(self._key(self.REDIS_KEY), user_ids)
+        owned: List[str] = [
+            user_id for user_id, node_id in zip(user_ids, nodes)
+            if node_id is not None and node_id.decode() == self.node_id and UUID(user_id) not in self.connections
+        ]
+
+        if owned:
+            await self.remove_hash_field(self.REDIS_KEY, *owned)
+
+    async def __listen(self) -> None:
+        channel: str
+        message: bytes
 
         try:
-            await connection.close()
-        except RuntimeError:
+            async for channel, message in self._storage.subscribe(self._key(self.CHANNEL_KEY.format(channel="*"))):
+                try:
+                    self.__deliver(self._codec.decode(message))
+                except Exception as e:
+                    logger.error(f"Failed to deliver frame from {channel}: {e}")
+        except CancelledError:
             pass
 
-        self.connections.pop(user_id)
+    def __deliver(
+            self,
+            data: Dict[str, Any]
+    ) -> None:
+        if data["origin"] == self.node_id:
+            return
 
-    @staticmethod
-    def __address_to_str(address: Address) -> str:
-        return f"{address[0]}:{address[1]}"
+        if "resume_token" in data:
+            self.__take_over(UUID(data["user_id"]), data["resume_token"])
+            return
+
+        frame: Frame = Frame(data["tag"], data["data"], sequence=data.get("sequence"))
+
+        for user_id in data["recipients"]:
+            connection: Connection | None = self.connections.get(UUID(user_id))
+
+            if connection is None:
+                continue
+
+            connection.send(frame)
+            metrics.increment("connections.delivered")
 
     @staticmethod
     async def dependency(request: Request) -> 'ConnectionsController':
@@ -104,3 +350,7 @@ class ConnectionsController(RedisController):
     @staticmethod
     async def websocket_dependency(websocket: WebSocket) -> 'ConnectionsController':
         return websocket.app.state.connections
+
+    @staticmethod
+    async def connection_dependency(websocket: WebSocket) -> Connection | None:
+        return getattr(websocket.state, "connection", None)
@@ -1,30 +1,101 @@
 import asyncio
-from typing import Dict, Any, Tuple
+from asyncio import Future, Task, CancelledError
+from collections import OrderedDict
+from functools import partial
+from time import perf_counter
+from typing import Dict, Any, AsyncIterator, Awaitable, Callable, List, Tuple
 from uuid import UUID, uuid4
 
-from redis import Redis
-
+from app.api.v1.actors.actor import Actor
+from app.api.v1.codecs.codec import Codec
 from app.api.v1.controllers.connections import ConnectionsController
 from app.api.v1.controllers.redis import RedisController
+from app.api.v1.enums.durability import Durability
+from app.api.v1.enums.transfer_status import TransferStatus
+from app.api.v1.logging import logger
+from app.api.v1.metrics import metrics
+from app.api.v1.connections.connection import Connection
+from app.api.v1.packets.base_server import ServerPacket
+from app.api.v1.packets.frame import Frame
+from app.api.v1.packets.server.game_sync import ServerGameSyncPacket
+from app.api.v1.storages.storage import Storage
+from app.assets.objects.fields.company import Company
 from app.assets.objects.game import Game
+from app.assets.objects.player import Player
 
 
 class GamesController(RedisController):
     REDIS_KEY = "games:{game_id}"
+    INDEX_KEY = "index:games"
+    CHANNEL_KEY = "games:{game_id}"
+    INVALIDATIONS_KEY = "invalidations:games"
+    REVISION_ENTRY = "revision"
 
     def __init__(
             self,
-            redis: Redis
+            storage: Storage,
+            *,
+            value_codec: Codec | None = None,
+            connections: ConnectionsController | None = None,
+            durability: Durability = Durability.ACTION,
+            write_behind_delay: float = 0.005,
+            write_behind_interval: float = 1.0,
+            cache_size: int = 1024
     ) -> None:
-        super().__init__(redis)
-        self.games: Dict[UUID, Game] = {}
+        super().__init__(storage, value_codec=value_codec)
+
+        self.__connections: ConnectionsController | None = connections
+
+        self.__durability: Durability = durability
+        self.__write_behind_delay: float = write_behind_delay
+        self.__write_behind_interval: float = write_behind_interval
+
+        self.__pending: Dict[UUID, Game] = {}
+        self.__flush_future: Future | None = None
+        self.__commit_task: Task | None = None
+        self.__flush_task: Task | None = None
+        self.__flush_lock: asyncio.Lock = asyncio.Lock()
+
+        self.__node_id: str = uuid4().hex
+        self.__cache_size: int = cache_size
+        self.__cache: OrderedDict[UUID, Tuple[str | None, Game]] = OrderedDict()
+        self.__invalidations_task: Task | None = None
+
+        self.__actors: Dict[UUID, Actor] = {}
+
+    async def prepare(self) -> None:
+        if await self.get_hash_field(self.MIGRATIONS_KEY, "games:index") is None:
+            if not await self.exists(self.INDEX_KEY):
+                await self.rebuild_index(self.INDEX_KEY, pattern="games:*")
+
+            await self.set_hash_field(self.MIGRATIONS_KEY, "games:index", "1")
+
+        await self.migrate_games()
+
+    async def start(self) -> None:
+        self.__invalidations_task = asyncio.create_task(self.__listen_invalidations())
+
+        if self.__durability != Durability.ACTION:
+            self.__flush_task = asyncio.create_task(self.__flush_periodically())
+
+    async def close(self) -> None:
+        for task in (self.__flush_task, self.__commit_task, self.__invalidations_task):
+            if task is not None:
+                task.cancel()
+
+        await self.flush()
+
+    @property
+    def games(self) -> Dict[UUID, Game]:
+        return {game_id: game for game_id, (_, game) in self.__cache.items()}
 
     async def create_game(self) -> Game:
         game = Game(uuid4())
         game.controller = self
 
-        self.games[game.game_id] = game
-        await game.save()
+        self.__cache_game(game, None)
+        await self.save_game(game, force=True)
+        await self.add_to_index(self.INDEX_KEY, str(game.game_id))
 
         return game
 
@@ -33,44 +104,436 @@ class GamesController(RedisController):
             game_id: UUID,
             connections: ConnectionsController
     ) -> Game | None:
-        game: Game | None = self.games.get(game_id)
+        game: Game | None = await self.__get_cached_game(game_id)
 
         if game is None:
-            game: Dict[str, Any] | None = await self.get(self.REDIS_KEY.format(game_id=game_id))
-            if game is None:
+            entries: Dict[str, Any] = await self.get_hash(self.REDIS_KEY.format(game_id=game_id))
+            if not entries:
                 return
-            game: Game = Game.from_json(game, connections=connections)
+            game: Game = Game.from_entries(entries, connections=connections)
+            self.__cache_game(game, entries.get(self.REVISION_ENTRY))
 
         game.controller = self
         return game
 
+    def is_current(
+            self,
+            game: Game
+    ) -> bool:
+        cached: Tuple[str | None, Game] | None = self.__cache.get(game.game_id)
+        return cached is not None and cached[1] is game
+
     async def get_games(
             self,
-            connections: ConnectionsController
-    ) -> Tuple[Game]:
-        game_uuids: Tuple[str, ...] = await self.get_keys(pattern="games")
+            connections: ConnectionsController,
+            *,
+            chunk_size: int | None = None
+    ) -> AsyncIterator[Game]:
+        async for game, _ in self.__get_games(connections, chunk_size=chunk_size):
+            yield game
+
+    async def save_game(
+            self,
+            game: Game,
+            *,
+            force: bool = False
+    ) -> None:
+        self.__pending[game.game_id] = game
+
+        if not force:
+            if self.__durability == Durability.PERIODIC:
+                return
+            if self.__durability == Durability.TURN and not game.is_turn_over:
+                return
+
+        if self.__flush_future is None:
+            self.__flush_future = asyncio.get_running_loop().create_future()
+
+        if self.__commit_task is None:
+            self.__commit_task = asyncio.create_task(self.__commit())
+
+        await asyncio.shield(self.__flush_future)
+
+    async def flush(self) -> None:
+        async with self.__flush_lock:
+            await self.__flush()
+
+    async def __flush(self) -> None:
+        pending: Dict[UUID, Game] = self.__pending
+        future: Future | None = self.__flush_future
+
+        self.__pending = {}
+        self.__flush_future = None
+
+        try:
+            updates: Dict[str, Tuple[Dict[str, Any], List[str]]] = {}
+
+            revisions: Dict[UUID, str] = {}
+
+            for game in pending.values():
+                entries, removed = game.pop_changes()
+
+                if entries or removed:
+                    revisions[game.game_id] = entries[self.REVISION_ENTRY] = uuid4().hex
+                    updates[self.REDIS_KEY.format(game_id=game.game_id)] = (entries, removed)
+
+            if updates:
+                written: Dict[str, int] = await self.update_hashes(updates)
+
+                for game_id, revision in revisions.items():
+                    if game_id in self.__cache:
+                        self.__cache[game_id] = (revision, self.__cache[game_id][1])
+
+                await self._storage.publish(
+                    self._key(self.INVALIDATIONS_KEY),
+                    self._codec.encode({"origin": self.__node_id, "game_ids": [str(game_id) for game_id in revisions]})
+                )
+
+                metrics.increment("games.flushes")
+                metrics.increment("games.saves", len(written))
+                metrics.observe("games.flush_size", len(written))
+
+                for amount in written.values():
+                    metrics.observe("games.save_bytes", amount)
+        except BaseException as e:
+            for game in pending.values():
+                game.mark_unsaved()
+                self.__pending.setdefault(game.game_id, game)
+
+            if future is not None and not future.done():
+                future.set_exception(e)
+
+            raise e
+
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    def execute(
+            self,
+            game_id: UUID,
+            job: Callable[[], Awaitable[Any]]
+    ) -> Future:
+        actor: Actor | None = self.__actors.get(game_id)
+
+        if actor is None:
+            actor = self.__actors[game_id] = Actor(
+                f"games.{game_id}",
+                on_idle=partial(self.__remove_actor, game_id)
+            )
+
+        return actor.submit(job)
+
+    async def broadcast(
+            self,
+            game: Game,
+            packet: ServerPacket,
+            *,
+            recipients: List[UUID] | None = None
+    ) -> None:
+        recipients: List[UUID] = recipients if recipients is not None else game.players.ids
+        sequence: int = game.advance(force=True)
+
+        if not game.is_sequence_reserved:
+            await self.save_game(game, force=True)
+
+        frame: Frame = Frame.from_packet(packet, sequence=sequence)
+
+        for player_id in recipients:
+            game.record(player_id, frame)
+
+        if self.__connections is not None:
+            await self.__connections.publish(self.CHANNEL_KEY.format(game_id=game.game_id), recipients, frame)
+            return
+
+        for player_id in recipients:
+            player: Player | None = game.players.get(player_id)
+
+            if player is not None and player.connection is not None:
+                player.connection.send(frame)
+
+    async def resume(
+            self,
+            connection: Connection,
+            game_id: UUID,
+            sequence: int,
+            *,
+            replay: bool = True
+    ) -> bool:
+        game: Game | None = await self.get_game(game_id, self.__connections)
+
+        if game is None or not game.players.exists(connection.user_id):
+            return False
+
+        return await self.execute(game_id, lambda: self.__resume(game, connection, sequence, replay))
+
+    async def __resume(
+            self,
+            game: Game,
+            connection: Connection,
+            sequence: int,
+            replay: bool
+    ) -> bool:
+        player: Player | None = game.players.get(connection.user_id)
 
-        games: Tuple[Any] = await asyncio.gather(
-            *[self.get_game(UUID(game.split(":")[-1]), connections) for game in game_uuids]
+        if player is None or connection.is_closed:
+            return False
+
+        player.connection = connection
+        connection.game = game
+
+        frames: List[Frame] | None = game.get_replay(player.player_id, sequence) if replay else None
+
+        if frames is None:
+            is_full, entries, removed = game.get_delta(sequence) if replay else (True, game.to_entries(), [])
+            frames = [Frame.from_packet(
+                ServerGameSyncPacket(game.game_id, game.sequence, is_full, entries, removed),
+                sequence=game.sequence
+            )]
+            metrics.increment("sessions.resync")
+
+        for frame in frames:
+            connection.send(frame)
+
+        metrics.increment("sessions.resumed")
+        metrics.observe("sessions.replayed_frames", len(frames))
+        return True
+
+    async def transfer(
+            self,
+            game: Game,
+            *,
+            payer: Player | None = None,
+            payee: Player | None = None,
+            amount: int = 0,
+            field: Company | None = None
+    ) -> Tuple[TransferStatus, int, int, int]:
+        status, version, payer_balance, payee_balance = await self._storage.transfer(
+            self._key(self.REDIS_KEY.format(game_id=game.game_id)),
+            version=game.ledger_version,
+            payer=str(payer.player_id) if payer is not None else None,
+            payer_balance=payer.balance if payer is not None else 0,
+            payee=str(payee.player_id) if payee is not None else None,
+            payee_balance=payee.balance if payee is not None else 0,
+            amount=amount,
+            field=field.field_id if field is not None else None,
+            owner=str(payer.player_id) if field is not None else None
         )
 
-        return tuple(filter(lambda game: isinstance(game, Game), games))
+        metrics.increment(f"games.transfers.{TransferStatus(status).name.lower()}")
+        return TransferStatus(status), version, payer_balance, payee_balance
+
+    async def refresh_ledger(
+            self,
+            game: Game
+    ) -> None:
+        game.apply_ledger(await self.get_hash(self.REDIS_KEY.format(game_id=game.game_id)))
 
     async def exists_game(
             self,
             game_id: UUID
     ) -> bool:
-        return self.games.get(game_id) or await self.exists(self.REDIS_KEY.format(game_id=game_id))
+        return game_id in self.__cache or await self.exists(self.REDIS_KEY.format(game_id=game_id))
 
     async def remove_game(
             self,
             game_id: UUID
     ) -> None:
-        self.games.pop(game_id, None)
+        self.__cache.pop(game_id, None)
+        self.__pending.pop(game_id, None)
         await self.remove(self.REDIS_KEY.format(game_id=game_id))
+        await self.remove_from_index(self.INDEX_KEY, str(game_id))
 
     async def retrieve_games(
             self,
-            connections: ConnectionsController
+            connections: ConnectionsController,
+            *,
+            chunk_size: int | None = None
+    ) -> None:
+        started: float = perf_counter()
+
+        async for game, revision in self.__get_games(connections, chunk_size=chunk_size):
+            self.__cache_game(game, revision)
+
+        self._log_hydration("games", len(self.__cache), started)
+
+    async def migrate_games(self) -> None:
+        if await self.get_hash_field(self.MIGRATIONS_KEY, "games:hash") is not None:
+            return
+
+        amount: int = 0
+
+        async for game_id in self.get_index(self.INDEX_KEY):
+            key: str = self.REDIS_KEY.format(game_id=game_id)
+
+            if await self.get_type(key) != "string":
+                continue
+
+            game: Game = Game.from_json(await self.get(key))
+            entries, removed = game.pop_changes()
+
+            await self.update_hash(key, entries, removed, replace=True)
+            amount += 1
+
+        await self.set_hash_field(self.MIGRATIONS_KEY, "games:hash", "1")
+        logger.info(f"Migrated {amount} game snapshots to the hash layout")
+
+    async def migrate_snapshots(self) -> None:
+        migration: str = f"games:snapshot:{self._codec.NAME}:{getattr(self._codec, 'VERSION', 0)}"
+
+        if await self.get_hash_field(self.MIGRATIONS_KEY, migration) is not None:
+            return
+
+        amount: int = 0
+        chunk: List[Dict[str, Any] | None]
+
+        async for chunk in self.get_index_values(
+                self.INDEX_KEY,
+                lambda game_id: self.REDIS_KEY.format(game_id=game_id),
+                as_hash=True
+        ):
+            for entries in chunk:
+                if entries is None:
+                    continue
+
+                game_id: str = entries[Game.GAME_ENTRY]["game_id"]
+                await self.update_hash(
+                    self.REDIS_KEY.format(game_id=game_id),
+                    {entry: value for entry, value in entries.items() if not Game.is_ledger_entry(entry)}
+                )
+                amount += 1
+
+        await self.set_hash_field(self.MIGRATIONS_KEY, migration, "1")
+        logger.info(f"Migrated {amount} game snapshots to the {self._codec.NAME} format")
+
+    async def __get_games(
+            self,
+            connections: ConnectionsController,
+            *,
+            chunk_size: int | None = None
+    ) -> AsyncIterator[Tuple[Game, str | None]]:
+        chunk: List[Dict[str, Any] | None]
+
+        async for chunk in self.get_index_values(
+                self.INDEX_KEY,
+                lambda game_id: self.REDIS_KEY.format(game_id=game_id),
+                chunk_size=chunk_size,
+                as_hash=True
+        ):
+            for entries in chunk:
+                if entries is None:
+                    continue
+
+                game: Game = Game.from_entries(entries, connections=connections)
+                game.controller = self
+
+                yield game, entries.get(self.REVISION_ENTRY)
+
+    async def __get_cached_game(
+            self,
+            game_id: UUID
+    ) -> Game | None:
+        cached: Tuple[str | None, Game] | None = self.__cache.get(game_id)
+
+        if cached is None:
+            metrics.increment("games.cache.misses")
+            return
+
+        revision, version = await self._storage.get_hash_fields(
+            self._key(self.REDIS_KEY.format(game_id=game_id)),
+            [self.REVISION_ENTRY, Game.VERSION_ENTRY]
+        )
+
+        game: Game = cached[1]
+        revision: str | None = self._codec.decode(revision) if revision is not None else None
+        version: int = self._codec.decode(version) if version is not None else 0
+
+        if revision != cached[0] or version != game.ledger_version:
+            self.__cache.pop(game_id, None)
+            metrics.increment("games.cache.stale")
+            return
+
+        self.__cache.move_to_end(game_id)
+        metrics.increment("games.cache.hits")
+
+        return game
+
+    def __cache_game(
+            self,
+            game: Game,
+            revision: str | None
+    ) -> None:
+        if self.__cache_size <= 0:
+            return
+
+        self.__cache[game.game_id] = (revision, game)
+        self.__cache.move_to_end(game.game_id)
+
+        if len(self.__cache) <= self.__cache_size:
+            return
+
+        # Games with unflushed changes stay cached, so a reload cannot drop them
+        for game_id in [game_id for game_id in self.__cache if game_id not in self.__pending]:
+            if len(self.__cache) <= self.__cache_size:
+                break
+
+            self.__cache.pop(game_id)
+
+    async def __listen_invalidations(self) -> None:
+        message: bytes
+
+        try:
+            async for _, message in self._storage.subscribe(self._key(self.INVALIDATIONS_KEY)):
+                try:
+                    data: Dict[str, Any] = self._codec.decode(message)
+                except ValueError as e:
+                    logger.error(f"Failed to decode game invalidation: {e}")
+                    continue
+
+                if data["origin"] == self.__node_id:
+                    continue
+
+                for game_id in data["game_ids"]:
+                    if self.__cache.pop(UUID(game_id), None) is not None:
+                        metrics.increment("games.cache.invalidations")
+        except CancelledError:
+            pass
+
+    def __remove_actor(
+            self,
+            game_id: UUID,
+            actor: Actor
     ) -> None:
-        self.games.update({game.game_id: game for game in await self.get_games(connections)})
+        if self.__actors.get(game_id) is actor:
+            self.__actors.pop(game_id)
+
+    async def __commit(self) -> None:
+        is_retry: bool = False
+
+        try:
+            if self.__durability != Durability.ACTION:
+                await asyncio.sleep(self.__write_behind_delay)
+
+            while self.__flush_future is not None or is_retry:
+                try:
+                    await asyncio.shield(self.flush())
+                    is_retry = False
+                except Exception as e:
+                    logger.error(f"Failed to flush pending games: {e}")
+                    metrics.increment("games.flush_retries")
+
+                    is_retry = True
+                    await asyncio.sleep(self.__write_behind_interval)
+        except CancelledError:
+            pass
+        finally:
+            self.__commit_task = None
+
+    async def __flush_periodically(self) -> None:
+        while True:
+            try:
+                await asyncio.sleep(self.__write_behind_interval)
+                await asyncio.shield(self.flush())
+            except CancelledError:
+                return
+            except Exception as e:
+                logger.error(f"Failed to flush pending games: {e}")
@@ -1,26 +1,39 @@
-import json
-from typing import Any, Tuple
+import asyncio
+from asyncio import Task
+from time import perf_counter
+from typing import Any, AsyncIterator, List, Callable, Dict, Tuple
 
-from redis import Redis
+from app.api.v1.codecs.codec import Codec
+from app.api.v1.codecs.codecs import codec
+from app.api.v1.logging import logger
+from app.api.v1.storages.storage import Storage
 
 
 class RedisController:
     REDIS_KEY: str
+    MIGRATIONS_KEY: str = "migrations"
+
+    SCAN_COUNT: int = 1000
+    CHUNK_SIZE: int = 500
 
     def __init__(
             self,
-            redis: Redis
+            storage: Storage,
+            *,
+            value_codec: Codec | None = None
     ) -> None:
-        self._redis: Redis = redis
+        self._storage: Storage = storage
+        self._codec: Codec = value_codec or codec
 
     async def set(
             self,
             key: str,
             value: Any,
             *,
+            ttl: float | None = None,
             exact_key: bool = False
     ) -> None:
-        await self._redis.set(key if exact_key else f"monopoly:{key}", json.dumps(value))
+        await self._storage.set(self._key(key, exact_key=exact_key), self._codec.encode(value), ttl=ttl)
 
     async def get(
             self,
@@ -28,17 +41,46 @@ class RedisController:
             *,
             exact_key: bool = False
     ) -> Any:
-        serialized: str = await self._redis.get(key if exact_key else f"monopoly:{key}")
-        return json.loads(serialized) if serialized is not None else None
+        serialized: bytes | None = await self._storage.get(self._key(key, exact_key=exact_key))
+        return self._codec.decode(serialized) if serialized is not None else None
+
+    async def pop(
+            self,
+            key: str,
+            *,
+            exact_key: bool = False
+    ) -> Any:
+        serialized: bytes | None = await self._storage.pop(self._key(key, exact_key=exact_key))
+        return self._codec.decode(serialized) if serialized is not None else None
+
+    async def get_many(
+            self,
+            keys: List[str],
+            *,
+            exact_key: bool = False
+    ) -> List[Any]:
+        if not keys:
+            return []
+
+        return self.__decode_many(await self._storage.get_many([self._key(key, exact_key=exact_key) for key in keys]))
 
     async def get_keys(
             self,
             *,
             pattern: str = "",
             exact_pattern: bool = False
-    ) -> Tuple[str, ...]:
-        keys: Tuple[bytes, ...] = await self._redis.keys(f"*{pattern}*" if exact_pattern else f"*monopoly:{pattern}*")
-        return tuple([key.decode() for key in keys])
+    ) -> AsyncIterator[str]:
+        async for key in self._storage.scan(self._key(pattern, exact_key=exact_pattern), count=self.SCAN_COUNT):
+            yield key
+
+    async def expire(
+            self,
+            key: str,
+            ttl: float,
+            *,
+            exact_key: bool = False
+    ) -> bool:
+        return await self._storage.expire(self._key(key, exact_key=exact_key), ttl)
 
     async def exists(
             self,
@@ -46,7 +88,7 @@ class RedisController:
             *,
             exact_key: bool = False
     ) -> bool:
-        return bool(await self._redis.exists(key if exact_key else f"monopoly:{key}"))
+        return await self._storage.exists(self._key(key, exact_key=exact_key))
 
     async def remove(
             self,
@@ -54,4 +96,198 @@ class RedisController:
             *,
             exact_key: bool = False
     ) -> None:
-        await self._redis.delete(key if exact_key else f"monopoly:{key}")
+        await self._storage.remove(self._key(key, exact_key=exact_key))
+
+    async def get_hash(
+            self,
+            key: str,
+            *,
+            exact_key: bool = False
+    ) -> Dict[str, Any]:
+        return self.__decode_hash(await self._storage.get_hash(self._key(key, exact_key=exact_key)))
+
+    async def update_hash(
+            self,
+            key: str,
+            entries: Dict[str, Any],
+            removed: List[str] | None = None,
+            *,
+            replace: bool = False,
+            exact_key: bool = False
+    ) -> int:
+        key: str = self._key(key, exact_key=exact_key)
+        serialized: Dict[str, bytes] = {entry: self._codec.encode(value) for entry, value in entries.items()}
+
+        await self._storage.update_hashes({key: (serialized, removed or [])}, replace=replace)
+
+        return sum(len(entry) + len(value) for entry, value in serialized.items())
+
+    async def update_hashes(
+            self,
+            updates: Dict[str, Tuple[Dict[str, Any], List[str]]]
+    ) -> Dict[str, int]:
+        written: Dict[str, int] = {}
+        serialized: Dict[str, Tuple[Dict[str, bytes], List[str]]] = {}
+
+        for key, (entries, removed) in updates.items():
+            fields: Dict[str, bytes] = {entry: self._codec.encode(value) for entry, value in entries.items()}
+
+            serialized[self._key(key)] = (fields, removed)
+            written[key] = sum(len(entry) + len(value) for entry, value in fields.items())
+
+        await self._storage.update_hashes(serialized)
+
+        return written
+
+    async def get_type(
+            self,
+            key: str,
+            *,
+            exact_key: bool = False
+    ) -> str:
+        return await self._storage.get_type(self._key(key, exact_key=exact_key))
+
+    async def set_hash_field(
+            self,
+            key: str,
+            field: str,
+            value: str,
+            *,
+            only_new: bool = False
+    ) -> bool:
+        return await self._storage.set_hash_field(self._key(key), field, value.encode(), only_new=only_new)
+
+    async def get_hash_field(
+            self,
+            key: str,
+            field: str
+    ) -> str | None:
+        value: bytes | None = await self._storage.get_hash_field(self._key(key), field)
+        return value.decode() if value is not None else None
+
+    async def remove_hash_field(
+            self,
+            key: str,
+            *fields: str
+    ) -> None:
+        await self._storage.remove_hash_fields(self._key(key), *fields)
+
+    async def add_to_index(
+            self,
+            index: str,
+            *members: str
+    ) -> None:
+        await self._storage.add_to_set(self._key(index), *members)
+
+    async def remove_from_index(
+            self,
+            index: str,
+            *members: str
+    ) -> None:
+        await self._storage.remove_from_set(self._key(index), *members)
+
+    async def get_index(
+            self,
+            index: str
+    ) -> AsyncIterator[str]:
+        async for member in self._storage.scan_set(self._key(index), count=self.SCAN_COUNT):
+            yield member
+
+    async def get_index_values(
+            self,
+            index: str,
+            key: Callable[[str], str],
+            *,
+            chunk_size: int | None = None,
+            as_hash: bool = False
+    ) -> AsyncIterator[List[Any]]:
+        fetch: Callable = self._storage.get_hashes if as_hash else self._storage.get_many
+        decode: Callable = self.__decode_hashes if as_hash else self.__decode_many
+        pending: Task | None = None
+
+        try:
+            async for members in self.__get_index_chunks(index, chunk_size or self.CHUNK_SIZE):
+                task: Task = asyncio.create_task(fetch([self._key(key(member)) for member in members]))
+
+                if pending is not None:
+                    yield decode(await pending)
+
+                pending = task
+
+            if pending is not None:
+                yield decode(await pending)
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+    async def rebuild_index(
+            self,
+            index: str,
+            *,
+            pattern: str
+    ) -> None:
+        members: List[str] = []
+
+        async for key in self.get_keys(pattern=pattern):
+            members.append(key.split(":")[-1])
+
+            if len(members) >= self.SCAN_COUNT:
+                await self.add_to_index(index, *members)
+                members.clear()
+
+        if members:
+            await self.add_to_index(index, *members)
+
+    @staticmethod
+    def _log_hydration(
+            name: str,
+            amount: int,
+            started: float
+    ) -> None:
+        elapsed: float = perf_counter() - started
+        rate: float = amount / elapsed if elapsed > 0 else 0
+
+        logger.info(f"Hydrated {amount} {name} in {elapsed:.3f}s ({rate:.0f} keys/sec)")
+
+    async def __get_index_chunks(
+            self,
+            index: str,
+            chunk_size: int
+    ) -> AsyncIterator[List[str]]:
+        members: List[str] = []
+
+        async for member in self.get_index(index):
+            members.append(member)
+
+            if len(members) >= chunk_size:
+                yield members
+                members = []
+
+        if members:
+            yield members
+
+    def __decode_hashes(
+            self,
+            serialized: List[Dict[str, bytes]]
+    ) -> List[Dict[str, Any] | None]:
+        return [self.__decode_hash(entries) if entries else None for entries in serialized]
+
+    def __decode_hash(
+            self,
+            serialized: Dict[str, bytes]
+    ) -> Dict[str, Any]:
+        return {entry: self._codec.decode(value) for entry, value in serialized.items()}
+
+    def __decode_many(
+            self,
+            serialized: List[bytes | None]
+    ) -> List[Any]:
+        return [self._codec.decode(value) if value is not None else None for value in serialized]
+
+    @staticmethod
+    def _key(
+            key: str,
+            *,
+            exact_key: bool = False
+    ) -> str:
+        return key if exact_key else f"monopoly:{key}"
@@ -1,33 +1,64 @@
 import asyncio
-from typing import Dict, Any, Tuple
+from time import perf_counter
+from typing import Dict, Any, AsyncIterator, List
 from uuid import UUID, uuid4
 
-from redis import Redis
-
 from app.api.v1.controllers.redis import RedisController
+from app.api.v1.logging import logger
+from app.api.v1.storages.storage import Storage
 from app.assets.objects.user import User
 
 
 class UsersController(RedisController):
     REDIS_KEY: str = "users:{user_id}"
+    INDEX_KEY: str = "index:users"
+    USERNAMES_KEY: str = "index:usernames"
 
     def __init__(
             self,
-            redis: Redis
+            storage: Storage
     ) -> None:
-        super().__init__(redis)
+        super().__init__(storage)
         self.users: Dict[UUID, User] = {}
+        self.usernames: Dict[str, UUID] = {}
+
+    async def prepare(self) -> None:
+        # Empty indexes are never stored, so completed rebuilds are recorded as migrations
+        if await self.get_hash_field(self.MIGRATIONS_KEY, "users:index") is None:
+            if not await self.exists(self.INDEX_KEY):
+                await self.rebuild_index(self.INDEX_KEY, pattern="users:*")
+
+            await self.set_hash_field(self.MIGRATIONS_KEY, "users:index", "1")
+
+        if await self.get_hash_field(self.MIGRATIONS_KEY, "users:usernames") is None:
+            if not await self.exists(self.USERNAMES_KEY):
+                await self.backfill_usernames()
+
+            await self.set_hash_field(self.MIGRATIONS_KEY, "users:usernames", "1")
 
     async def create_user(
             self,
             *,
             username: str
-    ) -> User:
+    ) -> User | None:
         user = User(uuid4(), username)
-        user.controller = self
 
-        self.users[user.user_id] = user
-        await user.save()
+        if not await self.set_hash_field(self.USERNAMES_KEY, username, str(user.user_id), only_new=True):
+            return
+
+        try:
+            await self._storage.set(
+                self._key(self.REDIS_KEY.format(user_id=user.user_id)),
+                self._codec.encode(user.to_json()),
+                index=self._key(self.INDEX_KEY),
+                member=str(user.user_id)
+            )
+        except BaseException as e:
+            await asyncio.shield(self.remove_hash_field(self.USERNAMES_KEY, username))
+            raise e
+
+        user.controller = self
+        self.__cache(user)
 
         return user
 
@@ -42,40 +73,92 @@ class UsersController(RedisController):
             if user is None:
                 return
             user: User = User.from_json(user)
-            self.users[user.user_id] = user
+            self.__cache(user)
 
         user.controller = self
         return user
 
-    async def get_users(self) -> Tuple[User]:
-        user_uuids: Tuple[str, ...] = await self.get_keys(pattern="users")
-
-        users: Tuple[Any] = await asyncio.gather(
-            *[self.get_user(UUID(user.split(":")[-1])) for user in user_uuids]
-        )
+    async def get_users(
+            self,
+            *,
+            chunk_size: int | None = None
+    ) -> AsyncIterator[User]:
+        chunk: List[Dict[str, Any] | None]
+
+        async for chunk in self.get_index_values(
+                self.INDEX_KEY,
+                lambda user_id: self.REDIS_KEY.format(user_id=user_id),
+                chunk_size=chunk_size
+        ):
+            for data in chunk:
+                if data is None:
+                    continue
+
+                user: User = User.from_json(data)
+                user.controller = self
 
-        return tuple(filter(lambda user: isinstance(user, User), users))
+                yield user
 
     async def get_user_by_username(
             self,
             username: str
     ) -> User | None:
-        user: User | None = [user for user in self.users.values() if user.username == username][0]
+        user_id: UUID | None = self.usernames.get(username)
 
-        if user is not None:
-            return user
+        if user_id is None:
+            user_id: str | None = await self.get_hash_field(self.USERNAMES_KEY, username)
 
-        users: Tuple[str, ...] = await self.get_keys(pattern="users")
+            if user_id is None:
+                return
 
-        for user_key in users:
-            user: Dict[str, Any] = await self.get(user_key, exact_key=True)
+            user_id: UUID = UUID(user_id)
 
-            if user is not None and user.get("username") == username:
-                user: User = User.from_json(user)
-                self.users[user.user_id] = user
+        return await self.get_user(user_id)
 
-                user.controller = self
-                return user
+    async def backfill_usernames(self) -> None:
+        keys: List[str] = []
+        amount: int = 0
 
-    async def retrieve_users(self) -> None:
-        self.users.update({user.user_id: user for user in await self.get_users()})
+        async for key in self.get_keys(pattern="users:*"):
+            keys.append(key)
+
+            if len(keys) >= self.SCAN_COUNT:
+                amount += await self.__backfill_usernames(keys)
+                keys.clear()
+
+        if keys:
+            amount += await self.__backfill_usernames(keys)
+
+        logger.info(f"Backfilled {amount} usernames into the username index")
+
+    async def retrieve_users(
+            self,
+            *,
+            chunk_size: int | None = None
+    ) -> None:
+        started: float = perf_counter()
+
+        async for user in self.get_users(chunk_size=chunk_size):
+            self.__cache(user)
+
+        self._log_hydration("users", len(self.users), started)
+
+    async def __backfill_usernames(
+            self,
+            keys: List[str]
+    ) -> int:
+        users: List[Dict[str, Any] | None] = await self.get_many(keys, exact_key=True)
+        usernames: Dict[str, bytes] = {}
+
+        for user in users:
+            if user is not None and "username" in user and "user_id" in user:
+                usernames.setdefault(user["username"], user["user_id"].encode())
+
+        return await self._storage.set_hash_fields(self._key(self.USERNAMES_KEY), usernames, only_new=True)
+
+    def __cache(
+            self,
+            user: User
+    ) -> None:
+        self.users[user.user_id] = user
+        self.usernames[user.username] = user.user_id
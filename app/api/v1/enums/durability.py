@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class Durability(StrEnum):
+    ACTION = "action"
+    TURN = "turn"
+    PERIODIC = "periodic"
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class FrameEncoding(StrEnum):
+    JSON = "json"
+    MSGPACK = "msgpack"
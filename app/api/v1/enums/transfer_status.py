@@ -0,0 +1,8 @@
+from enum import IntEnum
+
+
+class TransferStatus(IntEnum):
+    OK = 0
+    CONFLICT = 1
+    NOT_ENOUGH_BALANCE = 2
+    FIELD_ALREADY_OWNED = 3
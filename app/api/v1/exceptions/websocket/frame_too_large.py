@@ -0,0 +1,9 @@
+from starlette import status
+
+from app.api.v1.exceptions.websocket import websocket_status
+from app.api.v1.exceptions.websocket.websocket_error import WebSocketError
+
+
+class FrameTooLargeError(WebSocketError):
+    status_code = websocket_status.WS_4009_FRAME_TOO_LARGE
+    close_code = status.WS_1009_MESSAGE_TOO_BIG
@@ -0,0 +1,9 @@
+from starlette import status
+
+from app.api.v1.exceptions.websocket import websocket_status
+from app.api.v1.exceptions.websocket.websocket_error import WebSocketError
+
+
+class InboundOverflowError(WebSocketError):
+    status_code = websocket_status.WS_4029_TOO_MANY_REQUESTS
+    close_code = status.WS_1008_POLICY_VIOLATION
@@ -0,0 +1,6 @@
+from app.api.v1.exceptions.websocket import websocket_status
+from app.api.v1.exceptions.websocket.websocket_error import WebSocketError
+
+
+class RateLimitedError(WebSocketError):
+    status_code = websocket_status.WS_4029_TOO_MANY_REQUESTS
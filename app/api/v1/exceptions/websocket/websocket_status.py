@@ -1,4 +1,6 @@
 WS_4000_BAD_REQUEST = 4000
 WS_4001_UNAUTHORIZED = 4001
+WS_4009_FRAME_TOO_LARGE = 4009
+WS_4029_TOO_MANY_REQUESTS = 4029
 
 WS_4100_INTERNAL_ERROR = 4100
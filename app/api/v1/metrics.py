@@ -0,0 +1,60 @@
+from typing import Dict, Any
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self.__counters: Dict[str, float] = {}
+        self.__gauges: Dict[str, float] = {}
+        self.__summaries: Dict[str, Dict[str, float]] = {}
+
+    def increment(
+            self,
+            name: str,
+            value: float = 1
+    ) -> None:
+        self.__counters[name] = self.__counters.get(name, 0) + value
+
+    def set(
+            self,
+            name: str,
+            value: float
+    ) -> None:
+        self.__gauges[name] = value
+
+    def observe(
+            self,
+            name: str,
+            value: float
+    ) -> None:
+        summary: Dict[str, float] | None = self.__summaries.get(name)
+
+        if summary is None:
+            self.__summaries[name] = {"count": 1, "sum": value, "min": value, "max": value, "last": value}
+            return
+
+        summary["count"] += 1
+        summary["sum"] += value
+        summary["min"] = min(summary["min"], value)
+        summary["max"] = max(summary["max"], value)
+        summary["last"] = value
+
+    def remove(
+            self,
+            name: str
+    ) -> None:
+        self.__counters.pop(name, None)
+        self.__gauges.pop(name, None)
+        self.__summaries.pop(name, None)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "counters": dict(self.__counters),
+            "gauges": dict(self.__gauges),
+            "summaries": {
+                name: {**summary, "avg": summary["sum"] / summary["count"]}
+                for name, summary in self.__summaries.items()
+            }
+        }
+
+
+metrics = Metrics()
@@ -1,5 +1,5 @@
 from abc import abstractmethod, ABC
-from typing import Any
+from typing import Any, ClassVar, Dict, Tuple, Type
 
 from app.api.v1.enums.packet_class import PacketClass
 
@@ -8,6 +8,21 @@ class BasePacket(ABC):
     PACKET_TAG: str
     PACKET_CLASS: PacketClass
 
+    PACKETS: ClassVar[Dict[Tuple[str, str], Type['BasePacket']]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if "PACKET_TAG" not in cls.__dict__:
+            return
+
+        key: Tuple[str, str] = (cls.PACKET_CLASS.value, cls.PACKET_TAG)
+
+        if key in BasePacket.PACKETS and BasePacket.PACKETS[key] is not cls:
+            raise ValueError(f"Packet {key} is already registered by {BasePacket.PACKETS[key].__name__}")
+
+        BasePacket.PACKETS[key] = cls
+
     @abstractmethod
     def __init__(
             self,
@@ -1,7 +1,13 @@
-import json
-from abc import abstractmethod, ABC
-from typing import Dict, Any, Type, List
+from abc import ABC
+from inspect import Parameter, signature
+from types import UnionType
+from typing import Dict, Any, Type, ClassVar, Annotated, Union, get_args, get_origin, get_type_hints
+from uuid import UUID
 
+from pydantic import ConfigDict, Field, Strict, TypeAdapter, ValidationError
+from typing_extensions import NotRequired, TypedDict
+
+from app.api.v1.codecs.codecs import codec, binary_codec
 from app.api.v1.enums.packet_class import PacketClass
 from app.api.v1.exceptions.http.invalid_packet import InvalidPacketError
 from app.api.v1.exceptions.websocket.invalid_packet_data import InvalidPacketDataError
@@ -11,100 +17,144 @@ from app.api.v1.packets.base import BasePacket
 class ClientPacket(BasePacket, ABC):
     PACKET_CLASS = PacketClass.CLIENT
 
-    PACKET_KEYS: Dict[str, Any] | List[str] = []
+    MAX_STRING_LENGTH: ClassVar[int] = 4096
+    MAX_ITEMS: ClassVar[int] = 16
+
+    VALIDATOR: ClassVar[TypeAdapter]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if "PACKET_TAG" in cls.__dict__:
+            cls.VALIDATOR = cls.__compile_validator()
 
     @classmethod
-    @abstractmethod
     def from_json(cls, packet: Dict[str, Any]) -> 'ClientPacket':
-        pass
+        try:
+            return cls(**cls.VALIDATOR.validate_python(packet))
+        except ValidationError:
+            raise InvalidPacketError("Provided packet data is invalid")
 
     @classmethod
-    def unpack(cls, packet: str) -> 'ClientPacket':
+    def unpack(cls, packet: str | bytes) -> 'ClientPacket':
+        return cls.unpack_json(cls._decode(packet))
+
+    @classmethod
+    def unpack_json(cls, packet: Dict[str, Any]) -> 'ClientPacket':
         packet: Dict[str, Any] = cls._get_validated_packet(packet)
 
         if packet["meta"]["tag"] != cls.PACKET_TAG or packet["meta"]["class"] != cls.PACKET_CLASS.value:
             raise InvalidPacketError("Provided packet meta is invalid")
 
-        return cls.from_json(packet["data"])
+        return cls._unpack_data(packet["data"])
 
     @classmethod
     def withdraw_packet(
             cls,
-            packet: str
+            packet: str | bytes
     ) -> 'ClientPacket':
         try:
+            packet: Dict[str, Any] = cls._decode(packet)
             packet_type: Type[ClientPacket] = ClientPacket.withdraw_packet_type(packet)
-            return packet_type.unpack(packet)
+            return packet_type._unpack_data(packet["data"])
+        except InvalidPacketError:
+            raise InvalidPacketDataError("Provided packet data is invalid")
+
+    @classmethod
+    def withdraw_binary_packet(
+            cls,
+            packet: bytes
+    ) -> 'ClientPacket':
+        try:
+            packet: Any = binary_codec.decode(packet)
+        except ValueError:
+            raise InvalidPacketDataError("Provided packet data is invalid")
+
+        if (
+                not isinstance(packet, list) or len(packet) != 2
+                or not isinstance(packet[0], str) or not isinstance(packet[1], dict)
+        ):
+            raise InvalidPacketDataError("Provided packet data is invalid")
+
+        packet_type: Type[BasePacket] | None = cls.PACKETS.get((cls.PACKET_CLASS.value, packet[0]))
+
+        if packet_type is None or not issubclass(packet_type, cls):
+            raise InvalidPacketDataError("Provided packet data is invalid")
+
+        try:
+            return packet_type._unpack_data(packet[1])
         except InvalidPacketError:
             raise InvalidPacketDataError("Provided packet data is invalid")
 
     @classmethod
     def withdraw_packet_type(
             cls,
-            packet: str
+            packet: Dict[str, Any]
     ) -> Type['ClientPacket']:
         packet: Dict[str, Any] = cls._get_validated_packet(packet)
+        packet_type: Type[BasePacket] | None = cls.PACKETS.get((packet["meta"]["class"], packet["meta"]["tag"]))
 
-        packet_tag: str = packet["meta"]["tag"]
-        packet_class: str = packet["meta"]["class"]
-
-        packets: Dict[str, Type[ClientPacket]] = {
-            p.PACKET_TAG: p for p in cls.__get_packets() if p.PACKET_CLASS.value == packet_class
-        }
-
-        if packet_tag not in packets:
+        if packet_type is None or not issubclass(packet_type, cls):
             raise InvalidPacketError("Provided packet meta is invalid")
 
-        return packets[packet_tag]
+        return packet_type
 
     @classmethod
-    def _get_validated_packet(
-            cls,
-            packet: str
-    ) -> Dict[str, Any]:
+    def _unpack_data(cls, data: Dict[str, Any]) -> 'ClientPacket':
+        return cls.from_json(data)
+
+    @staticmethod
+    def _decode(packet: str | bytes) -> Dict[str, Any]:
         try:
-            packet: Dict[str, Any] = json.loads(packet)
+            packet: Any = codec.decode(packet)
         except ValueError:
             raise InvalidPacketError("Provided packet is not a valid JSON")
 
-        if "data" not in packet:
+        if not isinstance(packet, dict):
+            raise InvalidPacketError("Provided packet is not a valid JSON")
+
+        return packet
+
+    @classmethod
+    def _get_validated_packet(
+            cls,
+            packet: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        if "data" not in packet or not isinstance(packet["data"], dict):
             raise InvalidPacketError("Provided packet data is invalid")
 
-        if "meta" not in packet:
+        if "meta" not in packet or not isinstance(packet["meta"], dict):
             raise InvalidPacketError("Provided packet meta is invalid")
 
         for meta_attribute in ("tag", "class"):
-            if meta_attribute not in packet["meta"]:
+            if not isinstance(packet["meta"].get(meta_attribute), str):
                 raise InvalidPacketError("Provided packet meta is invalid")
 
-        if not cls.__validate_keys(packet["data"], cls.PACKET_KEYS):
-            raise InvalidPacketError("Provided packet data is invalid")
-
         return packet
 
     @classmethod
-    def __validate_keys(
-            cls,
-            packet: Dict[str, Any],
-            keys: Dict[str, Any] | List[str]
-    ) -> bool:
-        if isinstance(keys, dict):
-            for key, value in keys.items():
-                if key not in packet or not cls.__validate_keys(packet[key], value):
-                    return False
-        elif isinstance(keys, list):
-            for key in keys:
-                if key not in packet:
-                    return False
-        return True
+    def __compile_validator(cls) -> TypeAdapter:
+        hints: Dict[str, Any] = get_type_hints(cls.__init__, include_extras=True)
+        fields: Dict[str, Any] = {}
+
+        for name, parameter in list(signature(cls.__init__).parameters.items())[1:]:
+            annotation: Any = cls.__constrain(hints.get(name, Any))
+            fields[name] = annotation if parameter.default is Parameter.empty else NotRequired[annotation]
+
+        data: Any = TypedDict(f"{cls.__name__}Data", fields)
+        data.__pydantic_config__ = ConfigDict(strict=True, str_max_length=cls.MAX_STRING_LENGTH)
+
+        return TypeAdapter(data)
 
     @classmethod
-    def __get_packets(cls) -> List[Type['ClientPacket']]:
-        subclasses: List[Type[ClientPacket]] = cls.__subclasses__()
-        overall: List[Type[ClientPacket]] = []
+    def __constrain(cls, annotation: Any) -> Any:
+        if get_origin(annotation) in (Union, UnionType):
+            return Union[tuple(cls.__constrain(argument) for argument in get_args(annotation))]
+
+        if annotation is UUID:
+            return Annotated[UUID, Strict(False)]
 
-        for subclass in subclasses:
-            overall.append(subclass)
-            overall.extend(subclass.__get_packets())
+        if get_origin(annotation) in (list, tuple, dict, set):
+            return Annotated[annotation, Field(max_length=cls.MAX_ITEMS)]
 
-        return overall
+        return annotation
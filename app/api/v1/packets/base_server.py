@@ -1,25 +1,52 @@
-import json
-from abc import abstractmethod, ABC
-from typing import Dict, Any
+from abc import ABC
+from typing import Any, ClassVar, Dict
 
+from app.api.v1.enums.frame_encoding import FrameEncoding
 from app.api.v1.enums.packet_class import PacketClass
 from app.api.v1.packets.base import BasePacket
+from app.api.v1.packets.encoder import PacketEncoder
 
 
 class ServerPacket(BasePacket, ABC):
     PACKET_CLASS = PacketClass.SERVER
-    
-    @abstractmethod
+
+    ENCODER: ClassVar[PacketEncoder]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if "PACKET_TAG" not in cls.__dict__:
+            return
+
+        cls.ENCODER = PacketEncoder(
+            cls.PACKET_TAG,
+            cls.PACKET_CLASS,
+            cls.__init__ if cls.to_json is ServerPacket.to_json else None
+        )
+
     def to_json(self) -> Dict[str, Any]:
-        pass
-
-    def pack(self) -> str:
-        packet: Dict[str, Any] = {
-            "data": self.to_json(),
-            "meta": {
-                "tag": self.PACKET_TAG,
-                "class": self.PACKET_CLASS.value
-            }
-        }
-
-        return json.dumps(packet)
+        return self.ENCODER.to_json(self)
+
+    def pack(
+            self,
+            encoding: FrameEncoding = FrameEncoding.JSON,
+            *,
+            sequence: int | None = None
+    ) -> str | bytes:
+        return self.ENCODER.encode(self, encoding, sequence=sequence)
+
+    @classmethod
+    def pack_data(
+            cls,
+            tag: str,
+            data: Dict[str, Any],
+            encoding: FrameEncoding = FrameEncoding.JSON,
+            *,
+            sequence: int | None = None
+    ) -> str | bytes:
+        encoder: PacketEncoder | None = getattr(BasePacket.PACKETS.get((cls.PACKET_CLASS.value, tag)), "ENCODER", None)
+
+        if encoder is None:
+            encoder = PacketEncoder(tag, cls.PACKET_CLASS)
+
+        return encoder.encode_data(data, encoding, sequence=sequence)
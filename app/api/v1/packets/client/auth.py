@@ -1,19 +1,31 @@
-from typing import Dict, Any
+from typing import List
+from uuid import UUID
 
+from app.api.v1.enums.frame_encoding import FrameEncoding
 from app.api.v1.packets.base_client import ClientPacket
 
 
 class ClientAuthPacket(ClientPacket):
     PACKET_TAG = "auth"
 
-    PACKET_KEYS = ["ticket"]
-
     def __init__(
             self,
-            ticket: str
+            ticket: str | None = None,
+            encodings: List[str] | None = None,
+            resume_token: str | None = None,
+            game_id: UUID | None = None,
+            sequence: int | None = None
     ) -> None:
         self.ticket = ticket
+        self.encodings = encodings or []
+        self.resume_token = resume_token
+        self.game_id = game_id
+        self.sequence = sequence
+
+    @property
+    def encoding(self) -> FrameEncoding:
+        for encoding in self.encodings:
+            if encoding in FrameEncoding.__members__.values():
+                return FrameEncoding(encoding)
 
-    @classmethod
-    def from_json(cls, packet: Dict[str, Any]) -> 'ClientPacket':
-        return cls(packet["ticket"])
+        return FrameEncoding.JSON
@@ -0,0 +1,15 @@
+from uuid import UUID
+
+from app.api.v1.packets.base_client import ClientPacket
+
+
+class ClientGameSyncPacket(ClientPacket):
+    PACKET_TAG = "game_sync"
+
+    def __init__(
+            self,
+            game_id: UUID,
+            version: int
+    ) -> None:
+        self.game_id = game_id
+        self.version = version
@@ -1,5 +1,3 @@
-from typing import Dict, Any
-
 from app.api.v1.packets.base_client import ClientPacket
 
 
@@ -8,7 +6,3 @@ class ClientPingPacket(ClientPacket):
 
     def __init__(self) -> None:
         pass
-
-    @classmethod
-    def from_json(cls, packet: Dict[str, Any]) -> 'ClientPacket':
-        return cls()
@@ -1,15 +1,11 @@
-from typing import Dict, Any
 from uuid import UUID
 
-from app.api.v1.exceptions.http.invalid_packet import InvalidPacketError
 from app.api.v1.packets.base_client import ClientPacket
 
 
 class ClientPlayerReadyPacket(ClientPacket):
     PACKET_TAG = "player_ready"
 
-    PACKET_KEYS = ["game_id", "is_ready"]
-
     def __init__(
             self,
             game_id: UUID,
@@ -17,13 +13,3 @@ class ClientPlayerReadyPacket(ClientPacket):
     ) -> None:
         self.game_id = game_id
         self.is_ready = is_ready
-
-    @classmethod
-    def from_json(cls, packet: Dict[str, Any]) -> 'ClientPacket':
-        try:
-            return cls(
-                UUID(packet["game_id"]),
-                packet["is_ready"]
-            )
-        except ValueError:
-            raise InvalidPacketError("Provided packet data is invalid")
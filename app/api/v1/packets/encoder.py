@@ -0,0 +1,209 @@
+from enum import Enum
+from inspect import Parameter, signature
+from json.encoder import encode_basestring_ascii
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Dict, List, Tuple, get_args, get_origin, get_type_hints
+from uuid import UUID
+
+import msgpack
+
+from app.api.v1.codecs.codecs import codec, binary_codec
+from app.api.v1.codecs.msgpack_codec import MsgpackCodec
+from app.api.v1.enums.frame_encoding import FrameEncoding
+from app.api.v1.enums.packet_class import PacketClass
+
+
+class PacketEncoder:
+    UUID_CACHE_SIZE: ClassVar[int] = 4096
+
+    JSON_PLACEHOLDERS: ClassVar[Dict[Any, str]] = {UUID: '"%s"', int: "%d"}
+
+    UUID_TEXTS: ClassVar[Dict[int, str]] = {}
+    UUID_BYTES: ClassVar[Dict[int, bytes]] = {}
+
+    def __init__(
+            self,
+            tag: str,
+            packet_class: PacketClass,
+            init: Callable | None = None
+    ) -> None:
+        self.tag: str = tag
+        self.packet_class: PacketClass = packet_class
+
+        self.__json_meta: str = codec.encode_text({"tag": tag, "class": packet_class.value})[:-1]
+        self.__msgpack_tag: bytes = msgpack.packb(tag, use_bin_type=True)
+
+        self.__fields: Tuple[Tuple[str, Any], ...] | None = None
+
+        if init is not None:
+            self.__compile(init)
+
+    @property
+    def is_compiled(self) -> bool:
+        return self.__fields is not None
+
+    def to_json(self, packet: Any) -> Dict[str, Any]:
+        if self.__fields is None:
+            return packet.to_json()
+
+        return {
+            name: self.__to_json_value(value)
+            for name, value in zip(self.__names, self.__get_values(packet))
+        }
+
+    def encode(
+            self,
+            packet: Any,
+            encoding: FrameEncoding = FrameEncoding.JSON,
+            *,
+            sequence: int | None = None
+    ) -> str | bytes:
+        if self.__fields is None:
+            return self.encode_data(packet.to_json(), encoding, sequence=sequence)
+
+        values: List[Any] = self.__get_values(packet)
+
+        if encoding == FrameEncoding.MSGPACK:
+            for index, convert in self.__msgpack_converters:
+                values[index] = convert(values[index])
+
+            data: bytes = msgpack.packb(dict(zip(self.__names, values)), use_bin_type=True)
+
+            if sequence is None:
+                return b"\x92" + self.__msgpack_tag + data
+
+            return b"\x93" + self.__msgpack_tag + data + msgpack.packb(sequence)
+
+        for index, convert in self.__json_converters:
+            values[index] = convert(values[index])
+
+        if sequence is None:
+            return self.__json_template % tuple(values) + self.__json_meta + "}}"
+
+        return f'{self.__json_template % tuple(values)}{self.__json_meta},"seq":{int(sequence)}}}}}'
+
+    def encode_data(
+            self,
+            data: Dict[str, Any],
+            encoding: FrameEncoding = FrameEncoding.JSON,
+            *,
+            sequence: int | None = None
+    ) -> str | bytes:
+        if encoding == FrameEncoding.MSGPACK:
+            return binary_codec.encode([self.tag, data] if sequence is None else [self.tag, data, sequence])
+
+        if sequence is None:
+            return f'{{"data":{codec.encode_text(data)},"meta":{self.__json_meta}}}}}'
+
+        return f'{{"data":{codec.encode_text(data)},"meta":{self.__json_meta},"seq":{int(sequence)}}}}}'
+
+    def __compile(self, init: Callable) -> None:
+        hints: Dict[str, Any] = get_type_hints(init)
+        parameters: List[Parameter] = list(signature(init).parameters.values())[1:]
+
+        self.__fields = tuple((parameter.name, hints[parameter.name]) for parameter in parameters)
+        self.__names: Tuple[str, ...] = tuple(name for name, _ in self.__fields)
+        self.__getter: Callable[[Any], Any] | None = attrgetter(*self.__names) if self.__names else None
+
+        self.__json_converters: Tuple[Tuple[int, Callable[[Any], Any]], ...] = tuple(
+            (index, converter)
+            for index, (name, annotation) in enumerate(self.__fields)
+            if (converter := self.__get_json_converter(name, annotation)) is not None
+        )
+        self.__msgpack_converters: Tuple[Tuple[int, Callable[[Any], Any]], ...] = tuple(
+            (index, converter)
+            for index, (name, annotation) in enumerate(self.__fields)
+            if (converter := self.__get_msgpack_converter(name, annotation)) is not None
+        )
+
+        template: List[str] = [
+            f"{encode_basestring_ascii(name)}:{self.JSON_PLACEHOLDERS.get(annotation, '%s')}"
+            for name, annotation in self.__fields
+        ]
+        self.__json_template: str = '{"data":{' + ",".join(template) + '},"meta":'
+
+    def __get_values(self, packet: Any) -> List[Any]:
+        if self.__getter is None:
+            return []
+
+        if len(self.__names) == 1:
+            return [self.__getter(packet)]
+
+        return list(self.__getter(packet))
+
+    @classmethod
+    def __get_uuid_text(cls, value: UUID) -> str:
+        text: str | None = cls.UUID_TEXTS.get(value.int)
+
+        if text is None:
+            if len(cls.UUID_TEXTS) >= cls.UUID_CACHE_SIZE:
+                cls.UUID_TEXTS.clear()
+
+            text = cls.UUID_TEXTS[value.int] = str(value)
+
+        return text
+
+    @classmethod
+    def __get_uuid_bytes(cls, value: UUID) -> bytes:
+        data: bytes | None = cls.UUID_BYTES.get(value.int)
+
+        if data is None:
+            if len(cls.UUID_BYTES) >= cls.UUID_CACHE_SIZE:
+                cls.UUID_BYTES.clear()
+
+            data = cls.UUID_BYTES[value.int] = value.bytes
+
+        return data
+
+    @staticmethod
+    def __to_json_value(value: Any) -> Any:
+        if isinstance(value, UUID):
+            return str(value)
+
+        if isinstance(value, Enum):
+            return value.value
+
+        if isinstance(value, tuple):
+            return list(value)
+
+        return value
+
+    @classmethod
+    def __get_json_converter(cls, name: str, annotation: Any) -> Callable[[Any], Any] | None:
+        origin: Any = get_origin(annotation)
+
+        if annotation is UUID:
+            return cls.__get_uuid_text
+
+        if annotation is bool:
+            return lambda value: "true" if value else "false"
+
+        if annotation is int:
+            return None
+
+        if isinstance(annotation, type) and issubclass(annotation, Enum):
+            return lambda value: encode_basestring_ascii(value.value)
+
+        if annotation is str:
+            return encode_basestring_ascii
+
+        if origin in (tuple, list) and all(argument in (int, ...) for argument in get_args(annotation)):
+            return lambda value: f"[{','.join(map(int.__repr__, value))}]"
+
+        raise TypeError(f"Field {name} of type {annotation} cannot be compiled, override to_json instead")
+
+    @classmethod
+    def __get_msgpack_converter(cls, name: str, annotation: Any) -> Callable[[Any], Any] | None:
+        if name in MsgpackCodec.UUID_KEYS:
+            return cls.__get_uuid_bytes if annotation is UUID else lambda value: UUID(value).bytes
+
+        if annotation is UUID:
+            return cls.__get_uuid_text
+
+        if isinstance(annotation, type) and issubclass(annotation, Enum):
+            return attrgetter("value")
+
+        if get_origin(annotation) is tuple:
+            return list
+
+        return None
@@ -0,0 +1,56 @@
+from typing import Any, Dict
+
+from app.api.v1.enums.frame_encoding import FrameEncoding
+from app.api.v1.packets.base_server import ServerPacket
+
+
+class Frame:
+    def __init__(
+            self,
+            tag: str,
+            data: Dict[str, Any] | None = None,
+            *,
+            sequence: int | None = None,
+            packet: ServerPacket | None = None
+    ) -> None:
+        self.tag: str = tag
+        self.sequence: int | None = sequence
+
+        self.__data: Dict[str, Any] | None = data
+        self.__packet: ServerPacket | None = packet
+        self.__encoded: Dict[FrameEncoding, str | bytes] = {}
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        if self.__data is None:
+            self.__data = self.__packet.to_json()
+
+        return self.__data
+
+    @classmethod
+    def from_packet(
+            cls,
+            packet: ServerPacket,
+            *,
+            sequence: int | None = None
+    ) -> 'Frame':
+        if packet.ENCODER.is_compiled:
+            return cls(packet.PACKET_TAG, sequence=sequence, packet=packet)
+
+        return cls(packet.PACKET_TAG, packet.to_json(), sequence=sequence)
+
+    def encode(
+            self,
+            encoding: FrameEncoding
+    ) -> str | bytes:
+        encoded: str | bytes | None = self.__encoded.get(encoding)
+
+        if encoded is None:
+            if self.__packet is not None:
+                encoded = self.__packet.pack(encoding, sequence=self.sequence)
+            else:
+                encoded = ServerPacket.pack_data(self.tag, self.data, encoding, sequence=self.sequence)
+
+            self.__encoded[encoding] = encoded
+
+        return encoded
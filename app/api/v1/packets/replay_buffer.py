@@ -0,0 +1,33 @@
+from collections import deque
+from typing import Deque, List
+
+from app.api.v1.packets.frame import Frame
+
+
+class ReplayBuffer:
+    def __init__(
+            self,
+            size: int
+    ) -> None:
+        self.size: int = size
+
+        self.__frames: Deque[Frame] = deque()
+        self.__floor: int | None = None
+
+    def append(
+            self,
+            frame: Frame
+    ) -> None:
+        if len(self.__frames) >= self.size:
+            self.__floor = self.__frames.popleft().sequence
+
+        self.__frames.append(frame)
+
+    def get_since(
+            self,
+            sequence: int
+    ) -> List[Frame] | None:
+        if self.__floor is not None and sequence < self.__floor:
+            return None
+
+        return [frame for frame in self.__frames if frame.sequence > sequence]
@@ -1,6 +1,6 @@
-from typing import Dict, Any
 from uuid import UUID
 
+from app.api.v1.enums.frame_encoding import FrameEncoding
 from app.api.v1.packets.base_server import ServerPacket
 
 
@@ -10,13 +10,11 @@ class ServerAuthPacket(ServerPacket):
     def __init__(
             self,
             user_id: UUID,
-            username: str
+            username: str,
+            resume_token: str,
+            encoding: FrameEncoding = FrameEncoding.JSON
     ) -> None:
         self.user_id = user_id
         self.username = username
-
-    def to_json(self) -> Dict[str, Any]:
-        return {
-            "user_id": str(self.user_id),
-            "username": self.username
-        }
+        self.resume_token = resume_token
+        self.encoding = encoding
@@ -1,5 +1,3 @@
-from typing import Dict, Any
-
 from app.api.v1.exceptions.websocket.websocket_error import WebSocketError
 from app.api.v1.packets.base_server import ServerPacket
 
@@ -24,9 +22,3 @@ class ServerErrorPacket(ServerPacket):
             status_code=error.status_code,
             detail=str(error)
         )
-
-    def to_json(self) -> Dict[str, Any]:
-        return {
-            "status_code": self.status_code,
-            "detail": self.detail
-        }
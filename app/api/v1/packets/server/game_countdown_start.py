@@ -1,4 +1,3 @@
-from typing import Dict, Any
 from uuid import UUID
 
 from app.api.v1.packets.base_server import ServerPacket
@@ -14,9 +13,3 @@ class ServerGameCountdownStartPacket(ServerPacket):
     ) -> None:
         self.game_id = game_id
         self.delay = delay
-
-    def to_json(self) -> Dict[str, Any]:
-        return {
-            "game_id": str(self.game_id),
-            "delay": self.delay
-        }
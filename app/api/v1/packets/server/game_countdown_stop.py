@@ -1,4 +1,3 @@
-from typing import Dict, Any
 from uuid import UUID
 
 from app.api.v1.packets.base_server import ServerPacket
@@ -12,6 +11,3 @@ class ServerGameCountdownStopPacket(ServerPacket):
             game_id: UUID
     ) -> None:
         self.game_id = game_id
-
-    def to_json(self) -> Dict[str, Any]:
-        return {"game_id": str(self.game_id)}
@@ -0,0 +1,31 @@
+from typing import Dict, Any, List
+from uuid import UUID
+
+from app.api.v1.packets.base_server import ServerPacket
+
+
+class ServerGameSyncPacket(ServerPacket):
+    PACKET_TAG = "game_sync"
+
+    def __init__(
+            self,
+            game_id: UUID,
+            version: int,
+            is_full: bool,
+            entries: Dict[str, Any],
+            removed: List[str]
+    ) -> None:
+        self.game_id = game_id
+        self.version = version
+        self.is_full = is_full
+        self.entries = entries
+        self.removed = removed
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "game_id": str(self.game_id),
+            "version": self.version,
+            "is_full": self.is_full,
+            "entries": self.entries,
+            "removed": self.removed
+        }
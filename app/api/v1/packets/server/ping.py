@@ -1,13 +1,13 @@
-from typing import Dict, Any
-
 from app.api.v1.packets.base_server import ServerPacket
 
 
 class ServerPingPacket(ServerPacket):
     PACKET_TAG = "ping"
 
-    def __init__(self) -> None:
-        pass
-
-    def to_json(self) -> Dict[str, Any]:
-        return {"status": "ok"}
+    def __init__(
+            self,
+            status: str = "ok",
+            is_heartbeat: bool = False
+    ) -> None:
+        self.status = status
+        self.is_heartbeat = is_heartbeat
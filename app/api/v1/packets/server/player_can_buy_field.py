@@ -1,4 +1,3 @@
-from typing import Dict, Any
 from uuid import UUID
 
 from app.api.v1.packets.base_server import ServerPacket
@@ -18,11 +17,3 @@ class ServerPlayerCanBuyFieldPacket(ServerPacket):
         self.player_id = player_id
         self.field = field
         self.cost = cost
-
-    def to_json(self) -> Dict[str, Any]:
-        return {
-            "game_id": str(self.game_id),
-            "player_id": str(self.player_id),
-            "field": self.field,
-            "cost": self.cost
-        }
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Tuple
+from typing import Tuple
 from uuid import UUID
 
 from app.api.v1.packets.base_server import ServerPacket
@@ -18,11 +18,3 @@ class ServerPlayerMovePacket(ServerPacket):
         self.player_id = player_id
         self.dices = dices
         self.field = field
-
-    def to_json(self) -> Dict[str, Any]:
-        return {
-            "game_id": str(self.game_id),
-            "player_id": str(self.player_id),
-            "dices": list(self.dices),
-            "field": self.field
-        }
@@ -1,4 +1,3 @@
-from typing import Dict, Any
 from uuid import UUID
 
 from app.api.v1.packets.base_server import ServerPacket
@@ -22,13 +21,3 @@ class ServerPlayerPayRentPacket(ServerPacket):
         self.field = field
         self.player_balance = player_balance
         self.owner_balance = owner_balance
-
-    def to_json(self) -> Dict[str, Any]:
-        return {
-            "game_id": str(self.game_id),
-            "player_id": str(self.player_id),
-            "owner_id": str(self.owner_id),
-            "field": self.field,
-            "player_balance": self.player_balance,
-            "owner_balance": self.owner_balance
-        }
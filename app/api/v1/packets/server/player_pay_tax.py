@@ -1,4 +1,3 @@
-from typing import Dict, Any
 from uuid import UUID
 
 from app.api.v1.packets.base_server import ServerPacket
@@ -16,10 +15,3 @@ class ServerPlayerPayTaxPacket(ServerPacket):
         self.game_id = game_id
         self.player_id = player_id
         self.balance = balance
-
-    def to_json(self) -> Dict[str, Any]:
-        return {
-            "game_id": str(self.game_id),
-            "player_id": str(self.player_id),
-            "balance": self.balance
-        }
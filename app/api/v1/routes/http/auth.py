@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends
 from starlette import status
 
 from app.api.v1.controllers.users import UsersController
+from app.api.v1.exceptions.http.already_exists import AlreadyExistsError
 from app.api.v1.exceptions.http.not_found import NotFoundError
 from app.api.v1.models.response.authentication import AuthenticationModel
 from app.api.v1.models.response.ticket import TicketModel
@@ -25,7 +26,10 @@ async def register(
         users_controller: Annotated[UsersController, Depends(Dependency.users_controller)],
         authenticator: Annotated[Authenticator, Depends(Authenticator.dependency)]
 ) -> AuthenticationModel:
-    user: User = await users_controller.create_user(username=username)
+    user: User | None = await users_controller.create_user(username=username)
+
+    if user is None:
+        raise AlreadyExistsError("User with provided username already exists")
 
     access_token: str = await asyncio.to_thread(
         authenticator.create_access_token,
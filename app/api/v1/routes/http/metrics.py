@@ -0,0 +1,18 @@
+from typing import Dict, Any
+
+from fastapi import APIRouter
+from starlette import status
+
+from app.api.v1.metrics import metrics
+from app.api.v1.security.authenticator import Authenticator
+
+metrics_router: APIRouter = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@metrics_router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Authenticator.verify_access_token_dependency()]
+)
+async def get_metrics() -> Dict[str, Any]:
+    return metrics.to_json()
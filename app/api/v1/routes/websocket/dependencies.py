@@ -1,5 +1,7 @@
 from typing import Callable, Annotated
+from uuid import UUID
 
+from app.api.v1.connections.connection import Connection
 from app.api.v1.controllers.connections import ConnectionsController
 from app.api.v1.controllers.games import GamesController
 from app.api.v1.exceptions.websocket.game_already_started import GameAlreadyStartedError
@@ -25,6 +27,7 @@ class WebSocketDependency:
     ) -> Callable:
         async def __get_game(
                 packet: ClientPacket,
+                connection: Connection | None,
                 connections: ConnectionsController,
                 games_controller: GamesController,
                 user: User
@@ -32,11 +35,18 @@ class WebSocketDependency:
             if not hasattr(packet, "game_id"):
                 raise InvalidPacketDataError("Provided packet data is invalid")
 
-            game: Game | None = await games_controller.get_game(getattr(packet, "game_id"), connections)
+            game_id: UUID = getattr(packet, "game_id")
+            game: Game | None = connection.game if connection is not None else None
 
-            if game is None or (user.user_id not in game.players.ids and has_player):
+            if game is None or game.game_id != game_id or not games_controller.is_current(game):
+                game = await games_controller.get_game(game_id, connections)
+
+            if game is None or (has_player and not game.players.exists(user.user_id)):
                 raise GameNotFoundError("Game with provided UUID was not found")
 
+            if connection is not None and game.players.exists(user.user_id):
+                connection.game = game
+
             if is_started is not None:
                 if game.is_started and not is_started:
                     raise GameAlreadyStartedError("Game with provided UUID has already started")
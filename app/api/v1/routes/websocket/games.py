@@ -1,11 +1,11 @@
 from asyncio import Task
 from typing import Annotated, Tuple
 
-from starlette.websockets import WebSocket
-
+from app.api.v1.connections.connection import Connection
 from app.api.v1.exceptions.websocket.game_not_awaiting_move import GameNotAwaitingMoveError
 from app.api.v1.exceptions.websocket.max_players import TooManyPlayersError
 from app.api.v1.exceptions.websocket.player_already_in_game import PlayerAlreadyInGameError
+from app.api.v1.packets.client.game_sync import ClientGameSyncPacket
 from app.api.v1.packets.client.ping import ClientPingPacket
 from app.api.v1.packets.client.player_buy_field import ClientPlayerBuyFieldPacket
 from app.api.v1.packets.client.player_join_game import ClientPlayerJoinGamePacket
@@ -13,6 +13,7 @@ from app.api.v1.packets.client.player_move import ClientPlayerMovePacket
 from app.api.v1.packets.client.player_pay_rent import ClientPlayerPayRentPacket
 from app.api.v1.packets.client.player_pay_tax import ClientPlayerPayTaxPacket
 from app.api.v1.packets.client.player_ready import ClientPlayerReadyPacket
+from app.api.v1.packets.server.game_sync import ServerGameSyncPacket
 from app.api.v1.packets.server.ping import ServerPingPacket
 from app.api.v1.packets.server.player_join_game import ServerPlayerJoinGamePacket
 from app.api.v1.routes.websocket.dependencies import WebSocketDependency
@@ -35,7 +36,7 @@ async def on_ping() -> ServerPingPacket:
 
 @games_packets_router.handle(ClientPlayerJoinGamePacket)
 async def on_player_join_game(
-        websocket: WebSocket,
+        connection: Connection,
         user: User,
         game: Annotated[Game, WebSocketDependency.get_game(is_started=False, has_player=False)]
 ) -> None:
@@ -46,9 +47,10 @@ async def on_player_join_game(
         raise PlayerAlreadyInGameError("You are already in game")
 
     player = Player(user.user_id, username=user.username)
-    player.connection = websocket
+    player.connection = connection
 
     game.players.add(player)
+    connection.game = game
     await game.save()
     await game.send(ServerPlayerJoinGamePacket(game.game_id, player.player_id, player.username))
 
@@ -131,3 +133,12 @@ async def on_player_pay_tax(
 
     await player.pay_tax(packet.field)
     await game.save()
+
+
+@games_packets_router.handle(ClientGameSyncPacket)
+async def on_game_sync(
+        packet: ClientGameSyncPacket,
+        game: Annotated[Game, WebSocketDependency.get_game(is_started=None)]
+) -> ServerGameSyncPacket:
+    is_full, entries, removed = game.get_delta(packet.version)
+    return ServerGameSyncPacket(game.game_id, game.sequence, is_full, entries, removed)
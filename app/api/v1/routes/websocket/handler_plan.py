@@ -0,0 +1,44 @@
+from inspect import getfullargspec
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class HandlerPlan:
+    def __init__(
+            self,
+            func: Callable
+    ) -> None:
+        self.func: Callable = func
+        self.dependencies: List[Tuple[str, HandlerPlan]] = [
+            (name, HandlerPlan(annotation.__metadata__[0]))
+            for name, annotation in getattr(func, "__annotations__", {}).items()
+            if hasattr(annotation, "__metadata__")
+        ]
+
+        dependency_names: Tuple[str, ...] = tuple(name for name, _ in self.dependencies)
+
+        self.args: Tuple[str, ...] = tuple(
+            name for name in getfullargspec(func)[0]
+            if name not in dependency_names
+        )
+        self.dependency_args: Tuple[str, ...] = tuple(
+            name for name in getfullargspec(func)[0]
+            if name in dependency_names
+        )
+
+    async def resolve(
+            self,
+            context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        arguments: Dict[str, Any] = {name: context[name] for name in self.args if name in context}
+
+        if self.dependencies:
+            resolved: Dict[str, Any] = {name: await plan.execute(context) for name, plan in self.dependencies}
+            arguments.update({name: resolved[name] for name in self.dependency_args})
+
+        return arguments
+
+    async def execute(
+            self,
+            context: Dict[str, Any]
+    ) -> Any:
+        return await self.func(**await self.resolve(context))
@@ -1,21 +1,32 @@
-from inspect import getfullargspec
-from typing import Dict, Any, Callable, Type, Annotated, Tuple
+import asyncio
+from asyncio import Future, Task
+from time import perf_counter
+from typing import Dict, Any, Callable, Type, Annotated
+from uuid import UUID
 
 from fastapi import APIRouter, Depends
-from redis.asyncio import Redis
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
+from app.api.v1.connections.connection import Connection
+from app.api.v1.connections.packet_limiter import PacketLimiter
 from app.api.v1.controllers.connections import ConnectionsController
 from app.api.v1.controllers.games import GamesController
 from app.api.v1.controllers.users import UsersController
+from app.api.v1.enums.frame_encoding import FrameEncoding
 from app.api.v1.exceptions.websocket.internal_server_error import InternalServerError
+from app.api.v1.exceptions.websocket.rate_limited import RateLimitedError
 from app.api.v1.exceptions.websocket.unknown_packet import UnknownPacketError
 from app.api.v1.exceptions.websocket.websocket_error import WebSocketError
 from app.api.v1.logging import logger
+from app.api.v1.metrics import metrics
 from app.api.v1.packets.base_client import ClientPacket
 from app.api.v1.packets.base_server import ServerPacket
+from app.api.v1.packets.frame import Frame
+from app.api.v1.packets.server.error import ServerErrorPacket
 from app.api.v1.routes.websocket.abstract_packets import AbstractPacketsRouter
+from app.api.v1.routes.websocket.handler_plan import HandlerPlan
 from app.api.v1.security.authenticator import Authenticator
+from app.api.v1.storages.storage import Storage
 from app.assets.objects.user import User
 from app.dependencies import Dependency
 from config import Config
@@ -23,18 +34,20 @@ from config import Config
 
 async def dependencies(
         config: Annotated[Config, Depends(Dependency.config_websocket)],
-        redis: Annotated[Redis, Depends(Dependency.redis_websocket)],
+        storage: Annotated[Storage, Depends(Dependency.storage_websocket)],
         authenticator: Annotated[Authenticator, Depends(Authenticator.websocket_dependency)],
         connections: Annotated[ConnectionsController, Depends(ConnectionsController.websocket_dependency)],
         users_controller: Annotated[UsersController, Depends(Dependency.users_controller_websocket)],
         games_controller: Annotated[GamesController, Depends(Dependency.games_controller_websocket)],
+        connection: Annotated[Connection | None, Depends(ConnectionsController.connection_dependency)],
         user: Annotated[User, Authenticator.get_websocket_user()]
 ) -> Dict[str, Any]:
     return {
         "config": config,
-        "redis": redis,
+        "storage": storage,
         "authenticator": authenticator,
         "connections": connections,
+        "connection": connection,
         "users_controller": users_controller,
         "games_controller": games_controller,
         "user": user
@@ -48,7 +61,7 @@ class PacketsRouter(APIRouter, AbstractPacketsRouter):
             prefix: str
     ) -> None:
         super().__init__(prefix=prefix)
-        self.__handlers: Dict[Type[ClientPacket], Callable] = {}
+        self.__handlers: Dict[Type[ClientPacket], HandlerPlan] = {}
 
         self.add_api_websocket_route(
             "/",
@@ -61,7 +74,7 @@ class PacketsRouter(APIRouter, AbstractPacketsRouter):
             packet: Type[ClientPacket]
     ) -> Callable:
         def decorator(func: Callable) -> None:
-            self.__handlers.update({packet: func})
+            self.__handlers.update({packet: HandlerPlan(func)})
 
         return decorator
 
@@ -70,98 +83,161 @@ class PacketsRouter(APIRouter, AbstractPacketsRouter):
             websocket: WebSocket,
             dp: Annotated[Dict[str, Any], Depends(dependencies)]
     ) -> None:
+        config: Config = dp["config"]
+        failure: Future = asyncio.get_running_loop().create_future()
+        limiter: PacketLimiter = PacketLimiter(
+            rate=config.packet_rate,
+            burst=config.packet_burst,
+            packet_limits=config.packet_limits,
+            max_frame_size=config.max_frame_size,
+            inbound_queue_size=config.inbound_queue_size
+        )
+
         try:
             while True:
-                packet: str = await websocket.receive_text()
-                await self.__handle_packet(packet, websocket, **dp)  # At some point it must create asyncio tasks
+                receive: Task = asyncio.create_task(self.__receive(websocket))
+                await asyncio.wait({receive, failure}, return_when=asyncio.FIRST_COMPLETED)
+
+                if failure.done():
+                    receive.cancel()
+                    failure.result()
+
+                if dp["connection"] is not None:
+                    dp["connection"].touch()
+
+                frame: str | bytes = receive.result()
+
+                try:
+                    await self.__handle_packet(frame, websocket, failure, limiter, **dp)
+                except RateLimitedError as e:
+                    await self.__reject(e, websocket, dp["connection"], self.__get_encoding(frame))
         except WebSocketDisconnect as e:
             logger.info(f"Closing connection. Status code: {e.code}, Reason: {e.reason}")
+        finally:
+            if dp["connection"] is not None:
+                await dp["connections"].release_connection(dp["connection"])
+
+    @staticmethod
+    async def __receive(websocket: WebSocket) -> str | bytes:
+        message: Dict[str, Any] = await websocket.receive()
+
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+
+        if message.get("text") is not None:
+            return message["text"]
+
+        return message["bytes"]
 
     async def __handle_packet(
             self,
-            packet: str,
+            packet: str | bytes,
             websocket: WebSocket,
+            failure: Future,
+            limiter: PacketLimiter,
             **kwargs
     ) -> None:
         try:
-            packet: ClientPacket = ClientPacket.withdraw_packet(packet)
+            limiter.check_frame(packet)
+
+            started: float = perf_counter()
+            packet: ClientPacket = (
+                ClientPacket.withdraw_binary_packet(packet) if isinstance(packet, bytes)
+                else ClientPacket.withdraw_packet(packet)
+            )
+            metrics.observe("packets.decode_seconds", perf_counter() - started)
+
+            limiter.check_packet(packet.PACKET_TAG)
 
             if type(packet) not in self.__handlers:
                 raise UnknownPacketError("Unknown packet")
 
-            await self.__execute_handler(self.__handlers[type(packet)], packet, websocket, **kwargs)
+            plan: HandlerPlan = self.__handlers[type(packet)]
+            game_id: UUID | None = getattr(packet, "game_id", None)
+
+            if game_id is None:
+                await self.__execute_handler(plan, packet, websocket, **kwargs)
+                return
+
+            limiter.check_pending()
+
+            games_controller: GamesController = kwargs["games_controller"]
+            job: Future = games_controller.execute(
+                game_id,
+                lambda: self.__execute_handler(plan, packet, websocket, **kwargs)
+            )
+            limiter.track(job)
+            job.add_done_callback(lambda done: self.__propagate(done, failure))
         except WebSocketError as e:
             raise e
         except Exception as e:
             raise InternalServerError("Internal server error", e)
 
-    async def __execute_handler(
-            self,
-            handler: Any,
-            packet: ClientPacket,
+    @staticmethod
+    async def __reject(
+            error: WebSocketError,
             websocket: WebSocket,
-            **kwargs: Any
+            connection: Connection | None,
+            encoding: FrameEncoding
     ) -> None:
-        handler_dependencies: Dict[str, Any] = await self.__inject_dependencies(
-            handler,
-            packet=packet,
-            websocket=websocket,
-            **kwargs
-        )
+        packet: ServerErrorPacket = ServerErrorPacket.from_error(error)
 
-        prepared_args: Dict[str, Any] = self.__prepare_args(
-            handler,
-            packet=packet,
-            websocket=websocket,
-            router=self,
-            **handler_dependencies,
-            **kwargs
-        )
+        if connection is not None:
+            connection.send(Frame.from_packet(packet))
+            return
 
-        response_packet: ServerPacket | None = await handler(**prepared_args)
+        payload: str | bytes = packet.pack(encoding)
 
-        if response_packet is not None:
-            await websocket.send_text(response_packet.pack())
+        if isinstance(payload, bytes):
+            await websocket.send_bytes(payload)
+        else:
+            await websocket.send_text(payload)
 
-    async def __inject_dependencies(
-            self,
-            handler: Callable,
-            **kwargs: Any
-    ) -> Dict[str, Any]:
-        handler_dependencies: Dict[str, Any] = {}
+    @staticmethod
+    def __get_encoding(frame: str | bytes) -> FrameEncoding:
+        return FrameEncoding.MSGPACK if isinstance(frame, bytes) else FrameEncoding.JSON
 
-        if not hasattr(handler, "__annotations__"):
-            return handler_dependencies
+    @staticmethod
+    def __propagate(
+            job: Future,
+            failure: Future
+    ) -> None:
+        if job.cancelled() or failure.done() or job.exception() is None:
+            return
 
-        for name, annotation in getattr(handler, "__annotations__").items():
-            if not hasattr(annotation, "__metadata__"):
-                continue
+        error: BaseException = job.exception()
 
-            func: Callable = annotation.__metadata__[0]
+        if not isinstance(error, WebSocketError):
+            error = InternalServerError("Internal server error", error)
 
-            func_dependencies: Dict[str, Any] = await self.__inject_dependencies(
-                func,
-                **kwargs
-            )
+        failure.set_exception(error)
 
-            prepared_args: Dict[str, Any] = self.__prepare_args(
-                func,
-                **func_dependencies,
-                **kwargs
-            )
+    async def __execute_handler(
+            self,
+            plan: HandlerPlan,
+            packet: ClientPacket,
+            websocket: WebSocket,
+            **kwargs: Any
+    ) -> None:
+        started: float = perf_counter()
+
+        arguments: Dict[str, Any] = await plan.resolve(
+            {**kwargs, "packet": packet, "websocket": websocket, "router": self}
+        )
 
-            handler_dependencies.update({name: await func(**prepared_args)})
+        resolved: float = perf_counter()
+        metrics.observe(f"packets.dispatch_seconds.{packet.PACKET_TAG}", resolved - started)
 
-        return handler_dependencies
+        response_packet: ServerPacket | None = await plan.func(**arguments)
 
-    @staticmethod
-    def __prepare_args(
-            func: Callable,
-            **kwargs: Any
-    ) -> Dict[str, Any]:
-        args: Tuple[str, ...] = tuple(getfullargspec(func)[0])
+        metrics.observe(f"packets.handler_seconds.{packet.PACKET_TAG}", perf_counter() - resolved)
 
-        return {
-            k: arg for k, arg in kwargs.items()
-            if k in args
-        }
+        if response_packet is None:
+            return
+
+        connection: Connection | None = kwargs.get("connection")
+
+        if connection is not None:
+            connection.send(Frame.from_packet(response_packet))
+        else:
+            await websocket.send_text(response_packet.pack())
@@ -1,6 +1,6 @@
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, Annotated
+from typing import Dict, Annotated, Tuple
 from uuid import UUID
 
 from fastapi import Depends, Header
@@ -8,7 +8,9 @@ from jwt import encode, decode, InvalidTokenError, DecodeError, ExpiredSignature
 from pytz import utc
 from starlette.websockets import WebSocket
 
+from app.api.v1.connections.connection import Connection
 from app.api.v1.controllers.connections import ConnectionsController
+from app.api.v1.controllers.games import GamesController
 from app.api.v1.controllers.users import UsersController
 from app.api.v1.exceptions.http.invalid_access_token import InvalidAccessTokenError
 from app.api.v1.exceptions.http.invalid_credentials import InvalidCredentialsError
@@ -104,6 +106,19 @@ class Authenticator:
 
         return ticket
 
+    async def verify_ticket(
+            self,
+            ticket: str | None
+    ) -> UUID | None:
+        if ticket is None:
+            return None
+
+        try:
+            data: Dict[str, str] = await asyncio.to_thread(self.decode_ticket, ticket)
+            return UUID(data["id"])
+        except (InvalidAccessTokenError, ValueError):
+            return None
+
     async def verify_access_token(
             self,
             access_token: str,
@@ -166,7 +181,8 @@ class Authenticator:
                 websocket: WebSocket,
                 authenticator: Annotated[Authenticator, Depends(Authenticator.websocket_dependency)],
                 connections: Annotated[ConnectionsController, Depends(ConnectionsController.websocket_dependency)],
-                users_controller: Annotated[UsersController, Depends(Dependency.users_controller_websocket)]
+                users_controller: Annotated[UsersController, Depends(Dependency.users_controller_websocket)],
+                games_controller: Annotated[GamesController, Depends(Dependency.games_controller_websocket)]
         ) -> None:
             await websocket.accept()
 
@@ -176,20 +192,22 @@ class Authenticator:
                 await websocket.close(3000, "Provided authorization packet data is invalid")
                 return
 
-            try:
-                ticket: Dict[str, str] = await asyncio.to_thread(
-                    authenticator.decode_ticket,
-                    auth_packet.ticket
-                )
-            except InvalidAccessTokenError:
-                await websocket.close(3000, "Provided authorization ticket is invalid")
-                return
+            is_local: bool = False
 
-            try:
-                user_id: UUID = UUID(ticket["id"])
-            except ValueError:
-                await websocket.close(3000, "Provided authorization ticket is invalid")
-                return
+            if auth_packet.resume_token is not None:
+                session: Tuple[UUID, bool] | None = await connections.resume(auth_packet.resume_token)
+
+                if session is None:
+                    await websocket.close(3000, "Provided resume token is invalid or expired")
+                    return
+
+                user_id, is_local = session
+            else:
+                user_id: UUID | None = await authenticator.verify_ticket(auth_packet.ticket)
+
+                if user_id is None:
+                    await websocket.close(3000, "Provided authorization ticket is invalid")
+                    return
 
             user: User | None = await users_controller.get_user(user_id)
 
@@ -197,45 +215,35 @@ class Authenticator:
                 await websocket.close(3000, "Provided authorization ticket is invalid")
                 return
 
-            await connections.add_connection(websocket, user.user_id)
+            connection: Connection = await connections.add_connection(websocket, user, encoding=auth_packet.encoding)
 
             auth_response_packet: ServerAuthPacket = ServerAuthPacket(
                 user.user_id,
-                user.username
+                user.username,
+                connection.resume_token,
+                auth_packet.encoding
             )
 
             await websocket.send_text(auth_response_packet.pack())
 
+            if auth_packet.resume_token is not None and auth_packet.game_id is not None:
+                await games_controller.resume(
+                    connection,
+                    auth_packet.game_id,
+                    auth_packet.sequence or 0,
+                    replay=is_local
+                )
+
         return Depends(__authenticate_websocket)
 
     @staticmethod
     def get_websocket_user() -> Depends:
         async def __get_websocket_user(
-                websocket: WebSocket,
-                connections: Annotated[ConnectionsController, Depends(ConnectionsController.websocket_dependency)],
-                users_controller: Annotated[UsersController, Depends(Dependency.users_controller_websocket)]
+                connection: Annotated[Connection | None, Depends(ConnectionsController.connection_dependency)]
         ) -> User:
-            user: User | None = await users_controller.get_user(await connections.get_user_id(websocket))
-
-            if user is None:
-                raise NotAuthenticatedAddressError("Provided websocket address is not authenticated")
-
-            return user
-
-        return Depends(__get_websocket_user)
-
-    @staticmethod
-    def get_websocket_game() -> Depends:
-        async def __get_websocket_user(
-                websocket: WebSocket,
-                connections: Annotated[ConnectionsController, Depends(ConnectionsController.websocket_dependency)],
-                users_controller: Annotated[UsersController, Depends(Dependency.users_controller_websocket)]
-        ) -> User:
-            user: User | None = await users_controller.get_user(await connections.get_user_id(websocket))
-
-            if user is None:
-                raise NotAuthenticatedAddressError("Provided websocket address is not authenticated")
+            if connection is None:
+                raise NotAuthenticatedAddressError("Provided websocket connection is not authenticated")
 
-            return user
+            return connection.user
 
         return Depends(__get_websocket_user)
@@ -0,0 +1,209 @@
+from fnmatch import fnmatchcase
+from heapq import heappop, heappush
+from time import monotonic
+from typing import AsyncIterator, Dict, List, Set, Tuple
+
+from app.api.v1.storages.storage import Storage
+
+
+class MemoryStorage(Storage):
+    NAME = "memory"
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.__values: Dict[str, bytes] = {}
+        self.__hashes: Dict[str, Dict[str, bytes]] = {}
+        self.__sets: Dict[str, Set[str]] = {}
+        self.__expirations: Dict[str, float] = {}
+        self.__expiration_queue: List[Tuple[float, str]] = []
+
+    async def get(self, key: str) -> bytes | None:
+        self.__expire()
+        return self.__values.get(key)
+
+    async def get_many(self, keys: List[str]) -> List[bytes | None]:
+        self.__expire()
+        return [self.__values.get(key) for key in keys]
+
+    async def set(
+            self,
+            key: str,
+            value: bytes,
+            *,
+            index: str | None = None,
+            member: str | None = None,
+            ttl: float | None = None
+    ) -> None:
+        self.__expire()
+        self.__remove(key)
+        self.__values[key] = value
+
+        if ttl is not None:
+            self.__expirations[key] = monotonic() + ttl
+            heappush(self.__expiration_queue, (self.__expirations[key], key))
+
+        if index is not None:
+            await self.add_to_set(index, member)
+
+    async def pop(self, key: str) -> bytes | None:
+        self.__expire()
+        value: bytes | None = self.__values.get(key)
+
+        self.__remove(key)
+        return value
+
+    async def expire(self, key: str, ttl: float) -> bool:
+        if not await self.exists(key):
+            return False
+
+        self.__expirations[key] = monotonic() + ttl
+        heappush(self.__expiration_queue, (self.__expirations[key], key))
+        return True
+
+    async def exists(self, key: str) -> bool:
+        self.__expire()
+        return key in self.__values or key in self.__hashes or key in self.__sets
+
+    async def remove(self, key: str) -> None:
+        self.__remove(key)
+
+    async def get_type(self, key: str) -> str:
+        self.__expire()
+
+        if key in self.__values:
+            return "string"
+        if key in self.__hashes:
+            return "hash"
+        if key in self.__sets:
+            return "set"
+
+        return "none"
+
+    async def scan(self, pattern: str, *, count: int) -> AsyncIterator[str]:
+        self.__expire()
+
+        for keys in (self.__values, self.__hashes, self.__sets):
+            for key in list(keys):
+                if fnmatchcase(key, pattern):
+                    yield key
+
+    async def get_hash(self, key: str) -> Dict[str, bytes]:
+        return dict(self.__hashes.get(key, {}))
+
+    async def get_hashes(self, keys: List[str]) -> List[Dict[str, bytes]]:
+        return [dict(self.__hashes.get(key, {})) for key in keys]
+
+    async def update_hashes(
+            self,
+            updates: Dict[str, Tuple[Dict[str, bytes], List[str]]],
+            *,
+            replace: bool = False
+    ) -> None:
+        for key, (entries, removed) in updates.items():
+            if replace:
+                self.__remove(key)
+
+            fields: Dict[str, bytes] = self.__hashes.setdefault(key, {})
+            fields.update(entries)
+
+            for field in removed:
+                fields.pop(field, None)
+
+            if not fields:
+                self.__hashes.pop(key)
+
+    async def get_hash_field(self, key: str, field: str) -> bytes | None:
+        return self.__hashes.get(key, {}).get(field)
+
+    async def get_hash_fields(self, key: str, fields: List[str]) -> List[bytes | None]:
+        current: Dict[str, bytes] = self.__hashes.get(key, {})
+        return [current.get(field) for field in fields]
+
+    async def set_hash_fields(
+            self,
+            key: str,
+            fields: Dict[str, bytes],
+            *,
+            only_new: bool = False
+    ) -> int:
+        if not fields:
+            return 0
+
+        current: Dict[str, bytes] = self.__hashes.setdefault(key, {})
+
+        if only_new:
+            fields = {field: value for field, value in fields.items() if field not in current}
+
+        current.update(fields)
+        return len(fields)
+
+    async def remove_hash_fields(self, key: str, *fields: str) -> None:
+        current: Dict[str, bytes] = self.__hashes.get(key, {})
+
+        for field in fields:
+            current.pop(field, None)
+
+        if not current:
+            self.__hashes.pop(key, None)
+
+    async def add_to_set(self, key: str, *members: str) -> None:
+        self.__sets.setdefault(key, set()).update(members)
+
+    async def remove_from_set(self, key: str, *members: str) -> None:
+        current: Set[str] = self.__sets.get(key, set())
+        current.difference_update(members)
+
+        if not current:
+            self.__sets.pop(key, None)
+
+    async def scan_set(self, key: str, *, count: int) -> AsyncIterator[str]:
+        for member in list(self.__sets.get(key, ())):
+            yield member
+
+    async def transfer(
+            self,
+            key: str,
+            *,
+            version: int,
+            payer: str | None,
+            payer_balance: int,
+            payee: str | None,
+            payee_balance: int,
+            amount: int,
+            field: int | None,
+            owner: str | None
+    ) -> Tuple[int, int, int, int]:
+        current: Dict[str, bytes] = self.__hashes.get(key, {})
+
+        result, changes = self._transfer(
+            current.get,
+            version=version,
+            payer=payer,
+            payer_balance=payer_balance,
+            payee=payee,
+            payee_balance=payee_balance,
+            amount=amount,
+            field=field,
+            owner=owner
+        )
+
+        if changes:
+            self.__hashes.setdefault(key, {}).update(changes)
+
+        return result
+
+    def __expire(self) -> None:
+        now: float = monotonic()
+
+        while self.__expiration_queue and self.__expiration_queue[0][0] <= now:
+            expires, key = heappop(self.__expiration_queue)
+
+            if self.__expirations.get(key) == expires:
+                self.__remove(key)
+
+    def __remove(self, key: str) -> None:
+        self.__values.pop(key, None)
+        self.__hashes.pop(key, None)
+        self.__sets.pop(key, None)
+        self.__expirations.pop(key, None)
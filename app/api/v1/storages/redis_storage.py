@@ -0,0 +1,238 @@
+from typing import AsyncIterator, Dict, List, Tuple
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.commands.core import AsyncScript
+
+from app.api.v1.storages.storage import Storage
+
+
+class RedisStorage(Storage):
+    NAME = "redis"
+
+    TRANSFER_SCRIPT: str = """
+        local key = KEYS[1]
+        local expected = tonumber(ARGV[1])
+        local payer, payer_balance = ARGV[2], ARGV[3]
+        local payee, payee_balance = ARGV[4], ARGV[5]
+        local amount = tonumber(ARGV[6])
+        local field, owner = ARGV[7], ARGV[8]
+
+        local version = tonumber(redis.call("HGET", key, "version") or "0")
+
+        if expected ~= version then
+            return {1, version, 0, 0}
+        end
+
+        if field ~= "" and redis.call("HEXISTS", key, "owner:" .. field) == 1 then
+            return {3, version, 0, 0}
+        end
+
+        if payer ~= "" then
+            local balance = tonumber(redis.call("HGET", key, "balance:" .. payer) or payer_balance)
+
+            if balance < amount then
+                return {2, version, 0, 0}
+            end
+
+            redis.call("HSETNX", key, "balance:" .. payer, payer_balance)
+            payer_balance = redis.call("HINCRBY", key, "balance:" .. payer, -amount)
+        end
+
+        if payee ~= "" then
+            redis.call("HSETNX", key, "balance:" .. payee, payee_balance)
+            payee_balance = redis.call("HINCRBY", key, "balance:" .. payee, amount)
+        end
+
+        if field ~= "" then
+            redis.call("HSET", key, "owner:" .. field, cjson.encode(owner))
+        end
+
+        version = redis.call("HINCRBY", key, "version", 1)
+
+        return {0, version, tonumber(payer_balance), tonumber(payee_balance)}
+    """
+
+    def __init__(
+            self,
+            redis: Redis
+    ) -> None:
+        super().__init__()
+
+        self.__redis: Redis = redis
+        self.__transfer_script: AsyncScript = redis.register_script(self.TRANSFER_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str) -> 'RedisStorage':
+        return cls(Redis.from_url(url))
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.__redis.get(key)
+
+    async def get_many(self, keys: List[str]) -> List[bytes | None]:
+        if not keys:
+            return []
+
+        return await self.__redis.mget(keys)
+
+    async def set(
+            self,
+            key: str,
+            value: bytes,
+            *,
+            index: str | None = None,
+            member: str | None = None,
+            ttl: float | None = None
+    ) -> None:
+        expires: int | None = round(ttl * 1000) if ttl is not None else None
+
+        if index is None:
+            await self.__redis.set(key, value, px=expires)
+            return
+
+        async with self.__redis.pipeline(transaction=True) as pipeline:
+            pipeline.set(key, value, px=expires)
+            pipeline.sadd(index, member)
+            await pipeline.execute()
+
+    async def pop(self, key: str) -> bytes | None:
+        return await self.__redis.getdel(key)
+
+    async def expire(self, key: str, ttl: float) -> bool:
+        return bool(await self.__redis.pexpire(key, round(ttl * 1000)))
+
+    async def exists(self, key: str) -> bool:
+        return bool(await self.__redis.exists(key))
+
+    async def remove(self, key: str) -> None:
+        await self.__redis.delete(key)
+
+    async def get_type(self, key: str) -> str:
+        return (await self.__redis.type(key)).decode()
+
+    async def scan(self, pattern: str, *, count: int) -> AsyncIterator[str]:
+        async for key in self.__redis.scan_iter(match=pattern, count=count):
+            yield key.decode()
+
+    async def get_hash(self, key: str) -> Dict[str, bytes]:
+        return self.__decode_fields(await self.__redis.hgetall(key))
+
+    async def get_hashes(self, keys: List[str]) -> List[Dict[str, bytes]]:
+        async with self.__redis.pipeline(transaction=False) as pipeline:
+            for key in keys:
+                pipeline.hgetall(key)
+
+            return [self.__decode_fields(fields) for fields in await pipeline.execute()]
+
+    async def update_hashes(
+            self,
+            updates: Dict[str, Tuple[Dict[str, bytes], List[str]]],
+            *,
+            replace: bool = False
+    ) -> None:
+        async with self.__redis.pipeline(transaction=True) as pipeline:
+            for key, (entries, removed) in updates.items():
+                if replace:
+                    pipeline.delete(key)
+                if entries:
+                    pipeline.hset(key, mapping=entries)
+                if removed:
+                    pipeline.hdel(key, *removed)
+
+            await pipeline.execute()
+
+    async def get_hash_field(self, key: str, field: str) -> bytes | None:
+        return await self.__redis.hget(key, field)
+
+    async def get_hash_fields(self, key: str, fields: List[str]) -> List[bytes | None]:
+        return await self.__redis.hmget(key, fields)
+
+    async def set_hash_fields(
+            self,
+            key: str,
+            fields: Dict[str, bytes],
+            *,
+            only_new: bool = False
+    ) -> int:
+        if not fields:
+            return 0
+
+        if not only_new:
+            await self.__redis.hset(key, mapping=fields)
+            return len(fields)
+
+        async with self.__redis.pipeline(transaction=False) as pipeline:
+            for field, value in fields.items():
+                pipeline.hsetnx(key, field, value)
+
+            return sum(await pipeline.execute())
+
+    async def remove_hash_fields(self, key: str, *fields: str) -> None:
+        await self.__redis.hdel(key, *fields)
+
+    async def add_to_set(self, key: str, *members: str) -> None:
+        await self.__redis.sadd(key, *members)
+
+    async def remove_from_set(self, key: str, *members: str) -> None:
+        await self.__redis.srem(key, *members)
+
+    async def scan_set(self, key: str, *, count: int) -> AsyncIterator[str]:
+        async for member in self.__redis.sscan_iter(key, count=count):
+            yield member.decode()
+
+    async def transfer(
+            self,
+            key: str,
+            *,
+            version: int,
+            payer: str | None,
+            payer_balance: int,
+            payee: str | None,
+            payee_balance: int,
+            amount: int,
+            field: int | None,
+            owner: str | None
+    ) -> Tuple[int, int, int, int]:
+        status, version, payer_balance, payee_balance = await self.__transfer_script(
+            keys=[key],
+            args=[
+                version,
+                payer or "",
+                payer_balance,
+                payee or "",
+                payee_balance,
+                amount,
+                field if field is not None else "",
+                owner or ""
+            ]
+        )
+
+        return status, version, payer_balance, payee_balance
+
+    async def publish(
+            self,
+            channel: str,
+            message: bytes
+    ) -> None:
+        await self.__redis.publish(channel, message)
+
+    async def subscribe(
+            self,
+            pattern: str
+    ) -> AsyncIterator[Tuple[str, bytes]]:
+        pubsub: PubSub = self.__redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.psubscribe(pattern)
+
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "pmessage":
+                    yield message["channel"].decode(), message["data"]
+        finally:
+            await pubsub.aclose()
+
+    async def close(self) -> None:
+        await self.__redis.aclose()
+
+    @staticmethod
+    def __decode_fields(fields: Dict[bytes, bytes]) -> Dict[str, bytes]:
+        return {field.decode(): value for field, value in fields.items()}
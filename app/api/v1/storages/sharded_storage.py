@@ -0,0 +1,228 @@
+import asyncio
+from asyncio import Queue, Task
+from bisect import bisect
+from hashlib import md5
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+from app.api.v1.storages.storage import Storage
+
+
+class ShardedStorage(Storage):
+    NAME = "sharded"
+
+    REPLICAS: int = 128
+
+    def __init__(
+            self,
+            shards: Dict[str, Storage]
+    ) -> None:
+        super().__init__()
+
+        if not shards:
+            raise ValueError("Sharded storage requires at least one shard")
+
+        self.__shards: List[Storage] = list(shards.values())
+        self.__ring: List[Tuple[int, int]] = sorted(
+            (self.__hash(f"{name}#{replica}"), index)
+            for index, name in enumerate(shards)
+            for replica in range(self.REPLICAS)
+        )
+        self.__points: List[int] = [point for point, _ in self.__ring]
+
+    def get_shard(self, key: str) -> Storage:
+        position: int = bisect(self.__points, self.__hash(key.rsplit(":", 1)[-1])) % len(self.__ring)
+        return self.__shards[self.__ring[position][1]]
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.get_shard(key).get(key)
+
+    async def get_many(self, keys: List[str]) -> List[bytes | None]:
+        return await self.__fan_out(keys, lambda shard, shard_keys: shard.get_many(shard_keys))
+
+    async def set(
+            self,
+            key: str,
+            value: bytes,
+            *,
+            index: str | None = None,
+            member: str | None = None,
+            ttl: float | None = None
+    ) -> None:
+        await self.get_shard(key).set(key, value, ttl=ttl)
+
+        if index is not None:
+            await self.add_to_set(index, member)
+
+    async def pop(self, key: str) -> bytes | None:
+        return await self.get_shard(key).pop(key)
+
+    async def expire(self, key: str, ttl: float) -> bool:
+        return await self.get_shard(key).expire(key, ttl)
+
+    async def exists(self, key: str) -> bool:
+        return await self.get_shard(key).exists(key)
+
+    async def remove(self, key: str) -> None:
+        await self.get_shard(key).remove(key)
+
+    async def get_type(self, key: str) -> str:
+        return await self.get_shard(key).get_type(key)
+
+    async def scan(self, pattern: str, *, count: int) -> AsyncIterator[str]:
+        async for key in self.__merge([shard.scan(pattern, count=count) for shard in self.__shards]):
+            yield key
+
+    async def get_hash(self, key: str) -> Dict[str, bytes]:
+        return await self.get_shard(key).get_hash(key)
+
+    async def get_hashes(self, keys: List[str]) -> List[Dict[str, bytes]]:
+        return await self.__fan_out(keys, lambda shard, shard_keys: shard.get_hashes(shard_keys))
+
+    async def update_hashes(
+            self,
+            updates: Dict[str, Tuple[Dict[str, bytes], List[str]]],
+            *,
+            replace: bool = False
+    ) -> None:
+        grouped: Dict[int, Tuple[Storage, Dict[str, Tuple[Dict[str, bytes], List[str]]]]] = {}
+
+        for key, update in updates.items():
+            shard: Storage = self.get_shard(key)
+            grouped.setdefault(id(shard), (shard, {}))[1][key] = update
+
+        await asyncio.gather(*[
+            shard.update_hashes(shard_updates, replace=replace)
+            for shard, shard_updates in grouped.values()
+        ])
+
+    async def get_hash_field(self, key: str, field: str) -> bytes | None:
+        return await self.get_shard(key).get_hash_field(key, field)
+
+    async def get_hash_fields(self, key: str, fields: List[str]) -> List[bytes | None]:
+        return await self.get_shard(key).get_hash_fields(key, fields)
+
+    async def set_hash_fields(
+            self,
+            key: str,
+            fields: Dict[str, bytes],
+            *,
+            only_new: bool = False
+    ) -> int:
+        return await self.get_shard(key).set_hash_fields(key, fields, only_new=only_new)
+
+    async def remove_hash_fields(self, key: str, *fields: str) -> None:
+        await self.get_shard(key).remove_hash_fields(key, *fields)
+
+    async def add_to_set(self, key: str, *members: str) -> None:
+        await self.get_shard(key).add_to_set(key, *members)
+
+    async def remove_from_set(self, key: str, *members: str) -> None:
+        await self.get_shard(key).remove_from_set(key, *members)
+
+    async def scan_set(self, key: str, *, count: int) -> AsyncIterator[str]:
+        async for member in self.get_shard(key).scan_set(key, count=count):
+            yield member
+
+    async def transfer(
+            self,
+            key: str,
+            *,
+            version: int,
+            payer: str | None,
+            payer_balance: int,
+            payee: str | None,
+            payee_balance: int,
+            amount: int,
+            field: int | None,
+            owner: str | None
+    ) -> Tuple[int, int, int, int]:
+        return await self.get_shard(key).transfer(
+            key,
+            version=version,
+            payer=payer,
+            payer_balance=payer_balance,
+            payee=payee,
+            payee_balance=payee_balance,
+            amount=amount,
+            field=field,
+            owner=owner
+        )
+
+    async def publish(
+            self,
+            channel: str,
+            message: bytes
+    ) -> None:
+        await self.get_shard(channel).publish(channel, message)
+
+    async def subscribe(
+            self,
+            pattern: str
+    ) -> AsyncIterator[Tuple[str, bytes]]:
+        async for message in self.__merge([shard.subscribe(pattern) for shard in self.__shards]):
+            yield message
+
+    async def close(self) -> None:
+        await asyncio.gather(*[shard.close() for shard in self.__shards])
+
+    async def __fan_out(
+            self,
+            keys: List[str],
+            fetch: Any
+    ) -> List[Any]:
+        grouped: Dict[int, Tuple[Storage, List[int]]] = {}
+
+        for position, key in enumerate(keys):
+            shard: Storage = self.get_shard(key)
+            grouped.setdefault(id(shard), (shard, []))[1].append(position)
+
+        results: List[List[Any]] = await asyncio.gather(*[
+            fetch(shard, [keys[position] for position in positions])
+            for shard, positions in grouped.values()
+        ])
+
+        values: List[Any] = [None] * len(keys)
+
+        for (_, positions), shard_values in zip(grouped.values(), results):
+            for position, value in zip(positions, shard_values):
+                values[position] = value
+
+        return values
+
+    @staticmethod
+    async def __merge(iterators: List[AsyncIterator[Any]]) -> AsyncIterator[Any]:
+        queue: Queue = Queue()
+        finished: object = object()
+
+        async def drain(iterator: AsyncIterator[Any]) -> None:
+            try:
+                async for item in iterator:
+                    await queue.put(item)
+            except Exception as e:
+                queue.put_nowait((finished, e))
+            else:
+                queue.put_nowait((finished, None))
+
+        tasks: List[Task] = [asyncio.create_task(drain(iterator)) for iterator in iterators]
+        remaining: int = len(tasks)
+
+        try:
+            while remaining:
+                item: Any = await queue.get()
+
+                if isinstance(item, tuple) and len(item) == 2 and item[0] is finished:
+                    remaining -= 1
+
+                    if item[1] is not None:
+                        raise item[1]
+
+                    continue
+
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def __hash(value: str) -> int:
+        return int.from_bytes(md5(value.encode()).digest()[:8], "big")
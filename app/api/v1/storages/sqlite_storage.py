@@ -0,0 +1,300 @@
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from time import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Tuple
+
+from app.api.v1.storages.storage import Storage
+
+
+class SqliteStorage(Storage):
+    NAME = "sqlite"
+
+    SCHEMA: Tuple[str, ...] = (
+        "CREATE TABLE IF NOT EXISTS strings (key TEXT PRIMARY KEY, value BLOB NOT NULL) WITHOUT ROWID",
+        "CREATE TABLE IF NOT EXISTS hashes ("
+        "key TEXT NOT NULL, field TEXT NOT NULL, value BLOB NOT NULL, PRIMARY KEY (key, field)"
+        ") WITHOUT ROWID",
+        "CREATE TABLE IF NOT EXISTS sets ("
+        "key TEXT NOT NULL, member TEXT NOT NULL, PRIMARY KEY (key, member)"
+        ") WITHOUT ROWID",
+        "CREATE TABLE IF NOT EXISTS expirations (key TEXT PRIMARY KEY, expires REAL NOT NULL) WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS expirations_expires ON expirations (expires)"
+    )
+
+    def __init__(
+            self,
+            path: str
+    ) -> None:
+        super().__init__()
+
+        self.__executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self.__connection: sqlite3.Connection = sqlite3.connect(
+            path,
+            isolation_level=None,
+            check_same_thread=False
+        )
+
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+
+        for query in self.SCHEMA:
+            self.__connection.execute(query)
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.__run(self.__get, key)
+
+    async def get_many(self, keys: List[str]) -> List[bytes | None]:
+        return await self.__run(lambda: [self.__get(key) for key in keys])
+
+    async def set(
+            self,
+            key: str,
+            value: bytes,
+            *,
+            index: str | None = None,
+            member: str | None = None,
+            ttl: float | None = None
+    ) -> None:
+        def execute() -> None:
+            self.__expire()
+            self.__remove(key)
+            self.__connection.execute("INSERT INTO strings (key, value) VALUES (?, ?)", (key, value))
+
+            if ttl is not None:
+                self.__connection.execute("INSERT INTO expirations (key, expires) VALUES (?, ?)", (key, time() + ttl))
+
+            if index is not None:
+                self.__connection.execute("INSERT OR IGNORE INTO sets (key, member) VALUES (?, ?)", (index, member))
+
+        await self.__run(self.__transaction, execute)
+
+    async def pop(self, key: str) -> bytes | None:
+        def execute() -> bytes | None:
+            self.__expire()
+            value: bytes | None = self.__get(key)
+
+            self.__remove(key)
+            return value
+
+        return await self.__run(self.__transaction, execute)
+
+    async def expire(self, key: str, ttl: float) -> bool:
+        def execute() -> bool:
+            self.__expire()
+
+            if self.__get(key) is None and not any(
+                    self.__connection.execute(f"SELECT 1 FROM {table} WHERE key = ? LIMIT 1", (key,)).fetchone()
+                    for table in ("hashes", "sets")
+            ):
+                return False
+
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO expirations (key, expires) VALUES (?, ?)",
+                (key, time() + ttl)
+            )
+            return True
+
+        return await self.__run(self.__transaction, execute)
+
+    async def exists(self, key: str) -> bool:
+        return await self.get_type(key) != "none"
+
+    async def remove(self, key: str) -> None:
+        await self.__run(self.__transaction, lambda: self.__remove(key))
+
+    async def get_type(self, key: str) -> str:
+        def execute() -> str:
+            if self.__get(key) is not None:
+                return "string"
+
+            for table, name in (("hashes", "hash"), ("sets", "set")):
+                if self.__connection.execute(f"SELECT 1 FROM {table} WHERE key = ? LIMIT 1", (key,)).fetchone():
+                    return name
+
+            return "none"
+
+        return await self.__run(execute)
+
+    async def scan(self, pattern: str, *, count: int) -> AsyncIterator[str]:
+        keys: List[Tuple[str]] = await self.__run(
+            lambda: self.__connection.execute(
+                "SELECT key FROM strings WHERE key GLOB ?1 "
+                "UNION SELECT DISTINCT key FROM hashes WHERE key GLOB ?1 "
+                "UNION SELECT DISTINCT key FROM sets WHERE key GLOB ?1",
+                (pattern,)
+            ).fetchall()
+        )
+
+        for (key,) in keys:
+            yield key
+
+    async def get_hash(self, key: str) -> Dict[str, bytes]:
+        return await self.__run(self.__get_hash, key)
+
+    async def get_hashes(self, keys: List[str]) -> List[Dict[str, bytes]]:
+        return await self.__run(lambda: [self.__get_hash(key) for key in keys])
+
+    async def update_hashes(
+            self,
+            updates: Dict[str, Tuple[Dict[str, bytes], List[str]]],
+            *,
+            replace: bool = False
+    ) -> None:
+        def execute() -> None:
+            for key, (entries, removed) in updates.items():
+                if replace:
+                    self.__remove(key)
+
+                self.__set_fields(key, entries)
+                self.__connection.executemany(
+                    "DELETE FROM hashes WHERE key = ? AND field = ?",
+                    [(key, field) for field in removed]
+                )
+
+        await self.__run(self.__transaction, execute)
+
+    async def get_hash_field(self, key: str, field: str) -> bytes | None:
+        return await self.__run(self.__get_hash_field, key, field)
+
+    async def get_hash_fields(self, key: str, fields: List[str]) -> List[bytes | None]:
+        return await self.__run(lambda: [self.__get_hash_field(key, field) for field in fields])
+
+    async def set_hash_fields(
+            self,
+            key: str,
+            fields: Dict[str, bytes],
+            *,
+            only_new: bool = False
+    ) -> int:
+        def execute() -> int:
+            cursor: sqlite3.Cursor = self.__connection.executemany(
+                f"INSERT {'OR IGNORE' if only_new else 'OR REPLACE'} INTO hashes (key, field, value) VALUES (?, ?, ?)",
+                [(key, field, value) for field, value in fields.items()]
+            )
+
+            return cursor.rowcount
+
+        return await self.__run(self.__transaction, execute)
+
+    async def remove_hash_fields(self, key: str, *fields: str) -> None:
+        await self.__run(
+            self.__connection.executemany,
+            "DELETE FROM hashes WHERE key = ? AND field = ?",
+            [(key, field) for field in fields]
+        )
+
+    async def add_to_set(self, key: str, *members: str) -> None:
+        await self.__run(
+            self.__transaction,
+            lambda: self.__connection.executemany(
+                "INSERT OR IGNORE INTO sets (key, member) VALUES (?, ?)",
+                [(key, member) for member in members]
+            )
+        )
+
+    async def remove_from_set(self, key: str, *members: str) -> None:
+        await self.__run(
+            self.__transaction,
+            lambda: self.__connection.executemany(
+                "DELETE FROM sets WHERE key = ? AND member = ?",
+                [(key, member) for member in members]
+            )
+        )
+
+    async def scan_set(self, key: str, *, count: int) -> AsyncIterator[str]:
+        members: List[Tuple[str]] = await self.__run(
+            lambda: self.__connection.execute("SELECT member FROM sets WHERE key = ?", (key,)).fetchall()
+        )
+
+        for (member,) in members:
+            yield member
+
+    async def transfer(
+            self,
+            key: str,
+            *,
+            version: int,
+            payer: str | None,
+            payer_balance: int,
+            payee: str | None,
+            payee_balance: int,
+            amount: int,
+            field: int | None,
+            owner: str | None
+    ) -> Tuple[int, int, int, int]:
+        def execute() -> Tuple[int, int, int, int]:
+            result, changes = self._transfer(
+                lambda name: self.__get_hash_field(key, name),
+                version=version,
+                payer=payer,
+                payer_balance=payer_balance,
+                payee=payee,
+                payee_balance=payee_balance,
+                amount=amount,
+                field=field,
+                owner=owner
+            )
+
+            self.__set_fields(key, changes)
+            return result
+
+        return await self.__run(self.__transaction, execute)
+
+    async def close(self) -> None:
+        await self.__run(self.__connection.close)
+        self.__executor.shutdown()
+
+    async def __run(self, func: Callable, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, func, *args)
+
+    def __transaction(self, func: Callable[[], Any]) -> Any:
+        self.__connection.execute("BEGIN IMMEDIATE")
+
+        try:
+            result: Any = func()
+        except BaseException as e:
+            self.__connection.execute("ROLLBACK")
+            raise e
+
+        self.__connection.execute("COMMIT")
+        return result
+
+    def __get(self, key: str) -> bytes | None:
+        row: Tuple[bytes] | None = self.__connection.execute(
+            "SELECT value FROM strings WHERE key = ?1 "
+            "AND NOT EXISTS (SELECT 1 FROM expirations WHERE key = ?1 AND expires <= ?2)",
+            (key, time())
+        ).fetchone()
+
+        return row[0] if row is not None else None
+
+    def __get_hash(self, key: str) -> Dict[str, bytes]:
+        return dict(self.__connection.execute("SELECT field, value FROM hashes WHERE key = ?", (key,)).fetchall())
+
+    def __get_hash_field(self, key: str, field: str) -> bytes | None:
+        row: Tuple[bytes] | None = self.__connection.execute(
+            "SELECT value FROM hashes WHERE key = ? AND field = ?",
+            (key, field)
+        ).fetchone()
+
+        return row[0] if row is not None else None
+
+    def __set_fields(self, key: str, fields: Dict[str, bytes]) -> None:
+        self.__connection.executemany(
+            "INSERT OR REPLACE INTO hashes (key, field, value) VALUES (?, ?, ?)",
+            [(key, field, value) for field, value in fields.items()]
+        )
+
+    def __expire(self) -> None:
+        expired: List[Tuple[str]] = self.__connection.execute(
+            "SELECT key FROM expirations WHERE expires <= ?",
+            (time(),)
+        ).fetchall()
+
+        for (key,) in expired:
+            self.__remove(key)
+
+    def __remove(self, key: str) -> None:
+        for table in ("strings", "hashes", "sets", "expirations"):
+            self.__connection.execute(f"DELETE FROM {table} WHERE key = ?", (key,))
@@ -0,0 +1,200 @@
+from abc import ABC, abstractmethod
+from asyncio import Queue
+from fnmatch import fnmatchcase
+from typing import AsyncIterator, Callable, Dict, List, Tuple
+
+
+class Storage(ABC):
+    NAME: str
+
+    def __init__(self) -> None:
+        self.__subscribers: List[Tuple[str, Queue]] = []
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        pass
+
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> List[bytes | None]:
+        pass
+
+    @abstractmethod
+    async def set(
+            self,
+            key: str,
+            value: bytes,
+            *,
+            index: str | None = None,
+            member: str | None = None,
+            ttl: float | None = None
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def pop(self, key: str) -> bytes | None:
+        pass
+
+    @abstractmethod
+    async def expire(self, key: str, ttl: float) -> bool:
+        pass
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def remove(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    async def get_type(self, key: str) -> str:
+        pass
+
+    @abstractmethod
+    def scan(self, pattern: str, *, count: int) -> AsyncIterator[str]:
+        pass
+
+    @abstractmethod
+    async def get_hash(self, key: str) -> Dict[str, bytes]:
+        pass
+
+    @abstractmethod
+    async def get_hashes(self, keys: List[str]) -> List[Dict[str, bytes]]:
+        pass
+
+    @abstractmethod
+    async def update_hashes(
+            self,
+            updates: Dict[str, Tuple[Dict[str, bytes], List[str]]],
+            *,
+            replace: bool = False
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def get_hash_field(self, key: str, field: str) -> bytes | None:
+        pass
+
+    @abstractmethod
+    async def get_hash_fields(self, key: str, fields: List[str]) -> List[bytes | None]:
+        pass
+
+    @abstractmethod
+    async def set_hash_fields(
+            self,
+            key: str,
+            fields: Dict[str, bytes],
+            *,
+            only_new: bool = False
+    ) -> int:
+        pass
+
+    @abstractmethod
+    async def remove_hash_fields(self, key: str, *fields: str) -> None:
+        pass
+
+    @abstractmethod
+    async def add_to_set(self, key: str, *members: str) -> None:
+        pass
+
+    @abstractmethod
+    async def remove_from_set(self, key: str, *members: str) -> None:
+        pass
+
+    @abstractmethod
+    def scan_set(self, key: str, *, count: int) -> AsyncIterator[str]:
+        pass
+
+    @abstractmethod
+    async def transfer(
+            self,
+            key: str,
+            *,
+            version: int,
+            payer: str | None,
+            payer_balance: int,
+            payee: str | None,
+            payee_balance: int,
+            amount: int,
+            field: int | None,
+            owner: str | None
+    ) -> Tuple[int, int, int, int]:
+        pass
+
+    async def publish(
+            self,
+            channel: str,
+            message: bytes
+    ) -> None:
+        for pattern, queue in self.__subscribers:
+            if fnmatchcase(channel, pattern):
+                queue.put_nowait((channel, message))
+
+    async def subscribe(
+            self,
+            pattern: str
+    ) -> AsyncIterator[Tuple[str, bytes]]:
+        subscriber: Tuple[str, Queue] = (pattern, Queue())
+        self.__subscribers.append(subscriber)
+
+        try:
+            while True:
+                yield await subscriber[1].get()
+        finally:
+            self.__subscribers.remove(subscriber)
+
+    async def close(self) -> None:
+        pass
+
+    async def set_hash_field(
+            self,
+            key: str,
+            field: str,
+            value: bytes,
+            *,
+            only_new: bool = False
+    ) -> bool:
+        return bool(await self.set_hash_fields(key, {field: value}, only_new=only_new))
+
+    @staticmethod
+    def _transfer(
+            get: Callable[[str], bytes | None],
+            *,
+            version: int,
+            payer: str | None,
+            payer_balance: int,
+            payee: str | None,
+            payee_balance: int,
+            amount: int,
+            field: int | None,
+            owner: str | None
+    ) -> Tuple[Tuple[int, int, int, int], Dict[str, bytes]]:
+        current: int = int(get("version") or 0)
+
+        if version != current:
+            return (1, current, 0, 0), {}
+
+        if field is not None and get(f"owner:{field}") is not None:
+            return (3, current, 0, 0), {}
+
+        changes: Dict[str, bytes] = {}
+
+        if payer is not None:
+            payer_balance = int(get(f"balance:{payer}") or payer_balance)
+
+            if payer_balance < amount:
+                return (2, current, 0, 0), {}
+
+            payer_balance -= amount
+            changes[f"balance:{payer}"] = str(payer_balance).encode()
+
+        if payee is not None:
+            payee_balance = int(get(f"balance:{payee}") or payee_balance) + amount
+            changes[f"balance:{payee}"] = str(payee_balance).encode()
+
+        if field is not None:
+            changes[f"owner:{field}"] = f"\"{owner}\"".encode()
+
+        changes["version"] = str(current + 1).encode()
+
+        return (0, current + 1, payer_balance, payee_balance), changes
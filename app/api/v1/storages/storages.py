@@ -0,0 +1,26 @@
+from app.api.v1.storages.storage import Storage
+from config import Config
+
+
+def get_storage(config: Config) -> Storage:
+    if config.storage == "redis":
+        from app.api.v1.storages.redis_storage import RedisStorage
+        return RedisStorage.from_url(config.redis_dsn.get_secret_value())
+
+    if config.storage == "sharded":
+        from app.api.v1.storages.redis_storage import RedisStorage
+        from app.api.v1.storages.sharded_storage import ShardedStorage
+        return ShardedStorage({
+            dsn.get_secret_value(): RedisStorage.from_url(dsn.get_secret_value())
+            for dsn in config.redis_shard_dsns
+        })
+
+    if config.storage == "memory":
+        from app.api.v1.storages.memory_storage import MemoryStorage
+        return MemoryStorage()
+
+    if config.storage == "sqlite":
+        from app.api.v1.storages.sqlite_storage import SqliteStorage
+        return SqliteStorage(config.sqlite_path)
+
+    raise ValueError(f"Unknown storage: {config.storage}")
@@ -2,19 +2,22 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from pydantic import ValidationError
-from redis.asyncio import Redis
 from starlette import status
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 from starlette.websockets import WebSocket
 
 from app.api.router import api_router
+from app.api.v1.connections.connection import Connection
 from app.api.v1.controllers.connections import ConnectionsController
 from app.api.v1.exceptions.http.http_error import HTTPError
 from app.api.v1.exceptions.websocket.internal_server_error import InternalServerError
 from app.api.v1.exceptions.websocket.websocket_error import WebSocketError
 from app.api.v1.logging import logger
+from app.api.v1.packets.frame import Frame
 from app.api.v1.packets.server.error import ServerErrorPacket
+from app.api.v1.storages.storage import Storage
+from app.api.v1.storages.storages import get_storage
 from app.dependencies import Dependency
 from config import Config
 
@@ -24,23 +27,30 @@ config: Config = Config(_env_file=".env")
 @asynccontextmanager
 async def lifespan(fastapi_app: FastAPI):
     database = None
-    redis: Redis = Redis.from_url(config.redis_dsn.get_secret_value())
-    connections: ConnectionsController = ConnectionsController(redis)
+    storage: Storage = get_storage(config)
+    connections: ConnectionsController = ConnectionsController(
+        storage,
+        send_queue_size=config.send_queue_size,
+        heartbeat_interval=config.heartbeat_interval,
+        heartbeat_timeout=config.heartbeat_timeout,
+        resume_timeout=config.resume_timeout
+    )
 
     await Dependency.inject(
         fastapi_app,
         config,
         database,
-        redis,
+        storage,
         connections
     )
 
-    await connections.prepare()
+    await connections.start()
 
     yield
 
-    await connections.prepare()
-    await redis.aclose()
+    await fastapi_app.state.games_controller.close()
+    await connections.close()
+    await storage.close()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -66,7 +76,16 @@ async def on_http_error(request: Request, exception: HTTPError) -> JSONResponse:
 @app.exception_handler(WebSocketError)
 async def on_websocket_error(websocket: WebSocket, exception: WebSocketError) -> None:
     try:
-        await websocket.send_text(ServerErrorPacket.from_error(exception).pack())
+        connection: Connection | None = getattr(websocket.state, "connection", None)
+        packet: ServerErrorPacket = ServerErrorPacket.from_error(exception)
+
+        if connection is not None:
+            await connection.send_final(Frame.from_packet(packet))
+        else:
+            await websocket.send_text(packet.pack())
+
+        if exception.close_code is not None:
+            await websocket.close(exception.close_code, str(exception))
 
         if isinstance(exception, InternalServerError):
             raise exception.error
@@ -1,4 +1,4 @@
-from typing import Dict, List, Any, TypeVar
+from typing import Dict, List, Any, TypeVar, Set
 
 from app.api.v1.models.response.field import FieldResponseModel
 from app.assets.enums.field_type import FieldType
@@ -11,6 +11,8 @@ class FieldsController:
     def __init__(self) -> None:
         self.__fields: List[T] = []
         self.game_instance: Any = None
+        self.__dirty: Set[int] = set()
+        self.__changed: Set[int] = set()
 
     def setup(
             self,
@@ -18,7 +20,8 @@ class FieldsController:
             *,
             game_instance: Any = None
     ) -> None:
-        self.game_instance = game_instance
+        if game_instance is not None:
+            self.game_instance = game_instance
 
         if fields is None:
             return
@@ -37,11 +40,16 @@ class FieldsController:
             *,
             index: int | None = None
     ) -> None:
+        if self.game_instance is not None:
+            field.game = self.game_instance
+
         if index is None:
             self.__fields.append(field)
         else:
             self.__fields.insert(index, field)
 
+        self.mark_dirty(field.field_id)
+
     def get(
             self,
             index: int
@@ -66,6 +74,28 @@ class FieldsController:
         except IndexError:
             return
 
+        self.__dirty.discard(index)
+        self.__changed.add(index)
+
+    def mark_dirty(
+            self,
+            field_id: int
+    ) -> None:
+        self.__dirty.add(field_id)
+        self.__changed.add(field_id)
+
+    def pop_dirty(self) -> List[T]:
+        fields: List[T] = [field for field in self.__fields if field.field_id in self.__dirty]
+        self.__dirty.clear()
+
+        return fields
+
+    def pop_changed(self) -> Set[int]:
+        changed: Set[int] = self.__changed
+        self.__changed = set()
+
+        return changed
+
     @property
     def list(self) -> List[T]:
         return self.__fields
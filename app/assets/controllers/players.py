@@ -1,5 +1,5 @@
 from random import shuffle
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Set
 from uuid import UUID
 
 from app.api.v1.controllers.connections import ConnectionsController
@@ -11,6 +11,8 @@ class PlayersController:
     def __init__(self) -> None:
         self.__players: Dict[UUID, Player] = {}
         self.__game_instance: Any = None
+        self.__dirty: Set[UUID] = set()
+        self.__changed: Set[UUID] = set()
 
     def setup(
             self,
@@ -19,7 +21,8 @@ class PlayersController:
             game_instance: Any = None,
             connections: ConnectionsController | None = None
     ) -> None:
-        self.__game_instance = game_instance
+        if game_instance is not None:
+            self.__game_instance = game_instance
 
         if players is None:
             return
@@ -42,6 +45,7 @@ class PlayersController:
         if not self.exists(player.player_id):
             player.game = self.__game_instance
             self.__players[player.player_id] = player
+            self.mark_dirty(player.player_id)
 
     def get(
             self,
@@ -73,6 +77,27 @@ class PlayersController:
     ) -> None:
         if self.exists(uuid):
             self.__players.pop(uuid)
+            self.__dirty.discard(uuid)
+            self.__changed.add(uuid)
+
+    def mark_dirty(
+            self,
+            uuid: UUID
+    ) -> None:
+        self.__dirty.add(uuid)
+        self.__changed.add(uuid)
+
+    def pop_dirty(self) -> List[Player]:
+        players: List[Player] = [self.__players[uuid] for uuid in self.__dirty if uuid in self.__players]
+        self.__dirty.clear()
+
+        return players
+
+    def pop_changed(self) -> Set[UUID]:
+        changed: Set[UUID] = self.__changed
+        self.__changed = set()
+
+        return changed
 
     @property
     def ids(self) -> List[UUID]:
@@ -28,6 +28,12 @@ class Field(MonopolyObject, ABC):
             "field_type": self.field_type.value
         }
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+
+        if not name.startswith("_") and self.game is not None:
+            self.game.fields.mark_dirty(self.field_id)
+
     @abstractmethod
     async def on_stand(
             self,
@@ -15,7 +15,7 @@ class Start(Field):
             player: Player,
             amount: int
     ) -> None:
-        player.balance += self.game.start_reward
+        await self.game.transfer(payee=player, amount=self.game.start_reward)
 
         await self.game.send(
             ServerPlayerGotStartRewardPacket(self.game.game_id, player.player_id, player.balance)
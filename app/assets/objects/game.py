@@ -1,9 +1,10 @@
 import asyncio
 import json
 from asyncio import CancelledError, Task
+from collections import deque
 from dataclasses import field as dataclass_field
 from random import randint
-from typing import Dict, Any, List, Tuple, ClassVar, Type, TypeVar
+from typing import Dict, Any, List, Tuple, ClassVar, Type, TypeVar, Set, Deque
 from uuid import UUID
 
 from pydantic import ConfigDict
@@ -11,7 +12,14 @@ from pydantic.dataclasses import dataclass
 
 from app.api.v1.controllers.connections import ConnectionsController
 from app.api.v1.controllers.redis import RedisController
+from app.api.v1.enums.transfer_status import TransferStatus
+from app.api.v1.exceptions.websocket.field_already_owned import FieldAlreadyOwnedError
+from app.api.v1.exceptions.websocket.game_invalid_action import GameInvalidActionError
+from app.api.v1.exceptions.websocket.not_enough_balance import NotEnoughBalanceError
+from app.api.v1.logging import logger
 from app.api.v1.packets.base_server import ServerPacket
+from app.api.v1.packets.frame import Frame
+from app.api.v1.packets.replay_buffer import ReplayBuffer
 from app.api.v1.packets.server.game_countdown_start import ServerGameCountdownStartPacket
 from app.api.v1.packets.server.game_countdown_stop import ServerGameCountdownStopPacket
 from app.api.v1.packets.server.game_move import ServerGameMovePacket
@@ -71,6 +79,20 @@ class Game(RedisObject):
         ActionType.CONTRACT: ContractAction
     }
 
+    GAME_ENTRY: ClassVar[str] = "game"
+    PLAYER_ENTRY: ClassVar[str] = "player:{player_id}"
+    FIELD_ENTRY: ClassVar[str] = "field:{field_id}"
+
+    VERSION_ENTRY: ClassVar[str] = "version"
+    SEQUENCE_ENTRY: ClassVar[str] = "sequence"
+    BALANCE_ENTRY: ClassVar[str] = "balance:{player_id}"
+    OWNER_ENTRY: ClassVar[str] = "owner:{field_id}"
+
+    TRANSFER_ATTEMPTS: ClassVar[int] = 3
+    SYNC_HISTORY: ClassVar[int] = 64
+    REPLAY_HISTORY: ClassVar[int] = 64
+    SEQUENCE_RESERVE: ClassVar[int] = 1024
+
     game_id: UUID
     is_started: bool = False
     round: int = 0
@@ -90,12 +112,23 @@ class Game(RedisObject):
 
     __controller_instance: RedisController | None = None
     __start_task_name: str | None = None
+    __saved_meta: Dict[str, Any] | None = None
+    __saved_entries: Set[str] | None = None
+    __ledger_version: int = 0
+    __sequence: int = 0
+    __sequence_ceiling: int = 0
+    __synced_meta: Dict[str, Any] | None = None
+    __deltas: Deque[Tuple[int, Set[str]]] | None = None
+    __replays: Dict[UUID, ReplayBuffer] | None = None
 
     def __post_init__(self):
         self.players.setup(game_instance=self)
         self.fields.setup(game_instance=self)
 
         self.__start_task_name = f"start:{self.game_id}"
+        self.__saved_entries = set()
+        self.__deltas = deque(maxlen=self.SYNC_HISTORY)
+        self.__replays = {}
 
     @classmethod
     def from_json(
@@ -109,16 +142,265 @@ class Game(RedisObject):
 
         del data["players"]
         del data["fields"]
-        data["action"] = cls.__get_field(data)
+        data["action"] = cls.__get_action(data["action"]) if data.get("action") is not None else None
 
         game: Game = cls(**data)
 
         game.players.setup(players, connections=connections)
-        game.fields.setup(fields)
+
+        for field in fields:
+            new_field: Field | None = cls.__get_field(field)
+
+            if new_field is not None:
+                game.fields.add(new_field)
+
+        return game
+
+    @classmethod
+    def from_entries(
+            cls,
+            entries: Dict[str, Any],
+            *,
+            connections: ConnectionsController | None = None
+    ) -> Any:
+        data: Dict[str, Any] = dict(entries[cls.GAME_ENTRY])
+        player_ids: List[str] = data.pop("player_ids")
+
+        data["players"] = [
+            entries[cls.PLAYER_ENTRY.format(player_id=player_id)]
+            for player_id in player_ids
+            if cls.PLAYER_ENTRY.format(player_id=player_id) in entries
+        ]
+        data["fields"] = sorted(
+            [value for entry, value in entries.items() if entry.startswith(cls.FIELD_ENTRY.format(field_id=""))],
+            key=lambda field: field["field_id"]
+        )
+
+        game: Game = cls.from_json(data, connections=connections)
+        game.apply_ledger(entries)
+        game.pop_changes()
+
+        # Resume above the persisted ceiling, which no sent frame has reached
+        game.__sequence = game.__sequence_ceiling = entries.get(cls.SEQUENCE_ENTRY, 0)
+        game.advance()
 
         return game
 
     def to_json(self) -> Dict[str, Any]:
+        return {
+            **self.__to_meta_json(),
+            "players": self.players.to_json(),
+            "fields": self.fields.to_json()
+        }
+
+    def pop_changes(self) -> Tuple[Dict[str, Any], List[str]]:
+        entries: Dict[str, Any] = {}
+        meta: Dict[str, Any] = self.__to_game_entry()
+
+        if meta != self.__saved_meta:
+            entries[self.GAME_ENTRY] = meta
+            self.__saved_meta = meta
+
+        if self.__sequence + self.SEQUENCE_RESERVE // 2 > self.__sequence_ceiling:
+            self.__sequence_ceiling = self.__sequence + self.SEQUENCE_RESERVE
+            entries[self.SEQUENCE_ENTRY] = self.__sequence_ceiling
+
+        for player in self.players.pop_dirty():
+            entries[self.PLAYER_ENTRY.format(player_id=player.player_id)] = player.to_json()
+
+        for field in self.fields.pop_dirty():
+            entries[self.FIELD_ENTRY.format(field_id=field.field_id)] = field.to_json()
+
+        current: Set[str] = {
+            self.GAME_ENTRY,
+            *[self.PLAYER_ENTRY.format(player_id=player_id) for player_id in self.players.ids],
+            *[self.FIELD_ENTRY.format(field_id=field.field_id) for field in self.fields.list]
+        }
+
+        removed: List[str] = list(self.__saved_entries - current)
+        self.__saved_entries = current
+
+        return entries, removed
+
+    def to_entries(self) -> Dict[str, Any]:
+        return {
+            self.GAME_ENTRY: self.__to_game_entry(),
+            **{self.PLAYER_ENTRY.format(player_id=player.player_id): player.to_json() for player in self.players.list},
+            **{self.FIELD_ENTRY.format(field_id=field.field_id): field.to_json() for field in self.fields.list}
+        }
+
+    @property
+    def sequence(self) -> int:
+        return self.__sequence
+
+    @property
+    def is_sequence_reserved(self) -> bool:
+        return self.__sequence < self.__sequence_ceiling
+
+    def advance(
+            self,
+            *,
+            force: bool = False
+    ) -> int:
+        changed: Set[str] = {
+            *[self.PLAYER_ENTRY.format(player_id=player_id) for player_id in self.players.pop_changed()],
+            *[self.FIELD_ENTRY.format(field_id=field_id) for field_id in self.fields.pop_changed()]
+        }
+        meta: Dict[str, Any] = self.__to_game_entry()
+
+        if meta != self.__synced_meta:
+            changed.add(self.GAME_ENTRY)
+            self.__synced_meta = meta
+
+        if changed or force:
+            self.__sequence += 1
+            self.__deltas.append((self.__sequence, changed))
+
+        return self.__sequence
+
+    def record(
+            self,
+            player_id: UUID,
+            frame: Frame
+    ) -> None:
+        replay: ReplayBuffer | None = self.__replays.get(player_id)
+
+        if replay is None:
+            replay = self.__replays[player_id] = ReplayBuffer(self.REPLAY_HISTORY)
+
+        replay.append(frame)
+
+    def get_replay(
+            self,
+            player_id: UUID,
+            sequence: int
+    ) -> List[Frame] | None:
+        replay: ReplayBuffer | None = self.__replays.get(player_id)
+
+        if replay is None or sequence > self.__sequence:
+            return None
+
+        return replay.get_since(sequence)
+
+    def get_delta(
+            self,
+            version: int
+    ) -> Tuple[bool, Dict[str, Any], List[str]]:
+        self.advance()
+
+        if version == self.__sequence:
+            return False, {}, []
+
+        entries: Dict[str, Any] = self.to_entries()
+
+        if version > self.__sequence or not self.__deltas or version < self.__deltas[0][0] - 1:
+            return True, entries, []
+
+        changed: Set[str] = set().union(*[delta for sequence, delta in self.__deltas if sequence > version])
+
+        return (
+            False,
+            {entry: entries[entry] for entry in changed if entry in entries},
+            [entry for entry in changed if entry not in entries]
+        )
+
+    @classmethod
+    def is_ledger_entry(
+            cls,
+            entry: str
+    ) -> bool:
+        return (
+                entry == cls.VERSION_ENTRY
+                or entry.startswith(cls.BALANCE_ENTRY.format(player_id=""))
+                or entry.startswith(cls.OWNER_ENTRY.format(field_id=""))
+        )
+
+    def apply_ledger(
+            self,
+            entries: Dict[str, Any]
+    ) -> None:
+        self.__ledger_version = entries.get(self.VERSION_ENTRY, 0)
+
+        for player in self.players.list:
+            balance: int | None = entries.get(self.BALANCE_ENTRY.format(player_id=player.player_id))
+
+            if balance is not None and balance != player.balance:
+                player.balance = balance
+
+        for field in self.fields.list:
+            owner_id: str | None = entries.get(self.OWNER_ENTRY.format(field_id=field.field_id))
+
+            if isinstance(field, Company) and owner_id is not None and field.owner_id != UUID(owner_id):
+                field.owner_id = UUID(owner_id)
+
+    @property
+    def ledger_version(self) -> int:
+        return self.__ledger_version
+
+    async def transfer(
+            self,
+            *,
+            payer: Player | None = None,
+            payee: Player | None = None,
+            amount: int = 0,
+            field: Company | None = None
+    ) -> None:
+        for _ in range(self.TRANSFER_ATTEMPTS):
+            status, version, payer_balance, payee_balance = await self.controller.transfer(
+                self,
+                payer=payer,
+                payee=payee,
+                amount=amount,
+                field=field
+            )
+
+            if status == TransferStatus.CONFLICT:
+                await self.controller.refresh_ledger(self)
+                continue
+
+            if status == TransferStatus.NOT_ENOUGH_BALANCE:
+                raise NotEnoughBalanceError("Player has insufficient balance")
+
+            if status == TransferStatus.FIELD_ALREADY_OWNED:
+                raise FieldAlreadyOwnedError("Provided field is already owned")
+
+            self.__ledger_version = version
+
+            if payer is not None:
+                payer.balance = payer_balance
+            if payee is not None:
+                payee.balance = payee_balance
+            if field is not None:
+                field.owner_id = payer.player_id
+
+            return
+
+        raise GameInvalidActionError("Game with provided UUID was modified concurrently")
+
+    def mark_unsaved(self) -> None:
+        self.__saved_meta = None
+        self.__sequence_ceiling = 0
+
+        for player in self.players.list:
+            self.players.mark_dirty(player.player_id)
+
+        for field in self.fields.list:
+            self.fields.mark_dirty(field.field_id)
+
+    @property
+    def is_turn_over(self) -> bool:
+        if not self.is_started or self.action is None or self.action.action_type == ActionType.MOVE:
+            return True
+
+        if self.__saved_meta is None:
+            return True
+
+        return (self.__saved_meta["round"], self.__saved_meta["move"]) != (self.round, self.move)
+
+    def __to_game_entry(self) -> Dict[str, Any]:
+        return {**self.__to_meta_json(), "player_ids": [str(player_id) for player_id in self.players.ids]}
+
+    def __to_meta_json(self) -> Dict[str, Any]:
         return {
             "game_id": str(self.game_id),
             "is_started": self.is_started,
@@ -130,17 +412,19 @@ class Game(RedisObject):
             "start_delay": self.start_delay,
             "start_bonus": self.start_bonus,
             "start_reward": self.start_reward,
-            "start_bonus_round_amount": self.start_bonus_round_amount,
-            "players": self.players.to_json(),
-            "fields": self.fields.to_json()
+            "start_bonus_round_amount": self.start_bonus_round_amount
         }
 
     async def send(
             self,
-            packet: ServerPacket
+            packet: ServerPacket,
+            *,
+            recipients: List[UUID] | None = None
     ) -> None:
-        for player in self.players.list:
-            await player.send(packet)
+        await self.controller.broadcast(self, packet, recipients=recipients)
+
+    async def save(self) -> None:
+        await self.controller.save_game(self)
 
     @property
     def controller(self) -> RedisController:
@@ -166,9 +450,26 @@ class Game(RedisObject):
     async def __delayed_start(self) -> None:
         try:
             await asyncio.sleep(self.start_delay)
-            await self.start()
+
+            if self.controller is None:
+                await self.start()
+            else:
+                await self.controller.execute(self.game_id, self.start)
         except CancelledError:
             pass
+        except Exception as e:
+            logger.error(f"Failed to start game {self.game_id}: {e}")
+
+            if self.controller is None:
+                await self.__abort_start()
+            else:
+                await self.controller.execute(self.game_id, self.__abort_start)
+
+    async def __abort_start(self) -> None:
+        self.is_started = False
+        self.action = None
+
+        await self.send(ServerGameCountdownStopPacket(self.game_id))
 
     async def start_countdown(self) -> None:
         task: Task | None = self.get_start_task()
@@ -176,11 +477,9 @@ class Game(RedisObject):
         if task is not None:
             task.cancel()
 
-        task: Task = asyncio.create_task(self.__delayed_start(), name=self.__start_task_name)
+        asyncio.create_task(self.__delayed_start(), name=self.__start_task_name)
         await self.send(ServerGameCountdownStartPacket(self.game_id, self.start_delay))
 
-        await task
-
     async def stop_countdown(self) -> None:
         await self.send(ServerGameCountdownStopPacket(self.game_id))
 
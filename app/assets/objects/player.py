@@ -3,8 +3,8 @@ from uuid import UUID
 
 from pydantic import ConfigDict
 from pydantic.dataclasses import dataclass
-from starlette.websockets import WebSocket
 
+from app.api.v1.connections.connection import Connection
 from app.api.v1.exceptions.websocket.field_already_owned import FieldAlreadyOwnedError
 from app.api.v1.exceptions.websocket.field_not_found import FieldNotFoundError
 from app.api.v1.exceptions.websocket.field_not_owned import FieldNotOwnedError
@@ -12,6 +12,7 @@ from app.api.v1.exceptions.websocket.game_invalid_action import GameInvalidActio
 from app.api.v1.exceptions.websocket.invalid_field_type import InvalidFieldTypeError
 from app.api.v1.exceptions.websocket.not_enough_balance import NotEnoughBalanceError
 from app.api.v1.packets.base_server import ServerPacket
+from app.api.v1.packets.frame import Frame
 from app.api.v1.packets.server.player_buy_field import ServerPlayerBuyFieldPacket
 from app.api.v1.packets.server.player_got_start_bonus import ServerPlayerGotStartBonusPacket
 from app.api.v1.packets.server.player_move import ServerPlayerMovePacket
@@ -40,7 +41,7 @@ class Player(MonopolyObject):
     double_amount: int = 0
     contract_amount: int = 0
 
-    __connection_instance: WebSocket | None = None
+    __connection_instance: Connection | None = None
     __game_instance: Any = None
 
     @classmethod
@@ -60,19 +61,37 @@ class Player(MonopolyObject):
             "contract_amount": self.contract_amount
         }
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+
+        if not name.startswith("_") and self.game is not None:
+            self.game.players.mark_dirty(self.player_id)
+
     async def send(
             self,
             packet: ServerPacket
     ) -> None:
-        if self.connection is not None:
-            await self.connection.send_text(packet.pack())
+        if self.game is not None:
+            await self.game.send(packet, recipients=[self.player_id])
+        elif self.connection is not None:
+            self.connection.send(Frame.from_packet(packet))
+
+    def detach_connection(
+            self,
+            connection: Connection
+    ) -> None:
+        if self.__connection_instance is connection:
+            self.__connection_instance = None
 
     @property
-    def connection(self) -> WebSocket | None:
+    def connection(self) -> Connection | None:
+        if self.__connection_instance is not None and self.__connection_instance.is_closed:
+            self.__connection_instance = None
+
         return self.__connection_instance
 
     @connection.setter
-    def connection(self, value: WebSocket | None) -> None:
+    def connection(self, value: Connection | None) -> None:
         self.__connection_instance = value
 
     @property
@@ -112,7 +131,7 @@ class Player(MonopolyObject):
         await self.game.send(ServerPlayerMovePacket(self.game.game_id, self.player_id, dices, self.field))
 
         if got_start_bonus:
-            self.balance += amount
+            await self.game.transfer(payee=self, amount=amount)
             await self.game.send(ServerPlayerGotStartBonusPacket(self.game.game_id, self.player_id, self.balance))
 
         field: Field = self.game.fields.get(self.field)
@@ -136,8 +155,7 @@ class Player(MonopolyObject):
         if field.cost > self.balance:
             raise NotEnoughBalanceError("Player has insufficient balance")
 
-        field.owner_id = self.player_id
-        self.balance -= field.cost
+        await self.game.transfer(payer=self, amount=field.cost, field=field)
 
         await self.game.send(
             ServerPlayerBuyFieldPacket(
@@ -176,8 +194,7 @@ class Player(MonopolyObject):
 
         owner: Player = self.game.players.get(field.owner_id)
 
-        self.balance -= action.amount
-        owner.balance += action.amount
+        await self.game.transfer(payer=self, payee=owner, amount=action.amount)
 
         await self.game.send(
             ServerPlayerPayRentPacket(
@@ -210,7 +227,7 @@ class Player(MonopolyObject):
         if action.amount > self.balance:
             raise NotEnoughBalanceError("Player has insufficient balance")
 
-        self.balance -= action.amount
+        await self.game.transfer(payer=self, amount=action.amount)
 
         await self.game.send(
             ServerPlayerPayTaxPacket(self.game.game_id, self.player_id, self.balance)
@@ -0,0 +1,195 @@
+import json
+import zlib
+from enum import StrEnum
+from hashlib import blake2b
+from typing import Any, Dict, List, Tuple, Type
+from uuid import UUID
+
+import msgpack
+
+from app.api.v1.codecs.codec import Codec
+from app.assets.enums.action_type import ActionType
+from app.assets.enums.field_type import FieldType
+from app.assets.parameters import Parameters
+
+
+class GameSnapshotCodec(Codec):
+    NAME = "binary"
+
+    MAGIC = b"\x00"
+    VERSION = 2
+    MAP_DIGEST_SIZE = 8
+
+    COMPRESSED = 0b1
+
+    KEYS: Dict[int, Tuple[str, ...]] = {
+        1: (
+            "game_id", "is_started", "action", "round", "move", "min_players", "max_players", "start_delay",
+            "start_bonus", "start_reward", "start_bonus_round_amount", "player_ids",
+            "action_type", "amount", "cost", "player",
+            "player_id", "username", "balance", "field", "is_ready", "is_playing", "is_imprisoned",
+            "double_amount", "contract_amount",
+            "field_id", "field_type", "company", "tax",
+            "owner_id", "is_monopoly", "field_dependant", "dice_dependant", "rent", "mortgage", "filiation",
+            "mortgage_cost", "buyout_cost", "filiation_cost", "tax_amount"
+        )
+    }
+    KEYS[2] = KEYS[1]
+
+    UUID_KEYS: Tuple[str, ...] = ("game_id", "player_id", "owner_id")
+    UUID_LIST_KEYS: Tuple[str, ...] = ("player_ids",)
+    ENUM_KEYS: Dict[str, Type[StrEnum]] = {"action_type": ActionType, "field_type": FieldType}
+    TEMPLATE_KEYS: Tuple[str, ...] = ("company", "tax")
+
+    def __init__(
+            self,
+            *,
+            fallback: Codec,
+            compression_threshold: int = 512,
+            map_path: str = Parameters.DEFAULT_MAP_PATH
+    ) -> None:
+        self.__fallback = fallback
+        self.__compression_threshold = compression_threshold
+        self.__templates, self.__map_digest = self.__load_templates(map_path)
+
+        self.__key_ids: Dict[str, int] = {key: index for index, key in enumerate(self.KEYS[self.VERSION])}
+        self.__enum_values: Dict[str, List[str]] = {key: [item.value for item in enum] for key, enum in self.ENUM_KEYS.items()}
+        self.__enum_ids: Dict[str, Dict[str, int]] = {
+            key: {value: index for index, value in enumerate(values)} for key, values in self.__enum_values.items()
+        }
+
+    def encode(self, value: Any) -> bytes:
+        payload: bytes = msgpack.packb(self.__compact(value), use_bin_type=True)
+        flags: int = 0
+
+        if len(payload) > self.__compression_threshold:
+            compressed: bytes = zlib.compress(payload)
+
+            if len(compressed) < len(payload):
+                payload = compressed
+                flags |= self.COMPRESSED
+
+        return self.MAGIC + bytes((self.VERSION, flags)) + self.__map_digest + payload
+
+    def decode(self, data: str | bytes) -> Any:
+        if isinstance(data, str) or not data.startswith(self.MAGIC):
+            return self.__fallback.decode(data)
+
+        version: int = data[1]
+        flags: int = data[2]
+        payload: bytes = data[3:]
+
+        if version not in self.KEYS:
+            raise ValueError(f"Unsupported snapshot version: {version}")
+
+        if version >= 2:
+            digest, payload = payload[:self.MAP_DIGEST_SIZE], payload[self.MAP_DIGEST_SIZE:]
+
+            if digest != self.__map_digest:
+                raise ValueError(f"Snapshot was encoded against another map: {digest.hex()}")
+
+        if flags & self.COMPRESSED:
+            payload = zlib.decompress(payload)
+
+        return self.__expand(msgpack.unpackb(payload, raw=False, strict_map_key=False), self.KEYS[version])
+
+    def __compact(
+            self,
+            value: Any,
+            key: str | None = None
+    ) -> Any:
+        if value is None:
+            return None
+
+        if isinstance(value, dict):
+            template: Dict[str, Any] = self.__get_template(value)
+
+            return {
+                self.__key_ids.get(item_key, item_key): self.__compact(
+                    self.__strip_template(item_value, template.get(item_key)) if item_key in self.TEMPLATE_KEYS else item_value,
+                    item_key
+                )
+                for item_key, item_value in value.items()
+            }
+
+        if isinstance(value, list):
+            if key in self.UUID_LIST_KEYS:
+                return [UUID(item).bytes for item in value]
+            return [self.__compact(item) for item in value]
+
+        if key in self.UUID_KEYS:
+            return UUID(str(value)).bytes
+
+        if key in self.ENUM_KEYS:
+            return self.__enum_ids[key][value]
+
+        return value
+
+    def __expand(
+            self,
+            value: Any,
+            keys: Tuple[str, ...],
+            key: str | None = None
+    ) -> Any:
+        if value is None:
+            return None
+
+        if isinstance(value, dict):
+            expanded: Dict[str, Any] = {
+                keys[item_key] if isinstance(item_key, int) else item_key: item_value
+                for item_key, item_value in value.items()
+            }
+            expanded = {item_key: self.__expand(item_value, keys, item_key) for item_key, item_value in expanded.items()}
+            template: Dict[str, Any] = self.__get_template(expanded)
+
+            for template_key in self.TEMPLATE_KEYS:
+                if template_key in expanded and isinstance(template.get(template_key), dict):
+                    expanded[template_key] = {**template[template_key], **expanded[template_key]}
+
+            return expanded
+
+        if isinstance(value, list):
+            if key in self.UUID_LIST_KEYS:
+                return [str(UUID(bytes=item)) for item in value]
+            return [self.__expand(item, keys) for item in value]
+
+        if key in self.UUID_KEYS and isinstance(value, bytes):
+            return str(UUID(bytes=value))
+
+        if key in self.ENUM_KEYS:
+            return self.__enum_values[key][value]
+
+        return value
+
+    def __get_template(
+            self,
+            value: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        field_id: Any = value.get("field_id")
+
+        if not isinstance(field_id, int) or not 0 <= field_id < len(self.__templates):
+            return {}
+
+        template: Dict[str, Any] = self.__templates[field_id]
+
+        if template.get("field_type") != value.get("field_type"):
+            return {}
+
+        return template
+
+    @staticmethod
+    def __strip_template(
+            value: Any,
+            template: Any
+    ) -> Any:
+        if not isinstance(value, dict) or not isinstance(template, dict):
+            return value
+
+        return {key: item for key, item in value.items() if key not in template or template[key] != item}
+
+    @classmethod
+    def __load_templates(cls, map_path: str) -> Tuple[List[Dict[str, Any]], bytes]:
+        with open(map_path, "rb") as file:
+            content: bytes = file.read()
+
+        return json.loads(content), blake2b(content, digest_size=cls.MAP_DIGEST_SIZE).digest()
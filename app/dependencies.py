@@ -1,11 +1,13 @@
 from fastapi import FastAPI
-from redis.asyncio import Redis
 from starlette.requests import Request
 from starlette.websockets import WebSocket
 
+from app.api.v1.codecs.codecs import get_snapshot_codec
 from app.api.v1.controllers.connections import ConnectionsController
 from app.api.v1.controllers.games import GamesController
 from app.api.v1.controllers.users import UsersController
+from app.api.v1.enums.durability import Durability
+from app.api.v1.storages.storage import Storage
 from config import Config
 
 
@@ -15,18 +17,35 @@ class Dependency:
             fastapi_app: FastAPI,
             config: Config,
             database,
-            redis: Redis,
+            storage: Storage,
             connections: ConnectionsController
     ) -> None:
         fastapi_app.state.config = config
         fastapi_app.state.database = database
-        fastapi_app.state.redis = redis
+        fastapi_app.state.storage = storage
         fastapi_app.state.connections = connections
 
-        users_controller = UsersController(redis)
-        games_controller = GamesController(redis)
-        await users_controller.retrieve_users()
-        await games_controller.retrieve_games(connections)
+        users_controller = UsersController(storage)
+        games_controller = GamesController(
+            storage,
+            value_codec=get_snapshot_codec(
+                config.snapshot_format,
+                compression_threshold=config.snapshot_compression_threshold
+            ),
+            connections=connections,
+            durability=Durability(config.durability),
+            write_behind_delay=config.write_behind_delay,
+            write_behind_interval=config.write_behind_interval,
+            cache_size=config.game_cache_size
+        )
+
+        await users_controller.prepare()
+        await games_controller.prepare()
+        await games_controller.migrate_snapshots()
+
+        await users_controller.retrieve_users(chunk_size=config.hydration_chunk_size)
+        await games_controller.retrieve_games(connections, chunk_size=config.hydration_chunk_size)
+        await games_controller.start()
 
         fastapi_app.state.users_controller = users_controller
         fastapi_app.state.games_controller = games_controller
@@ -40,8 +59,8 @@ class Dependency:
         return request.app.state.database
 
     @staticmethod
-    async def redis(request: Request) -> Redis:
-        return request.app.state.redis
+    async def storage(request: Request) -> Storage:
+        return request.app.state.storage
 
     @staticmethod
     async def users_controller(request: Request) -> 'UsersController':
@@ -60,8 +79,8 @@ class Dependency:
         return websocket.app.state.database
 
     @staticmethod
-    async def redis_websocket(websocket: WebSocket) -> Redis:
-        return websocket.app.state.redis
+    async def storage_websocket(websocket: WebSocket) -> Storage:
+        return websocket.app.state.storage
 
     @staticmethod
     async def users_controller_websocket(websocket: WebSocket) -> 'UsersController':
@@ -0,0 +1,4 @@
+import os
+
+for variable in ("API_KEY", "JWT_KEY", "DATABASE_DSN", "REDIS_DSN"):
+    os.environ.setdefault(variable, "bench")
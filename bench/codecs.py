@@ -0,0 +1,84 @@
+from argparse import ArgumentParser, Namespace
+from typing import Any, Dict, List, Tuple
+from uuid import uuid4
+
+from app.api.v1.codecs.codec import Codec
+from app.api.v1.codecs.codecs import codec, get_codec
+from app.api.v1.codecs.msgpack_codec import MsgpackCodec
+from app.api.v1.packets.server.game_sync import ServerGameSyncPacket
+from app.api.v1.packets.server.player_move import ServerPlayerMovePacket
+from app.api.v1.packets.server.player_pay_rent import ServerPlayerPayRentPacket
+from app.assets.objects.game import Game
+from app.assets.objects.player import Player
+from bench.timer import measure
+
+
+def get_codecs() -> List[Codec]:
+    codecs: List[Codec] = []
+
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            print(f"{name} is not installed, skipping")
+
+    codecs.append(MsgpackCodec())
+    return codecs
+
+
+def get_game(players: int) -> Game:
+    game: Game = Game(uuid4())
+
+    for index in range(players):
+        game.players.add(Player(uuid4(), username=f"player{index}"))
+
+    game.fields = game.get_map(game.map_path)
+    game.is_started = True
+
+    return game
+
+
+def get_payloads(game: Game) -> List[Tuple[str, List[Any]]]:
+    player_id, owner_id = game.players.ids[:2]
+
+    packets: List[Tuple[str, Any]] = [
+        ("player_move", ServerPlayerMovePacket(game.game_id, player_id, (3, 4), 7)),
+        ("player_pay_rent", ServerPlayerPayRentPacket(game.game_id, player_id, owner_id, 7, 1200, 3400)),
+        ("game_sync", ServerGameSyncPacket(game.game_id, 1, True, game.to_entries(), []))
+    ]
+
+    return [
+        *[(f"packet {name}", [codec.decode(packet.pack())]) for name, packet in packets],
+        ("snapshot to_json", [game.to_json()]),
+        ("snapshot entries", list(game.to_entries().values()))
+    ]
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description="Codec encode/decode cost on real packets and game snapshots")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--number", type=int, default=2000)
+    arguments: Namespace = parser.parse_args()
+
+    codecs: List[Codec] = get_codecs()
+    print(f"default codec: {codec.NAME}")
+
+    for payload_name, values in get_payloads(get_game(arguments.players)):
+        print(payload_name)
+
+        for value_codec in codecs:
+            encoded: List[bytes] = [value_codec.encode(value) for value in values]
+            assert [value_codec.decode(data) for data in encoded] == values, f"{value_codec.NAME} does not round-trip"
+
+            encode: float = measure(lambda: [value_codec.encode(value) for value in values], number=arguments.number)
+            decode: float = measure(lambda: [value_codec.decode(data) for data in encoded], number=arguments.number)
+            size: int = sum(len(data) for data in encoded)
+
+            print(
+                f"  {value_codec.NAME:<8} encode {encode * 1e6:9.2f}us  decode {decode * 1e6:9.2f}us  "
+                f"{size:>7} bytes"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import asyncio
+from argparse import ArgumentParser, Namespace
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+from uuid import UUID, uuid4
+
+from app.api.v1.controllers.connections import ConnectionsController
+from app.api.v1.controllers.redis import RedisController
+from app.api.v1.storages.storage import Storage
+from app.assets.objects.user import User
+from bench.storages import get_bench_storage
+
+
+class BenchWebSocket:
+    def __init__(
+            self,
+            port: int
+    ) -> None:
+        self.client: Tuple[str, int] = ("127.0.0.1", port)
+        self.state: SimpleNamespace = SimpleNamespace()
+
+    async def send_text(self, data: str) -> None:
+        pass
+
+    async def send_bytes(self, data: bytes) -> None:
+        pass
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        pass
+
+
+class DocumentRegistry(RedisController):
+    REDIS_KEY = "bench:connections"
+
+    async def add_connection(
+            self,
+            websocket: BenchWebSocket,
+            user: User
+    ) -> None:
+        connections: Dict[str, str] = await self.get(self.REDIS_KEY) or {}
+        connections[f"{websocket.client[0]}:{websocket.client[1]}"] = str(user.user_id)
+
+        await self.set(self.REDIS_KEY, connections)
+
+    async def remove_connection(
+            self,
+            websocket: BenchWebSocket
+    ) -> None:
+        connections: Dict[str, str] = await self.get(self.REDIS_KEY) or {}
+        connections.pop(f"{websocket.client[0]}:{websocket.client[1]}", None)
+
+        await self.set(self.REDIS_KEY, connections)
+
+    async def count(self) -> int:
+        return len(await self.get(self.REDIS_KEY) or {})
+
+
+async def timed(
+        func: Callable[[], Awaitable[Any]],
+        latencies: List[float]
+) -> None:
+    started: float = perf_counter()
+    await func()
+    latencies.append(perf_counter() - started)
+
+
+async def run_concurrently(
+        jobs: List[Callable[[], Awaitable[Any]]]
+) -> Tuple[float, List[float]]:
+    latencies: List[float] = []
+    started: float = perf_counter()
+
+    await asyncio.gather(*(timed(job, latencies) for job in jobs))
+
+    return perf_counter() - started, sorted(latencies)
+
+
+def report(
+        name: str,
+        elapsed: float,
+        latencies: List[float],
+        remaining: int
+) -> None:
+    amount: int = len(latencies)
+    p50: float = latencies[amount // 2]
+    p99: float = latencies[min(amount - 1, amount * 99 // 100)]
+
+    print(
+        f"{name:<24} {amount / elapsed:>10.0f}/s  p50 {p50 * 1e3:8.2f}ms  p99 {p99 * 1e3:8.2f}ms  "
+        f"registry entries {remaining}"
+    )
+
+
+async def bench_document(
+        storage: Storage,
+        users: List[User],
+        websockets: List[BenchWebSocket]
+) -> None:
+    registry: DocumentRegistry = DocumentRegistry(storage)
+
+    elapsed, latencies = await run_concurrently([
+        lambda user=user, websocket=websocket: registry.add_connection(websocket, user)
+        for user, websocket in zip(users, websockets)
+    ])
+    report("document connect", elapsed, latencies, await registry.count())
+
+    elapsed, latencies = await run_concurrently([
+        lambda websocket=websocket: registry.remove_connection(websocket)
+        for websocket in websockets
+    ])
+    report("document disconnect", elapsed, latencies, await registry.count())
+
+
+async def bench_hash(
+        storage: Storage,
+        users: List[User],
+        websockets: List[BenchWebSocket]
+) -> None:
+    connections: ConnectionsController = ConnectionsController(storage)
+
+    elapsed, latencies = await run_concurrently([
+        lambda user=user, websocket=websocket: connections.add_connection(websocket, user)
+        for user, websocket in zip(users, websockets)
+    ])
+    registered: Dict[str, Any] = await storage.get_hash(connections._key(connections.REDIS_KEY))
+    report("hash connect", elapsed, latencies, len(registered))
+
+    user_ids: List[UUID] = [user.user_id for user in users]
+
+    elapsed, latencies = await run_concurrently([
+        lambda user_id=user_id: connections.remove_connection(user_id)
+        for user_id in user_ids
+    ])
+    registered = await storage.get_hash(connections._key(connections.REDIS_KEY))
+    report("hash disconnect", elapsed, latencies, len(registered))
+
+
+async def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description="Concurrent websocket connects against the registry")
+    parser.add_argument("--storage", default="fakeredis", choices=("memory", "sqlite", "redis", "fakeredis"))
+    parser.add_argument("--sqlite-path", default=":memory:")
+    parser.add_argument("--connections", type=int, default=10000)
+    arguments: Namespace = parser.parse_args()
+
+    for bench in (bench_document, bench_hash):
+        storage: Storage = get_bench_storage(arguments.storage, sqlite_path=arguments.sqlite_path)
+        users: List[User] = [User(uuid4(), f"user{index}") for index in range(arguments.connections)]
+        websockets: List[BenchWebSocket] = [BenchWebSocket(10000 + index) for index in range(arguments.connections)]
+
+        await bench(storage, users, websockets)
+        await storage.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+import asyncio
+from argparse import ArgumentParser, Namespace
+from inspect import getfullargspec
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import uuid4
+
+from app.api.v1.controllers.connections import ConnectionsController
+from app.api.v1.controllers.games import GamesController
+from app.api.v1.packets.client.game_sync import ClientGameSyncPacket
+from app.api.v1.packets.client.ping import ClientPingPacket
+from app.api.v1.routes.websocket.games import games_packets_router
+from app.api.v1.routes.websocket.handler_plan import HandlerPlan
+from app.api.v1.storages.storage import Storage
+from app.assets.objects.game import Game
+from app.assets.objects.player import Player
+from app.assets.objects.user import User
+from bench.storages import get_bench_storage
+from bench.timer import measure_async
+
+
+class ReflectiveDispatcher:
+    """Argument resolution as PacketsRouter did it before handlers were compiled into plans."""
+
+    async def resolve(
+            self,
+            handler: Callable,
+            **kwargs: Any
+    ) -> Dict[str, Any]:
+        handler_dependencies: Dict[str, Any] = await self.__inject_dependencies(handler, **kwargs)
+        return self.__prepare_args(handler, **handler_dependencies, **kwargs)
+
+    async def __inject_dependencies(
+            self,
+            handler: Callable,
+            **kwargs: Any
+    ) -> Dict[str, Any]:
+        handler_dependencies: Dict[str, Any] = {}
+
+        if not hasattr(handler, "__annotations__"):
+            return handler_dependencies
+
+        for name, annotation in getattr(handler, "__annotations__").items():
+            if not hasattr(annotation, "__metadata__"):
+                continue
+
+            func: Callable = annotation.__metadata__[0]
+            func_dependencies: Dict[str, Any] = await self.__inject_dependencies(func, **kwargs)
+            prepared_args: Dict[str, Any] = self.__prepare_args(func, **func_dependencies, **kwargs)
+
+            handler_dependencies.update({name: await func(**prepared_args)})
+
+        return handler_dependencies
+
+    @staticmethod
+    def __prepare_args(
+            func: Callable,
+            **kwargs: Any
+    ) -> Dict[str, Any]:
+        args: Tuple[str, ...] = tuple(getfullargspec(func)[0])
+
+        return {
+            k: arg for k, arg in kwargs.items()
+            if k in args
+        }
+
+
+async def prepare_context(
+        storage: Storage
+) -> Tuple[Dict[str, Any], Game]:
+    games_controller: GamesController = GamesController(storage)
+    connections: ConnectionsController = ConnectionsController(storage)
+    user: User = User(uuid4(), "bench")
+
+    game: Game = await games_controller.create_game()
+    game.players.add(Player(user.user_id, username=user.username))
+
+    context: Dict[str, Any] = {
+        "storage": storage,
+        "connections": connections,
+        "games_controller": games_controller,
+        "connection": None,
+        "user": user,
+        "websocket": None,
+        "router": None
+    }
+
+    return context, game
+
+
+async def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description="Handler argument resolution: reflection versus HandlerPlan")
+    parser.add_argument("--number", type=int, default=20000)
+    arguments: Namespace = parser.parse_args()
+
+    storage: Storage = get_bench_storage("memory")
+    context, game = await prepare_context(storage)
+    dispatcher: ReflectiveDispatcher = ReflectiveDispatcher()
+
+    plans: Dict[type, HandlerPlan] = games_packets_router._PacketsRouter__handlers
+    cases: List[Tuple[str, HandlerPlan, Dict[str, Any]]] = [
+        ("ping", plans[ClientPingPacket], {**context, "packet": ClientPingPacket()}),
+        ("game_sync", plans[ClientGameSyncPacket], {**context, "packet": ClientGameSyncPacket(game.game_id, 0)})
+    ]
+
+    for name, plan, handler_context in cases:
+        handler: Callable = plan.func
+
+        reflective: float = await measure_async(
+            lambda: dispatcher.resolve(handler, **handler_context),
+            number=arguments.number
+        )
+        planned: float = await measure_async(lambda: plan.resolve(handler_context), number=arguments.number)
+
+        print(
+            f"{name:<12} reflection {reflective * 1e6:8.2f}us  plan {planned * 1e6:8.2f}us  "
+            f"speedup {reflective / planned:6.1f}x"
+        )
+
+    await storage.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+from argparse import ArgumentParser, Namespace
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import uuid4
+
+from app.api.v1.enums.frame_encoding import FrameEncoding
+from app.api.v1.packets.base_server import ServerPacket
+from app.api.v1.packets.server.player_move import ServerPlayerMovePacket
+from app.api.v1.packets.server.player_pay_rent import ServerPlayerPayRentPacket
+from bench.timer import measure
+
+
+def move_to_json(packet: ServerPlayerMovePacket) -> Dict[str, Any]:
+    return {
+        "game_id": str(packet.game_id),
+        "player_id": str(packet.player_id),
+        "dices": list(packet.dices),
+        "field": packet.field
+    }
+
+
+def pay_rent_to_json(packet: ServerPlayerPayRentPacket) -> Dict[str, Any]:
+    return {
+        "game_id": str(packet.game_id),
+        "player_id": str(packet.player_id),
+        "owner_id": str(packet.owner_id),
+        "field": packet.field,
+        "player_balance": packet.player_balance,
+        "owner_balance": packet.owner_balance
+    }
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description="Compiled server packet encoders versus the generic pack_data path")
+    parser.add_argument("--number", type=int, default=100000)
+    arguments: Namespace = parser.parse_args()
+
+    game_id, player_id, owner_id = uuid4(), uuid4(), uuid4()
+
+    cases: List[Tuple[ServerPacket, Callable[[Any], Dict[str, Any]]]] = [
+        (ServerPlayerMovePacket(game_id, player_id, (3, 4), 7), move_to_json),
+        (ServerPlayerPayRentPacket(game_id, player_id, owner_id, 7, 1200, 3400), pay_rent_to_json)
+    ]
+
+    for packet, to_json in cases:
+        for encoding in (FrameEncoding.JSON, FrameEncoding.MSGPACK):
+            def generic() -> str | bytes:
+                return ServerPacket.pack_data(packet.PACKET_TAG, to_json(packet), encoding)
+
+            def compiled() -> str | bytes:
+                return packet.pack(encoding)
+
+            assert generic() == compiled(), f"{packet.PACKET_TAG} {encoding.value} output differs"
+
+            before: float = measure(generic, number=arguments.number)
+            after: float = measure(compiled, number=arguments.number)
+
+            print(
+                f"{packet.PACKET_TAG:<16} {encoding.value:<8} generic {before * 1e6:6.2f}us  "
+                f"compiled {after * 1e6:6.2f}us  speedup {before / after:5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
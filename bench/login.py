@@ -0,0 +1,63 @@
+import asyncio
+from argparse import ArgumentParser, Namespace
+from random import sample
+from time import perf_counter
+from typing import List
+
+from app.api.v1.controllers.users import UsersController
+from app.api.v1.storages.storage import Storage
+from bench.storages import get_bench_storage
+from bench.timer import measure_async
+
+
+async def seed(
+        storage: Storage,
+        amount: int
+) -> List[str]:
+    users_controller: UsersController = UsersController(storage)
+    usernames: List[str] = [f"user{index}" for index in range(amount)]
+
+    for username in usernames:
+        await users_controller.create_user(username=username)
+
+    return usernames
+
+
+async def bench_count(
+        arguments: Namespace,
+        amount: int
+) -> None:
+    storage: Storage = get_bench_storage(arguments.storage, sqlite_path=arguments.sqlite_path)
+    usernames: List[str] = await seed(storage, amount)
+    lookups: List[str] = sample(usernames, min(arguments.lookups, amount))
+
+    users_controller: UsersController = UsersController(storage)
+    await users_controller.prepare()
+
+    started: float = perf_counter()
+
+    for username in lookups:
+        assert await users_controller.get_user_by_username(username) is not None
+
+    cold: float = (perf_counter() - started) / len(lookups)
+    warm: float = await measure_async(lambda: users_controller.get_user_by_username(lookups[0]), number=10000)
+
+    print(f"{amount:>9} users  cold {cold * 1e6:8.2f}us  warm {warm * 1e6:8.2f}us")
+
+    await storage.close()
+
+
+async def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description="Login lookup latency by number of registered users")
+    parser.add_argument("--storage", default="memory", choices=("memory", "sqlite", "redis", "fakeredis"))
+    parser.add_argument("--sqlite-path", default=":memory:")
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--lookups", type=int, default=1000)
+    arguments: Namespace = parser.parse_args()
+
+    for amount in arguments.counts:
+        await bench_count(arguments, amount)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+from argparse import ArgumentParser, Namespace
+from typing import Any, Dict, List, Type
+from uuid import uuid4
+
+from app.api.v1.codecs.codecs import codec, binary_codec
+from app.api.v1.enums.packet_class import PacketClass
+from app.api.v1.exceptions.http.invalid_packet import InvalidPacketError
+from app.api.v1.packets.base import BasePacket
+from app.api.v1.packets.base_client import ClientPacket
+import app.api.v1.packets.client.auth
+import app.api.v1.packets.client.game_sync
+import app.api.v1.packets.client.ping
+import app.api.v1.packets.client.player_buy_field
+import app.api.v1.packets.client.player_join_game
+import app.api.v1.packets.client.player_move
+import app.api.v1.packets.client.player_pay_rent
+import app.api.v1.packets.client.player_pay_tax
+import app.api.v1.packets.client.player_ready
+from bench.timer import measure
+
+
+class LegacyDecoder:
+    """Inbound decoding as ClientPacket did it before the registry: a subclass walk per frame and a second parse."""
+
+    def withdraw_packet(
+            self,
+            packet: str | bytes
+    ) -> ClientPacket:
+        packet_type: Type[ClientPacket] = self.__withdraw_packet_type(ClientPacket._decode(packet))
+        data: Dict[str, Any] = ClientPacket._get_validated_packet(ClientPacket._decode(packet))["data"]
+
+        return packet_type.from_json(data)
+
+    def __withdraw_packet_type(
+            self,
+            packet: Dict[str, Any]
+    ) -> Type[ClientPacket]:
+        packet: Dict[str, Any] = ClientPacket._get_validated_packet(packet)
+
+        packets: Dict[str, Type[ClientPacket]] = {
+            p.PACKET_TAG: p for p in self.__get_packets(ClientPacket)
+            if "PACKET_TAG" in p.__dict__ and p.PACKET_CLASS.value == packet["meta"]["class"]
+        }
+
+        if packet["meta"]["tag"] not in packets:
+            raise InvalidPacketError("Provided packet meta is invalid")
+
+        return packets[packet["meta"]["tag"]]
+
+    def __get_packets(
+            self,
+            cls: Type[ClientPacket]
+    ) -> List[Type[ClientPacket]]:
+        overall: List[Type[ClientPacket]] = []
+
+        for subclass in cls.__subclasses__():
+            overall.append(subclass)
+            overall.extend(self.__get_packets(subclass))
+
+        return overall
+
+
+def get_samples() -> Dict[str, Dict[str, Any]]:
+    game_id: str = str(uuid4())
+
+    return {
+        "auth": {"ticket": "x" * 64, "encodings": ["msgpack"], "game_id": game_id, "sequence": 42},
+        "game_sync": {"game_id": game_id, "version": 12},
+        "ping": {},
+        "player_buy_field": {"game_id": game_id, "field": 7},
+        "player_join_game": {"game_id": game_id},
+        "player_move": {"game_id": game_id},
+        "player_pay_rent": {"game_id": game_id, "field": 7},
+        "player_pay_tax": {"game_id": game_id, "field": 4},
+        "player_ready": {"game_id": game_id, "is_ready": True}
+    }
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description="Inbound client packets decoded per second on one core")
+    parser.add_argument("--number", type=int, default=20000)
+    arguments: Namespace = parser.parse_args()
+
+    legacy: LegacyDecoder = LegacyDecoder()
+    print(f"codec {codec.NAME}, packets/s per core")
+
+    for tag, data in get_samples().items():
+        packet_type: Type[BasePacket] = BasePacket.PACKETS[(PacketClass.CLIENT.value, tag)]
+
+        text: str = codec.encode_text({"data": data, "meta": {"tag": tag, "class": PacketClass.CLIENT.value}})
+        binary: bytes = binary_codec.encode([tag, data])
+
+        for decode in (legacy.withdraw_packet, ClientPacket.withdraw_packet):
+            assert type(decode(text)) is packet_type
+        assert type(ClientPacket.withdraw_binary_packet(binary)) is packet_type
+
+        before: float = measure(lambda: legacy.withdraw_packet(text), number=arguments.number)
+        after: float = measure(lambda: ClientPacket.withdraw_packet(text), number=arguments.number)
+        binary_after: float = measure(lambda: ClientPacket.withdraw_binary_packet(binary), number=arguments.number)
+
+        print(
+            f"{tag:<18} legacy {1 / before:>9.0f}  registry {1 / after:>9.0f}  ({before / after:4.1f}x)  "
+            f"msgpack {1 / binary_after:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
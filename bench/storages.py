@@ -0,0 +1,16 @@
+from app.api.v1.storages.storage import Storage
+from app.api.v1.storages.storages import get_storage
+from config import Config
+
+
+def get_bench_storage(
+        name: str,
+        *,
+        sqlite_path: str = ":memory:"
+) -> Storage:
+    if name == "fakeredis":
+        from fakeredis import FakeAsyncRedis
+        from app.api.v1.storages.redis_storage import RedisStorage
+        return RedisStorage(FakeAsyncRedis())
+
+    return get_storage(Config(storage=name, sqlite_path=sqlite_path))
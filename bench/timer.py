@@ -0,0 +1,32 @@
+from time import perf_counter
+from timeit import repeat
+from typing import Any, Awaitable, Callable
+
+
+def measure(
+        func: Callable[[], Any],
+        *,
+        number: int,
+        rounds: int = 5
+) -> float:
+    return min(repeat(func, number=number, repeat=rounds)) / number
+
+
+async def measure_async(
+        func: Callable[[], Awaitable[Any]],
+        *,
+        number: int,
+        rounds: int = 5
+) -> float:
+    best: float | None = None
+
+    for _ in range(rounds):
+        started: float = perf_counter()
+
+        for _ in range(number):
+            await func()
+
+        elapsed: float = (perf_counter() - started) / number
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
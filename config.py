@@ -1,3 +1,5 @@
+from typing import Dict, List, Tuple
+
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings
 
@@ -7,5 +9,32 @@ class Config(BaseSettings):
     jwt_key: SecretStr
     database_dsn: SecretStr
     redis_dsn: SecretStr
+    redis_shard_dsns: List[SecretStr] = []
 
     jwt_algorithm: str = "HS256"
+
+    storage: str = "redis"
+    sqlite_path: str = "monopoly.db"
+
+    hydration_chunk_size: int = 500
+
+    codec: str = "auto"
+    snapshot_format: str = "binary"
+    snapshot_compression_threshold: int = 512
+
+    durability: str = "action"
+    write_behind_delay: float = 0.005
+    write_behind_interval: float = 1.0
+
+    game_cache_size: int = 1024
+
+    send_queue_size: int = 256
+    heartbeat_interval: float = 15.0
+    heartbeat_timeout: float = 45.0
+    resume_timeout: float = 60.0
+
+    packet_rate: float = 20.0
+    packet_burst: int = 40
+    packet_limits: Dict[str, Tuple[float, int]] = {"ping": (1.0, 5), "player_ready": (2.0, 5)}
+    max_frame_size: int = 8192
+    inbound_queue_size: int = 64